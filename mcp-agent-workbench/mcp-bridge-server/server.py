@@ -511,7 +511,7 @@ async def check_env(server: str | None = None) -> str:
         server_rows.append((lamp(True), "git", "ok (keine Keys nötig; optional: GIT_PROJECTS_PATH)"))
         server_rows.append((lamp(True), "project-manager", "ok (keine Keys nötig; optional: PROJECTS_BASE_PATH)"))
         server_rows.append((lamp(True), "web-search", "ok (DuckDuckGo; keine Keys nötig)"))
-        server_rows.append((lamp(True), "web-scraping", "ok (httpx/bs4; keine Keys nötig)"))
+        server_rows.append((lamp(True), "web-scraping", "ok (httpx/selectolax; keine Keys nötig)"))
         server_rows.append((lamp(True), "database", "ok (keine Keys nötig; Connection-Params werden beim Tool-Aufruf übergeben)"))
 
         # LLM/Keys
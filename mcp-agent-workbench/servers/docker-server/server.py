@@ -6,25 +6,93 @@ Verwaltet Container, Images, Volumes und Networks.
 """
 
 from fastmcp import FastMCP
-import docker
-from docker.errors import DockerException, NotFound, APIError
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 import json
+import threading
+
+if TYPE_CHECKING:
+    import docker
 
 mcp = FastMCP("docker-server")
 
 # Docker Client
-_docker_client: Optional[docker.DockerClient] = None
+_docker_client: Optional["docker.DockerClient"] = None
+
+# docker (zieht requests, urllib3, websocket nach) wird erst in get_docker()
+# importiert. Bis dahin matchen die leeren Tupel in den except-Klauseln nichts.
+DockerException = NotFound = APIError = ()
+
+# Fehlermeldungen als vorgebundene Templates
+_DOCKER_ERROR = "Docker-Fehler: {0}".format
+_CONTAINER_NOT_FOUND = "Container '{0}' nicht gefunden".format
+_IMAGE_NOT_FOUND = "Image '{0}' nicht gefunden".format
 
+# Cache für die list_*-Tools: {Objekt-Typ: {Variante: Zeilen}}.
+# Wird nur genutzt, solange der Event-Stream des Watchers offen ist, und von ihm invalidiert.
+_EVENT_TYPES = ("container", "image", "volume", "network")
+_cache: dict[str, dict] = {}
+_cache_generation: dict[str, int] = dict.fromkeys(_EVENT_TYPES, 0)
+_cache_lock = threading.Lock()
+_events_active = False
 
-def get_docker() -> docker.DockerClient:
+
+def _watch_events(client: "docker.DockerClient") -> None:
+    """
+    Invalidiert Cache-Einträge anhand des Docker-Event-Streams.
+    
+    Der Cache wird erst eingeschaltet, wenn das Abo steht: Zeilen, die vorher
+    geholt würden, könnten Events verpassen und blieben sonst veraltet.
+    """
+    global _events_active
+    try:
+        stream = client.events(decode=True, filters={"type": list(_EVENT_TYPES)})
+        with _cache_lock:
+            _events_active = True
+        for event in stream:
+            kind = event.get("Type")
+            with _cache_lock:
+                _cache.pop(kind, None)
+                if kind in _cache_generation:
+                    _cache_generation[kind] += 1
+    except Exception:
+        pass
+    finally:
+        # Ohne Event-Stream keine Invalidierung mehr möglich -> Cache abschalten
+        with _cache_lock:
+            _events_active = False
+            _cache.clear()
+
+
+def _cached(kind: str, key, fetch: Callable[[], list[dict]]) -> list[dict]:
+    """Liefert gecachte Zeilen oder holt sie über fetch() neu."""
+    with _cache_lock:
+        if not _events_active:
+            return fetch()
+        rows = _cache.get(kind, {}).get(key)
+        if rows is not None:
+            return rows
+        generation = _cache_generation[kind]
+    rows = fetch()
+    with _cache_lock:
+        # Nur speichern, wenn zwischenzeitlich kein Event eingetroffen ist
+        if _events_active and _cache_generation[kind] == generation:
+            _cache.setdefault(kind, {})[key] = rows
+    return rows
+
+
+def get_docker() -> "docker.DockerClient":
     """Holt oder erstellt den Docker Client."""
-    global _docker_client
+    global _docker_client, DockerException, NotFound, APIError
     if _docker_client is None:
+        import docker
+        from docker.errors import DockerException, NotFound, APIError
         try:
             _docker_client = docker.from_env()
         except DockerException as e:
             raise RuntimeError(f"Docker nicht verfügbar: {e}")
+        threading.Thread(
+            target=_watch_events, args=(_docker_client,), name="docker-events", daemon=True
+        ).start()
     return _docker_client
 
 
@@ -45,21 +113,20 @@ def list_containers(all: bool = False) -> list[dict]:
     """
     try:
         client = get_docker()
-        containers = []
-        
-        for container in client.containers.list(all=all):
-            containers.append({
-                "id": container.short_id,
-                "name": container.name,
-                "image": container.image.tags[0] if container.image.tags else container.image.short_id,
-                "status": container.status,
-                "created": container.attrs["Created"],
-                "ports": container.ports,
-            })
-        
-        return containers
+        # Rohe API-Antwort statt containers.list(): spart ein Inspect pro Container
+        return _cached("container", all, lambda: [
+            {
+                "id": c["Id"][:12],
+                "name": c["Names"][0][1:] if c["Names"] else "",
+                "image": c["Image"],
+                "status": c["State"],
+                "created": c["Created"],
+                "ports": c["Ports"],
+            }
+            for c in client.api.containers(all=all)
+        ])
     except DockerException as e:
-        return [{"error": f"Docker-Fehler: {str(e)}"}]
+        return [{"error": _DOCKER_ERROR(e)}]
 
 
 @mcp.tool
@@ -99,9 +166,9 @@ def get_container(container_id: str) -> dict:
             "networks": list(container.attrs["NetworkSettings"]["Networks"].keys()),
         }
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -121,9 +188,9 @@ def start_container(container_id: str) -> dict:
         container.start()
         return {"success": True, "message": f"Container '{container_id}' gestartet"}
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -144,9 +211,9 @@ def stop_container(container_id: str, timeout: int = 10) -> dict:
         container.stop(timeout=timeout)
         return {"success": True, "message": f"Container '{container_id}' gestoppt"}
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -167,9 +234,9 @@ def restart_container(container_id: str, timeout: int = 10) -> dict:
         container.restart(timeout=timeout)
         return {"success": True, "message": f"Container '{container_id}' neu gestartet"}
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -200,9 +267,9 @@ def get_container_logs(
             "lines": len(logs.splitlines()),
         }
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -249,7 +316,7 @@ def run_container(
             "status": container.status,
         }
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -270,9 +337,9 @@ def remove_container(container_id: str, force: bool = False) -> dict:
         container.remove(force=force)
         return {"success": True, "message": f"Container '{container_id}' entfernt"}
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -297,9 +364,9 @@ def exec_in_container(container_id: str, command: str) -> dict:
             "output": result.output.decode("utf-8") if result.output else "",
         }
     except NotFound:
-        return {"error": f"Container '{container_id}' nicht gefunden"}
+        return {"error": _CONTAINER_NOT_FOUND(container_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 # ============================================================================
@@ -316,19 +383,18 @@ def list_images() -> list[dict]:
     """
     try:
         client = get_docker()
-        images = []
-        
-        for image in client.images.list():
-            images.append({
-                "id": image.short_id,
-                "tags": image.tags,
-                "size": f"{image.attrs['Size'] / (1024*1024):.1f} MB",
-                "created": image.attrs["Created"],
-            })
-        
-        return images
+        # Rohe API-Antwort statt images.list(): spart ein Inspect pro Image
+        return _cached("image", None, lambda: [
+            {
+                "id": i["Id"][:17] if i["Id"].startswith("sha256:") else i["Id"][:10],
+                "tags": [t for t in i.get("RepoTags") or () if t != "<none>:<none>"],
+                "size": f"{i['Size'] / (1024*1024):.1f} MB",
+                "created": i["Created"],
+            }
+            for i in client.api.images()
+        ])
     except DockerException as e:
-        return [{"error": f"Docker-Fehler: {str(e)}"}]
+        return [{"error": _DOCKER_ERROR(e)}]
 
 
 @mcp.tool
@@ -353,7 +419,7 @@ def pull_image(image_name: str, tag: str = "latest") -> dict:
             "id": image.short_id,
         }
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -373,9 +439,9 @@ def remove_image(image_id: str, force: bool = False) -> dict:
         client.images.remove(image_id, force=force)
         return {"success": True, "message": f"Image '{image_id}' entfernt"}
     except NotFound:
-        return {"error": f"Image '{image_id}' nicht gefunden"}
+        return {"error": _IMAGE_NOT_FOUND(image_id)}
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 # ============================================================================
@@ -392,19 +458,21 @@ def list_volumes() -> list[dict]:
     """
     try:
         client = get_docker()
-        volumes = []
         
-        for volume in client.volumes.list():
-            volumes.append({
-                "name": volume.name,
-                "driver": volume.attrs["Driver"],
-                "mountpoint": volume.attrs["Mountpoint"],
-                "created": volume.attrs["CreatedAt"],
-            })
+        def fetch() -> list[dict]:
+            volumes = []
+            for volume in client.volumes.list():
+                volumes.append({
+                    "name": volume.name,
+                    "driver": volume.attrs["Driver"],
+                    "mountpoint": volume.attrs["Mountpoint"],
+                    "created": volume.attrs["CreatedAt"],
+                })
+            return volumes
         
-        return volumes
+        return _cached("volume", None, fetch)
     except DockerException as e:
-        return [{"error": f"Docker-Fehler: {str(e)}"}]
+        return [{"error": _DOCKER_ERROR(e)}]
 
 
 @mcp.tool
@@ -429,7 +497,7 @@ def create_volume(name: str, driver: str = "local") -> dict:
             "driver": volume.attrs["Driver"],
         }
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 # ============================================================================
@@ -446,19 +514,21 @@ def list_networks() -> list[dict]:
     """
     try:
         client = get_docker()
-        networks = []
         
-        for network in client.networks.list():
-            networks.append({
-                "id": network.short_id,
-                "name": network.name,
-                "driver": network.attrs["Driver"],
-                "scope": network.attrs["Scope"],
-            })
+        def fetch() -> list[dict]:
+            networks = []
+            for network in client.networks.list():
+                networks.append({
+                    "id": network.short_id,
+                    "name": network.name,
+                    "driver": network.attrs["Driver"],
+                    "scope": network.attrs["Scope"],
+                })
+            return networks
         
-        return networks
+        return _cached("network", None, fetch)
     except DockerException as e:
-        return [{"error": f"Docker-Fehler: {str(e)}"}]
+        return [{"error": _DOCKER_ERROR(e)}]
 
 
 # ============================================================================
@@ -490,7 +560,7 @@ def docker_info() -> dict:
             "memory": f"{info['MemTotal'] / (1024**3):.1f} GB",
         }
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 @mcp.tool
@@ -504,23 +574,26 @@ def docker_disk_usage() -> dict:
     try:
         client = get_docker()
         df = client.df()
+        images = df.get("Images") or ()
+        containers = df.get("Containers") or ()
+        volumes = df.get("Volumes") or ()
         
         return {
             "images": {
-                "count": len(df.get("Images", [])),
-                "size": sum(i.get("Size", 0) for i in df.get("Images", [])) / (1024**3),
+                "count": len(images),
+                "size": sum([i.get("Size", 0) for i in images]) / (1024**3),
             },
             "containers": {
-                "count": len(df.get("Containers", [])),
-                "size": sum(c.get("SizeRw", 0) for c in df.get("Containers", [])) / (1024**3),
+                "count": len(containers),
+                "size": sum([c.get("SizeRw", 0) for c in containers]) / (1024**3),
             },
             "volumes": {
-                "count": len(df.get("Volumes", [])),
-                "size": sum(v.get("UsageData", {}).get("Size", 0) for v in df.get("Volumes", [])) / (1024**3),
+                "count": len(volumes),
+                "size": sum([(v.get("UsageData") or {}).get("Size", 0) for v in volumes]) / (1024**3),
             },
         }
     except DockerException as e:
-        return {"error": f"Docker-Fehler: {str(e)}"}
+        return {"error": _DOCKER_ERROR(e)}
 
 
 # ============================================================================
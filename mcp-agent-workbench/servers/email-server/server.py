@@ -6,21 +6,24 @@ Unterstützt SMTP (Senden) und IMAP (Lesen).
 """
 
 from fastmcp import FastMCP
-import smtplib
-import imaplib
-import email
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
-from email.header import decode_header
-from typing import Optional
+from typing import Iterator, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+import asyncio
 import os
 import json
+import re
+import sqlite3
+import threading
+import time
 from datetime import datetime
 
 mcp = FastMCP("email-server")
 
+# smtplib, imaplib und das email-Paket werden erst in den Tools importiert,
+# die sie brauchen - das hält den Serverstart schlank.
+
 
 def get_smtp_config() -> dict:
     """Holt SMTP-Konfiguration aus Umgebungsvariablen."""
@@ -44,10 +47,263 @@ def get_imap_config() -> dict:
     }
 
 
+# IMAP-Verbindungspool: {(host, port, user): [(Verbindung, zuletzt benutzt)]}
+_IMAP_POOL: dict[tuple[str, int, str], list[tuple[object, float]]] = {}
+_IMAP_POOL_LOCK = threading.Lock()
+_IMAP_POOL_SIZE = 2
+_IMAP_IDLE_TIMEOUT = 300  # Sekunden
+
+
+def _imap_connect(config: dict):
+    """Baut eine neue, eingeloggte IMAP-Verbindung auf."""
+    import imaplib
+    
+    if config["use_ssl"]:
+        imap = imaplib.IMAP4_SSL(config["host"], config["port"])
+    else:
+        imap = imaplib.IMAP4(config["host"], config["port"])
+    imap.login(config["user"], config["password"])
+    return imap
+
+
+def _imap_close(imap) -> None:
+    """Meldet eine IMAP-Verbindung ab und ignoriert Fehler dabei."""
+    try:
+        imap.logout()
+    except Exception:
+        pass
+
+
+@contextmanager
+def _acquire(config: dict) -> Iterator:
+    """
+    Liefert eine IMAP-Verbindung aus dem Pool oder baut eine neue auf.
+    
+    Gepoolte Verbindungen werden per NOOP geprüft; tote oder zu lange
+    ungenutzte Verbindungen werden verworfen. Tritt während der Nutzung
+    ein Fehler auf, kommt die Verbindung nicht zurück in den Pool.
+    """
+    key = (config["host"], config["port"], config["user"])
+    now = time.monotonic()
+    stale = []
+    imap = None
+    
+    with _IMAP_POOL_LOCK:
+        idle = _IMAP_POOL.get(key, [])
+        while idle:
+            conn, last_used = idle.pop()
+            if now - last_used > _IMAP_IDLE_TIMEOUT:
+                stale.append(conn)
+                continue
+            imap = conn
+            break
+    
+    for conn in stale:
+        _imap_close(conn)
+    
+    if imap is not None:
+        try:
+            imap.noop()
+        except Exception:
+            _imap_close(imap)
+            imap = None
+    
+    if imap is None:
+        imap = _imap_connect(config)
+    
+    try:
+        yield imap
+    except BaseException:
+        _imap_close(imap)
+        raise
+    
+    with _IMAP_POOL_LOCK:
+        idle = _IMAP_POOL.setdefault(key, [])
+        if len(idle) < _IMAP_POOL_SIZE:
+            idle.append((imap, time.monotonic()))
+            imap = None
+    
+    if imap is not None:
+        _imap_close(imap)
+
+
+# Bytes des Nachrichtentexts, die get_emails für die Vorschau lädt
+_PREVIEW_BYTES = 64 * 1024
+# Blockgröße, in der Nachrichten an den Parser gefüttert werden
+_PARSE_CHUNK = 64 * 1024
+
+# Erkennt in FETCH-Antworten Sequenznummer, UID und Namen des Datenelements,
+# z.B. b'12 (UID 4711 BODY[HEADER.FIELDS (FROM SUBJECT)] {342}' oder b' BODY[1] {80}'
+_FETCH_SEQ_RE = re.compile(rb"^(\d+) \(")
+_FETCH_UID_RE = re.compile(rb"\bUID (\d+)")
+_FETCH_ITEM_RE = re.compile(rb"(RFC822(?:\.HEADER|\.TEXT)?|BODY\[[^\]]*\])(?:<\d+>)? \{\d+\}$")
+
+
+def _parse_fetch(msg_data: list, result: dict) -> None:
+    """Sortiert eine UID-FETCH-Antwort nach {UID: {Element: Daten}}."""
+    by_seq: dict[bytes, dict[bytes, bytes]] = {}
+    uids: dict[bytes, bytes] = {}
+    seq = None
+    for entry in msg_data:
+        meta = entry[0] if isinstance(entry, tuple) else entry
+        if not isinstance(meta, bytes):
+            continue
+        m = _FETCH_SEQ_RE.match(meta)
+        if m:
+            seq = m.group(1)
+        if seq is None:
+            continue
+        # Die UID kann vor oder nach den Literalen stehen
+        m = _FETCH_UID_RE.search(meta)
+        if m:
+            uids[seq] = m.group(1)
+        if isinstance(entry, tuple):
+            m = _FETCH_ITEM_RE.search(meta)
+            if m:
+                by_seq.setdefault(seq, {})[m.group(1)] = entry[1]
+    
+    for seq, items in by_seq.items():
+        if seq in uids:
+            result.setdefault(uids[seq], {}).update(items)
+
+
+def _fetch_many(imap, ids: list[bytes], spec: str) -> dict[bytes, dict[bytes, bytes]]:
+    """
+    Holt mehrere Nachrichten (per UID) mit einem einzigen UID FETCH.
+    
+    Lehnt der Server das UID-Set ab, wird pro UID einzeln gefetcht.
+    """
+    result: dict[bytes, dict[bytes, bytes]] = {}
+    if not ids:
+        return result
+    
+    status, msg_data = imap.uid("FETCH", b",".join(ids), spec)
+    if status == "OK":
+        _parse_fetch(msg_data, result)
+        return result
+    
+    for msg_id in ids:
+        status, msg_data = imap.uid("FETCH", msg_id, spec)
+        if status == "OK":
+            _parse_fetch(msg_data, result)
+    return result
+
+
+def _search_uids(imap, query: str) -> tuple[str, list]:
+    """
+    Sucht serverseitig nach query in Headern und Text (UID SEARCH).
+    
+    Der Suchbegriff geht als UTF-8-Literal an den Server, damit Anführungs-
+    zeichen und Umlaute korrekt ankommen. Gmail bekommt X-GM-RAW und damit
+    den eigenen Suchindex. Kennt der Server CHARSET UTF-8 nicht, wird bei
+    ASCII-Begriffen ohne CHARSET erneut gesucht.
+    """
+    criterion = "X-GM-RAW" if "X-GM-EXT-1" in imap.capabilities else "TEXT"
+    imap.literal = query.encode("utf-8")
+    try:
+        status, data = imap.uid("SEARCH", "CHARSET", "UTF-8", criterion)
+    except imap.abort:
+        raise
+    except imap.error as e:
+        status, data = "BAD", [str(e).encode()]
+    if status != "OK" and query.isascii():
+        quoted = '"' + query.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        status, data = imap.uid("SEARCH", criterion, quoted)
+    return status, data
+
+
+def _uidvalidity(imap) -> Optional[int]:
+    """Liest die UIDVALIDITY aus der Antwort des letzten SELECT."""
+    _, data = imap.response("UIDVALIDITY")
+    try:
+        return int(data[-1])
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _parse_message(*chunks: bytes):
+    """
+    Parst eine Nachricht aus einem oder mehreren Byte-Blöcken.
+    
+    Der Parser wird in 64-KiB-Stücken gefüttert, statt die ganze Nachricht
+    auf einmal zu dekodieren - das hält den Speicherbedarf bei großen Mails
+    nahe an der Rohgröße.
+    """
+    from email.parser import BytesFeedParser
+    
+    parser = BytesFeedParser()
+    for data in chunks:
+        for offset in range(0, len(data), _PARSE_CHUNK):
+            parser.feed(data[offset:offset + _PARSE_CHUNK])
+    return parser.close()
+
+
+def _iter_plain_parts(msg) -> Iterator:
+    """
+    Liefert die text/plain-Teile einer Nachricht in Dokumentreihenfolge.
+    
+    Anders als msg.walk() steigt die Suche nur in multipart-Container ab und
+    überspringt Anhänge und eingebettete Nachrichten komplett.
+    """
+    stack = [msg]
+    while stack:
+        part = stack.pop()
+        if part.get_content_maintype() == "multipart":
+            children = part.get_payload()
+            if isinstance(children, list):
+                stack.extend(reversed(children))
+        elif part.get_content_type() == "text/plain":
+            yield part
+
+
+def _decode_capped(payload: bytes, max_chars: int) -> str:
+    """
+    Dekodiert UTF-8 und liefert höchstens max_chars Zeichen.
+    
+    Es werden nur so viele Bytes dekodiert, wie max_chars Zeichen maximal
+    belegen können; ein an der Schnittstelle angeschnittenes Zeichen hält
+    der inkrementelle Decoder zurück, statt es zu ersetzen.
+    """
+    import codecs
+    
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return decoder.decode(payload[:max_chars * 4])[:max_chars]
+
+
+def _attachment_size(part) -> int:
+    """Schätzt die dekodierte Größe eines Anhangs, ohne ihn zu dekodieren."""
+    raw = part.get_payload(decode=False) or ""
+    if not isinstance(raw, str):
+        return 0
+    encoding = str(part.get("Content-Transfer-Encoding", "")).strip().lower()
+    if encoding == "base64":
+        stripped = raw.rstrip()
+        padding = 2 if stripped.endswith("==") else 1 if stripped.endswith("=") else 0
+        chars = len(stripped) - stripped.count("\n") - stripped.count("\r") - stripped.count(" ")
+        return max(chars * 3 // 4 - padding, 0)
+    return len(raw.encode("utf-8", errors="surrogateescape"))
+
+
 def decode_email_header(header_value: str) -> str:
     """Dekodiert Email-Header."""
     if not header_value:
         return ""
+    if isinstance(header_value, str):
+        # Absender/Empfänger wiederholen sich über eine Mailbox hinweg
+        return _decode_header_cached(header_value)
+    return _decode_header(header_value)
+
+
+@lru_cache(maxsize=2048)
+def _decode_header_cached(header_value: str) -> str:
+    """Gecachte Variante von _decode_header für String-Header."""
+    return _decode_header(header_value)
+
+
+def _decode_header(header_value) -> str:
+    """Dekodiert einen (RFC 2047-kodierten) Header-Wert."""
+    from email.header import decode_header
+    
     decoded_parts = decode_header(header_value)
     result = []
     for part, charset in decoded_parts:
@@ -91,8 +347,11 @@ def send_email(
         return {"error": "SMTP nicht konfiguriert. Setze SMTP_USER und SMTP_PASSWORD"}
     
     try:
-        # Message erstellen
-        msg = MIMEMultipart("alternative")
+        import smtplib
+        from email.mime.text import MIMEText
+        
+        # Message erstellen - nur ein Body-Teil, daher ohne MIMEMultipart-Hülle
+        msg = MIMEText(body, "html" if html else "plain", "utf-8")
         msg["From"] = config["user"]
         msg["To"] = to
         msg["Subject"] = subject
@@ -100,12 +359,6 @@ def send_email(
         if cc:
             msg["Cc"] = cc
         
-        # Body hinzufügen
-        if html:
-            msg.attach(MIMEText(body, "html", "utf-8"))
-        else:
-            msg.attach(MIMEText(body, "plain", "utf-8"))
-        
         # Alle Empfänger sammeln
         recipients = [addr.strip() for addr in to.split(",")]
         if cc:
@@ -167,6 +420,8 @@ def test_smtp_connection() -> dict:
         return {"success": False, "error": "SMTP nicht konfiguriert"}
     
     try:
+        import smtplib
+        
         with smtplib.SMTP(config["host"], config["port"]) as server:
             if config["use_tls"]:
                 server.starttls()
@@ -181,132 +436,315 @@ def test_smtp_connection() -> dict:
 
 
 # ============================================================================
-# IMAP (LESEN)
+# ON-DISK-CACHE (Mailbox-Liste und Header pro UIDVALIDITY)
 # ============================================================================
 
-@mcp.tool
-def list_mailboxes() -> dict:
+# Leerer Pfad (EMAIL_CACHE_PATH="") schaltet den Cache ab
+_CACHE_PATH = os.environ.get(
+    "EMAIL_CACHE_PATH", str(Path.home() / ".cache" / "guido_mcp" / "imap.sqlite")
+)
+# Mail-Inhalte (Body-Vorschau) nur auf ausdrücklichen Wunsch auf Platte ablegen
+_CACHE_BODIES = os.environ.get("EMAIL_CACHE_BODIES", "false").lower() == "true"
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_lock = threading.Lock()
+
+
+def _cache() -> Optional[sqlite3.Connection]:
+    """Öffnet (einmalig) die Cache-Datenbank."""
+    global _cache_db
+    if _cache_db is None and _CACHE_PATH:
+        Path(_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(_CACHE_PATH, check_same_thread=False)
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS mailboxes (
+                account TEXT, name TEXT, last_seen REAL,
+                PRIMARY KEY (account, name)
+            );
+            CREATE TABLE IF NOT EXISTS headers (
+                account TEXT, mailbox TEXT, uidvalidity INTEGER, uid INTEGER,
+                sender TEXT, recipient TEXT, subject TEXT, date TEXT, body TEXT,
+                PRIMARY KEY (account, mailbox, uid)
+            );
+        """)
+        if not _CACHE_BODIES:
+            # Bodies aus früheren Läufen mit EMAIL_CACHE_BODIES=true entfernen
+            with db:
+                db.execute("UPDATE headers SET body = NULL WHERE body IS NOT NULL")
+        _cache_db = db
+    return _cache_db
+
+
+def _account(config: dict) -> str:
+    """Cache-Schlüssel für ein IMAP-Konto."""
+    return f"{config['user']}@{config['host']}:{config['port']}"
+
+
+def _cached_mailboxes(account: str) -> Optional[list[str]]:
+    """Liefert die zuletzt gesehene Mailbox-Liste oder None."""
+    try:
+        with _cache_lock:
+            db = _cache()
+            if db is None:
+                return None
+            rows = db.execute(
+                "SELECT name FROM mailboxes WHERE account = ? ORDER BY rowid", (account,)
+            ).fetchall()
+    except (sqlite3.Error, OSError):
+        return None
+    return [name for (name,) in rows] or None
+
+
+def _store_mailboxes(account: str, names: list[str]) -> None:
+    """Ersetzt die gecachte Mailbox-Liste eines Kontos."""
+    try:
+        with _cache_lock:
+            db = _cache()
+            if db is None:
+                return
+            now = time.time()
+            with db:
+                db.execute("DELETE FROM mailboxes WHERE account = ?", (account,))
+                db.executemany(
+                    "INSERT OR IGNORE INTO mailboxes VALUES (?, ?, ?)",
+                    [(account, name, now) for name in names],
+                )
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _cached_headers(
+    account: str, mailbox: str, uidvalidity: Optional[int], uids: list[bytes], need_body: bool
+) -> dict[bytes, dict]:
     """
-    Listet alle verfügbaren Mailboxen/Ordner.
+    Liefert gecachte Header-Zeilen {UID: Zeile} für die angegebenen UIDs.
     
-    Returns:
-        Liste der Mailboxen
+    Passt die UIDVALIDITY des Servers nicht zum Cache, wird der Cache der
+    Mailbox verworfen.
+    """
+    if uidvalidity is None or not uids:
+        return {}
+    result = {}
+    try:
+        with _cache_lock:
+            db = _cache()
+            if db is None:
+                return {}
+            with db:
+                db.execute(
+                    "DELETE FROM headers WHERE account = ? AND mailbox = ? AND uidvalidity != ?",
+                    (account, mailbox, uidvalidity),
+                )
+            for start in range(0, len(uids), 500):
+                chunk = [int(uid) for uid in uids[start:start + 500]]
+                rows = db.execute(
+                    "SELECT uid, sender, recipient, subject, date, body FROM headers "
+                    f"WHERE account = ? AND mailbox = ? AND uid IN ({','.join('?' * len(chunk))})",
+                    (account, mailbox, *chunk),
+                ).fetchall()
+                for uid, sender, recipient, subject, date, body in rows:
+                    if need_body and body is None:
+                        continue
+                    result[str(uid).encode()] = {
+                        "from": sender, "to": recipient, "subject": subject,
+                        "date": date, "body": body,
+                    }
+    except (sqlite3.Error, OSError):
+        return {}
+    return result
+
+
+def _store_headers(
+    account: str, mailbox: str, uidvalidity: Optional[int], rows: dict[bytes, dict]
+) -> None:
+    """
+    Schreibt Header-Zeilen in den Cache; ein vorhandener Body bleibt erhalten.
+    
+    Bodies werden nur mit EMAIL_CACHE_BODIES=true gespeichert.
     """
+    if uidvalidity is None or not rows:
+        return
+    try:
+        with _cache_lock:
+            db = _cache()
+            if db is None:
+                return
+            with db:
+                db.executemany(
+                    """
+                    INSERT INTO headers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (account, mailbox, uid) DO UPDATE SET
+                        uidvalidity = excluded.uidvalidity,
+                        sender = excluded.sender,
+                        recipient = excluded.recipient,
+                        subject = excluded.subject,
+                        date = excluded.date,
+                        body = COALESCE(excluded.body, headers.body)
+                    """,
+                    [
+                        (account, mailbox, uidvalidity, int(uid), row["from"], row["to"],
+                         row["subject"], row["date"], row.get("body") if _CACHE_BODIES else None)
+                        for uid, row in rows.items()
+                    ],
+                )
+    except (sqlite3.Error, OSError):
+        pass
+
+
+# ============================================================================
+# IMAP (LESEN)
+# ============================================================================
+
+# LIST-Antwort: (Flags) Trennzeichen Name, z.B. b'(\\HasNoChildren) "/" "INBOX"'
+_LIST_RE = re.compile(rb'^\([^)]*\)\s+(?:"[^"]*"|NIL)\s+(?:"((?:[^"\\]|\\.)*)"|(\S+))$')
+
+
+def _refresh_mailboxes(config: dict) -> list[str]:
+    """Holt die Mailbox-Liste vom Server und aktualisiert den Cache."""
+    with _acquire(config) as imap:
+        status, mailboxes = imap.list()
+    
+    folders = []
+    if status == "OK":
+        for mailbox in mailboxes:
+            if isinstance(mailbox, tuple):
+                # Name als Literal: (b'(\\HasNoChildren) "/" {9}', b'Name mit "')
+                folders.append(mailbox[1].decode("utf-8", "replace"))
+                continue
+            m = _LIST_RE.match(mailbox) if mailbox else None
+            if m:
+                quoted, atom = m.groups()
+                if quoted is not None:
+                    name = quoted.replace(b'\\"', b'"').replace(b"\\\\", b"\\")
+                else:
+                    name = atom
+                folders.append(name.decode("utf-8", "replace"))
+        _store_mailboxes(_account(config), folders)
+    return folders
+
+
+def _refresh_mailboxes_quietly(config: dict) -> None:
+    """Hintergrund-Variante von _refresh_mailboxes ohne Fehlerweitergabe."""
+    try:
+        _refresh_mailboxes(config)
+    except Exception:
+        pass
+
+
+def _list_mailboxes() -> dict:
+    """Synchroner Kern von list_mailboxes."""
     config = get_imap_config()
     
     if not config["user"] or not config["password"]:
         return {"error": "IMAP nicht konfiguriert. Setze IMAP_USER und IMAP_PASSWORD"}
     
     try:
-        if config["use_ssl"]:
-            imap = imaplib.IMAP4_SSL(config["host"], config["port"])
-        else:
-            imap = imaplib.IMAP4(config["host"], config["port"])
-        
-        imap.login(config["user"], config["password"])
-        
-        status, mailboxes = imap.list()
-        
-        folders = []
-        if status == "OK":
-            for mailbox in mailboxes:
-                if mailbox:
-                    # Parse Mailbox-Name
-                    decoded = mailbox.decode() if isinstance(mailbox, bytes) else mailbox
-                    # Extrahiere Namen (letzter Teil nach Leerzeichen und Quotes)
-                    parts = decoded.split('" "')
-                    if len(parts) >= 2:
-                        name = parts[-1].strip('"')
-                    else:
-                        name = decoded.split()[-1].strip('"')
-                    folders.append(name)
-        
-        imap.logout()
+        cached = _cached_mailboxes(_account(config))
+        if cached is not None:
+            threading.Thread(
+                target=_refresh_mailboxes_quietly, args=(config,), daemon=True
+            ).start()
+            return {
+                "success": True,
+                "mailboxes": cached,
+                "cached": True
+            }
         
         return {
             "success": True,
-            "mailboxes": folders
+            "mailboxes": _refresh_mailboxes(config)
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @mcp.tool
-def get_emails(
-    mailbox: str = "INBOX",
-    count: int = 10,
-    unread_only: bool = False
-) -> dict:
+async def list_mailboxes() -> dict:
     """
-    Holt Emails aus einer Mailbox.
+    Listet alle verfügbaren Mailboxen/Ordner.
     
-    Args:
-        mailbox: Mailbox-Name (default: INBOX)
-        count: Anzahl der Emails (default: 10)
-        unread_only: Nur ungelesene Emails (default: False)
+    Ist die Liste bereits gecacht, wird sie sofort zurückgegeben und im
+    Hintergrund aktualisiert.
     
     Returns:
-        Liste der Emails
+        Liste der Mailboxen
     """
+    return await asyncio.to_thread(_list_mailboxes)
+
+
+def _get_emails(
+    mailbox: str = "INBOX",
+    count: int = 10,
+    unread_only: bool = False
+) -> dict:
+    """Synchroner Kern von get_emails."""
     config = get_imap_config()
     
     if not config["user"] or not config["password"]:
         return {"error": "IMAP nicht konfiguriert"}
     
     try:
-        if config["use_ssl"]:
-            imap = imaplib.IMAP4_SSL(config["host"], config["port"])
-        else:
-            imap = imaplib.IMAP4(config["host"], config["port"])
-        
-        imap.login(config["user"], config["password"])
-        imap.select(mailbox)
-        
-        # Suche
-        search_criteria = "UNSEEN" if unread_only else "ALL"
-        status, message_ids = imap.search(None, search_criteria)
-        
-        if status != "OK":
-            imap.logout()
-            return {"error": "Suche fehlgeschlagen"}
-        
-        ids = message_ids[0].split()
-        # Neueste zuerst
-        ids = ids[-count:] if len(ids) > count else ids
-        ids = list(reversed(ids))
-        
-        emails = []
-        for msg_id in ids:
-            status, msg_data = imap.fetch(msg_id, "(RFC822)")
-            if status == "OK" and msg_data[0]:
-                raw_email = msg_data[0][1]
-                msg = email.message_from_bytes(raw_email)
+        with _acquire(config) as imap:
+            imap.select(mailbox)
+            uidvalidity = _uidvalidity(imap)
+            
+            # Suche
+            search_criteria = "UNSEEN" if unread_only else "ALL"
+            status, message_ids = imap.uid("SEARCH", search_criteria)
+            
+            if status != "OK":
+                return {"error": "Suche fehlgeschlagen"}
+            
+            ids = message_ids[0].split()
+            # Neueste zuerst
+            ids = ids[-count:] if len(ids) > count else ids
+            ids = list(reversed(ids))
+            
+            account = _account(config)
+            rows = _cached_headers(account, mailbox, uidvalidity, ids, need_body=True)
+            missing = [msg_id for msg_id in ids if msg_id not in rows]
+            
+            # Header plus Anfang des Bodys statt der kompletten Nachricht samt
+            # Anhängen; PEEK lässt außerdem das \Seen-Flag unangetastet.
+            fetched = _fetch_many(
+                imap, missing, f"(BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.{_PREVIEW_BYTES}>)"
+            )
+        
+        new_rows = {}
+        for msg_id in missing:
+            items = fetched.get(msg_id, {})
+            header = items.get(b"BODY[HEADER]")
+            if header:
+                msg = _parse_message(header, items.get(b"BODY[TEXT]") or b"")
                 
                 # Body extrahieren
                 body = ""
                 if msg.is_multipart():
-                    for part in msg.walk():
-                        content_type = part.get_content_type()
-                        if content_type == "text/plain":
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                body = payload.decode("utf-8", errors="replace")
-                                break
+                    for part in _iter_plain_parts(msg):
+                        payload = part.get_payload(decode=True)
+                        if payload:
+                            body = _decode_capped(payload, 2000)
+                            break
                 else:
                     payload = msg.get_payload(decode=True)
                     if payload:
-                        body = payload.decode("utf-8", errors="replace")
+                        body = _decode_capped(payload, 2000)
                 
-                emails.append({
-                    "id": msg_id.decode() if isinstance(msg_id, bytes) else str(msg_id),
+                new_rows[msg_id] = {
                     "from": decode_email_header(msg.get("From", "")),
                     "to": decode_email_header(msg.get("To", "")),
                     "subject": decode_email_header(msg.get("Subject", "")),
-                    "date": msg.get("Date", ""),
+                    "date": str(msg.get("Date", "")),
                     "body": body[:2000]  # Erste 2000 Zeichen
-                })
+                }
         
-        imap.logout()
+        _store_headers(account, mailbox, uidvalidity, new_rows)
+        rows.update(new_rows)
+        
+        emails = [
+            {"id": msg_id.decode(), **rows[msg_id]}
+            for msg_id in ids
+            if msg_id in rows
+        ]
         
         return {
             "mailbox": mailbox,
@@ -318,62 +756,84 @@ def get_emails(
 
 
 @mcp.tool
-def search_emails(
-    query: str,
+async def get_emails(
     mailbox: str = "INBOX",
-    max_results: int = 20
+    count: int = 10,
+    unread_only: bool = False
 ) -> dict:
     """
-    Sucht nach Emails.
+    Holt Emails aus einer Mailbox.
     
     Args:
-        query: Suchbegriff (wird in Subject gesucht)
-        mailbox: Mailbox-Name
-        max_results: Maximale Ergebnisse
+        mailbox: Mailbox-Name (default: INBOX)
+        count: Anzahl der Emails (default: 10)
+        unread_only: Nur ungelesene Emails (default: False)
     
     Returns:
-        Gefundene Emails
+        Liste der Emails
     """
+    return await asyncio.to_thread(_get_emails, mailbox, count, unread_only)
+
+
+def _search_emails(
+    query: str,
+    mailbox: str = "INBOX",
+    max_results: int = 20
+) -> dict:
+    """Synchroner Kern von search_emails."""
     config = get_imap_config()
     
     if not config["user"] or not config["password"]:
         return {"error": "IMAP nicht konfiguriert"}
     
     try:
-        if config["use_ssl"]:
-            imap = imaplib.IMAP4_SSL(config["host"], config["port"])
-        else:
-            imap = imaplib.IMAP4(config["host"], config["port"])
-        
-        imap.login(config["user"], config["password"])
-        imap.select(mailbox)
-        
-        # IMAP-Suche
-        status, message_ids = imap.search(None, f'SUBJECT "{query}"')
-        
-        if status != "OK":
-            imap.logout()
-            return {"error": "Suche fehlgeschlagen"}
-        
-        ids = message_ids[0].split()
-        ids = ids[-max_results:] if len(ids) > max_results else ids
-        ids = list(reversed(ids))
-        
-        emails = []
-        for msg_id in ids:
-            status, msg_data = imap.fetch(msg_id, "(BODY[HEADER.FIELDS (FROM TO SUBJECT DATE)])")
-            if status == "OK" and msg_data[0]:
-                header = msg_data[0][1]
-                msg = email.message_from_bytes(header)
+        with _acquire(config) as imap:
+            imap.select(mailbox)
+            uidvalidity = _uidvalidity(imap)
+            
+            # IMAP-Suche
+            status, message_ids = _search_uids(imap, query)
+            
+            if status != "OK":
+                return {"error": "Suche fehlgeschlagen"}
+            
+            ids = message_ids[0].split()
+            ids = ids[-max_results:] if len(ids) > max_results else ids
+            ids = list(reversed(ids))
+            
+            account = _account(config)
+            rows = _cached_headers(account, mailbox, uidvalidity, ids, need_body=False)
+            missing = [msg_id for msg_id in ids if msg_id not in rows]
+            
+            fetched = _fetch_many(imap, missing, "(BODY[HEADER.FIELDS (FROM TO SUBJECT DATE)])")
+        
+        new_rows = {}
+        for msg_id in missing:
+            # Nur ein Datenelement pro Nachricht angefordert
+            header = next(iter(fetched.get(msg_id, {}).values()), None)
+            if header:
+                msg = _parse_message(header)
                 
-                emails.append({
-                    "id": msg_id.decode() if isinstance(msg_id, bytes) else str(msg_id),
+                new_rows[msg_id] = {
                     "from": decode_email_header(msg.get("From", "")),
+                    "to": decode_email_header(msg.get("To", "")),
                     "subject": decode_email_header(msg.get("Subject", "")),
-                    "date": msg.get("Date", "")
-                })
-        
-        imap.logout()
+                    "date": str(msg.get("Date", ""))
+                }
+        
+        _store_headers(account, mailbox, uidvalidity, new_rows)
+        rows.update(new_rows)
+        
+        emails = [
+            {
+                "id": msg_id.decode(),
+                "from": rows[msg_id]["from"],
+                "subject": rows[msg_id]["subject"],
+                "date": rows[msg_id]["date"]
+            }
+            for msg_id in ids
+            if msg_id in rows
+        ]
         
         return {
             "query": query,
@@ -386,88 +846,106 @@ def search_emails(
 
 
 @mcp.tool
-def get_email_by_id(email_id: str, mailbox: str = "INBOX") -> dict:
+async def search_emails(
+    query: str,
+    mailbox: str = "INBOX",
+    max_results: int = 20
+) -> dict:
     """
-    Holt eine spezifische Email anhand ihrer ID.
+    Sucht nach Emails.
     
     Args:
-        email_id: Email-ID
+        query: Suchbegriff (wird serverseitig in Headern und Text gesucht)
         mailbox: Mailbox-Name
+        max_results: Maximale Ergebnisse
     
     Returns:
-        Email-Details
+        Gefundene Emails
     """
+    return await asyncio.to_thread(_search_emails, query, mailbox, max_results)
+
+
+def _get_email_by_id(email_id: str, mailbox: str = "INBOX", include_html: bool = True) -> dict:
+    """Synchroner Kern von get_email_by_id."""
     config = get_imap_config()
     
     if not config["user"] or not config["password"]:
         return {"error": "IMAP nicht konfiguriert"}
     
     try:
-        if config["use_ssl"]:
-            imap = imaplib.IMAP4_SSL(config["host"], config["port"])
-        else:
-            imap = imaplib.IMAP4(config["host"], config["port"])
-        
-        imap.login(config["user"], config["password"])
-        imap.select(mailbox)
-        
-        status, msg_data = imap.fetch(email_id.encode(), "(RFC822)")
-        
-        if status != "OK" or not msg_data[0]:
-            imap.logout()
-            return {"error": f"Email {email_id} nicht gefunden"}
-        
-        raw_email = msg_data[0][1]
-        msg = email.message_from_bytes(raw_email)
-        
-        # Body und Attachments extrahieren
-        body_text = ""
-        body_html = ""
-        attachments = []
-        
-        if msg.is_multipart():
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                content_disposition = str(part.get("Content-Disposition", ""))
-                
-                if "attachment" in content_disposition:
-                    filename = part.get_filename()
-                    if filename:
-                        attachments.append({
-                            "filename": decode_email_header(filename),
-                            "content_type": content_type,
-                            "size": len(part.get_payload(decode=True) or b"")
-                        })
-                elif content_type == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        body_text = payload.decode("utf-8", errors="replace")
-                elif content_type == "text/html":
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        body_html = payload.decode("utf-8", errors="replace")
-        else:
-            payload = msg.get_payload(decode=True)
-            if payload:
-                body_text = payload.decode("utf-8", errors="replace")
-        
-        imap.logout()
-        
-        return {
-            "id": email_id,
-            "from": decode_email_header(msg.get("From", "")),
-            "to": decode_email_header(msg.get("To", "")),
-            "cc": decode_email_header(msg.get("Cc", "")),
-            "subject": decode_email_header(msg.get("Subject", "")),
-            "date": msg.get("Date", ""),
-            "body_text": body_text[:10000],
-            "body_html": body_html[:10000] if body_html else None,
-            "attachments": attachments
-        }
+        with _acquire(config) as imap:
+            imap.select(mailbox)
+            
+            fetched = _fetch_many(imap, [email_id.encode()], "(RFC822)")
+            raw_email = fetched.get(email_id.encode(), {}).get(b"RFC822")
+            
+            if not raw_email:
+                return {"error": f"Email {email_id} nicht gefunden"}
+            
+            msg = _parse_message(raw_email)
+            
+            # Body und Attachments extrahieren
+            body_text = ""
+            body_html = ""
+            attachments = []
+            
+            if msg.is_multipart():
+                for part in msg.walk():
+                    content_type = part.get_content_type()
+                    content_disposition = str(part.get("Content-Disposition", ""))
+                    
+                    if "attachment" in content_disposition:
+                        filename = part.get_filename()
+                        if filename:
+                            attachments.append({
+                                "filename": decode_email_header(filename),
+                                "content_type": content_type,
+                                "size": _attachment_size(part)
+                            })
+                    elif content_type == "text/plain":
+                        payload = part.get_payload(decode=True)
+                        if payload:
+                            body_text = _decode_capped(payload, 10000)
+                    elif content_type == "text/html" and include_html:
+                        payload = part.get_payload(decode=True)
+                        if payload:
+                            body_html = _decode_capped(payload, 10000)
+            else:
+                payload = msg.get_payload(decode=True)
+                if payload:
+                    body_text = _decode_capped(payload, 10000)
+            
+            return {
+                "id": email_id,
+                "from": decode_email_header(msg.get("From", "")),
+                "to": decode_email_header(msg.get("To", "")),
+                "cc": decode_email_header(msg.get("Cc", "")),
+                "subject": decode_email_header(msg.get("Subject", "")),
+                "date": msg.get("Date", ""),
+                "body_text": body_text,
+                "body_html": body_html or None,
+                "attachments": attachments
+            }
     except Exception as e:
         return {"error": str(e)}
 
 
+@mcp.tool
+async def get_email_by_id(email_id: str, mailbox: str = "INBOX", include_html: bool = True) -> dict:
+    """
+    Holt eine spezifische Email anhand ihrer ID.
+    
+    Args:
+        email_id: Email-ID (UID aus get_emails/search_emails)
+        mailbox: Mailbox-Name
+        include_html: HTML-Body mitliefern (default: True)
+    
+    Returns:
+        Email-Details
+    """
+    return await asyncio.to_thread(_get_email_by_id, email_id, mailbox, include_html)
+
+
 @mcp.tool
 def check_imap_config() -> dict:
     """
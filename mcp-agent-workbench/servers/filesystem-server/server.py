@@ -7,9 +7,12 @@ Bietet sichere, kontrollierte Zugriffe auf das Dateisystem.
 
 from fastmcp import FastMCP
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+import fnmatch
 import os
 import json
+import re
+import stat
 
 mcp = FastMCP("filesystem-server")
 
@@ -17,37 +20,134 @@ mcp = FastMCP("filesystem-server")
 ALLOWED_ROOTS: list[str] = []  # Leer = alle erlaubt (für Entwicklung)
 
 
+# Aufgelöste Roots, neu berechnet sobald sich ALLOWED_ROOTS ändert
+_resolved_roots: tuple[Path, ...] = ()
+_resolved_from: tuple[str, ...] = ()
+
+
+def resolved_roots() -> tuple[Path, ...]:
+    """Gibt die aufgelösten ALLOWED_ROOTS zurück (gecacht)."""
+    global _resolved_roots, _resolved_from
+    current = tuple(ALLOWED_ROOTS)
+    if current != _resolved_from:
+        _resolved_roots = tuple(Path(root).resolve() for root in current)
+        _resolved_from = current
+    return _resolved_roots
+
+
 def is_path_allowed(path: str) -> bool:
     """Prüft ob ein Pfad in den erlaubten Roots liegt."""
-    if not ALLOWED_ROOTS:
+    roots = resolved_roots()
+    if not roots:
         return True  # Entwicklungsmodus: alles erlaubt
     
     resolved = Path(path).resolve()
-    return any(
-        resolved.is_relative_to(Path(root).resolve()) 
-        for root in ALLOWED_ROOTS
-    )
+    if len(roots) == 1:
+        return resolved.is_relative_to(roots[0])
+    for root in roots:
+        if resolved.is_relative_to(root):
+            return True
+    return False
 
 
-def ensure_allowed(path: str) -> Path:
+def _ensure_restricted(path: str) -> Path:
     """Validiert und gibt den Pfad zurück oder wirft einen Fehler."""
     if not is_path_allowed(path):
         raise PermissionError(f"Zugriff auf '{path}' nicht erlaubt")
     return Path(path)
 
 
+def _ensure_unrestricted(path: str, _P=Path, _roots=ALLOWED_ROOTS) -> Path:
+    """Validiert und gibt den Pfad zurück (Entwicklungsmodus ohne Roots)."""
+    # Wurde ALLOWED_ROOTS nachträglich in-place befüllt, doch prüfen
+    if _roots:
+        return _ensure_restricted(path)
+    return _P(path)
+
+
+# Wird je nach ALLOWED_ROOTS auf die passende Variante gebunden
+ensure_allowed = _ensure_restricted if ALLOWED_ROOTS else _ensure_unrestricted
+
+
+def reconfigure_allowed_roots(roots: list[str]) -> None:
+    """Setzt die erlaubten Roots und bindet ensure_allowed neu."""
+    global ensure_allowed
+    ALLOWED_ROOTS[:] = roots
+    ensure_allowed = _ensure_restricted if ALLOWED_ROOTS else _ensure_unrestricted
+
+
+def count_entries(path) -> int:
+    """Zählt die Einträge eines Verzeichnisses ohne Path-Objekte anzulegen."""
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for _ in it)
+    except OSError:
+        return 0
+
+
+def scan_matching(dir_path: Path, pattern: str) -> Iterator[os.DirEntry]:
+    """Liefert die Einträge eines Verzeichnisses, deren Name auf pattern passt."""
+    normcase = os.path.normcase
+    match = re.compile(fnmatch.translate(normcase(pattern))).match
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if match(normcase(entry.name)):
+                yield entry
+
+
+# Blockgröße für read_file
+READ_CHUNK = 64 * 1024
+
+# Ab dieser Größe kopiert copy_contents per copy_file_range im Kernel
+COPY_CHUNK = 1024 * 1024
+
+
+def copy_contents(src: Path, dst: Path) -> None:
+    """
+    Kopiert den Inhalt einer Datei, möglichst ohne Umweg über den Userspace.
+    
+    Große Dateien gehen per os.copy_file_range (Reflink/serverseitige Kopie,
+    wo das Dateisystem es kann); scheitert das (z.B. EXDEV), wird gepuffert
+    mit 1-MiB-Blöcken kopiert. Alles andere übernimmt shutil.copyfile, das
+    unter Linux/macOS bereits sendfile bzw. fcopyfile nutzt.
+
+    Raises:
+        shutil.SameFileError: Wenn src und dst dieselbe Datei sind
+    """
+    import shutil
+
+    # Vor open(dst, "wb") prüfen - das würde sonst die Quelle leeren
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} und {dst} sind dieselbe Datei")
+
+    if not hasattr(os, "copy_file_range") or src.stat().st_size < COPY_CHUNK:
+        shutil.copyfile(src, dst)
+        return
+    
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 64 * COPY_CHUNK):
+                pass
+        except OSError:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+
+
 # ============================================================================
 # TOOLS
 # ============================================================================
 
 @mcp.tool
-def read_file(path: str, encoding: str = "utf-8") -> str:
+def read_file(path: str, encoding: str = "utf-8", max_bytes: int = 10 * 1024 * 1024) -> str:
     """
     Liest den Inhalt einer Datei.
     
     Args:
         path: Absoluter oder relativer Pfad zur Datei
         encoding: Zeichenkodierung (default: utf-8)
+        max_bytes: Maximal gelesene Bytes, danach wird gekürzt (default: 10 MiB)
     
     Returns:
         Der Dateiinhalt als String
@@ -61,7 +161,30 @@ def read_file(path: str, encoding: str = "utf-8") -> str:
         return f"Fehler: '{path}' ist keine Datei"
     
     try:
-        return file_path.read_text(encoding=encoding)
+        import codecs
+        import io
+        
+        # Blockweise dekodieren statt die ganze Datei zu laden; der
+        # Newline-Decoder übersetzt Zeilenenden wie read_text()
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        parts = []
+        remaining = max_bytes
+        with file_path.open("rb") as f:
+            while remaining > 0:
+                chunk = f.read(min(READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                parts.append(decoder.decode(chunk))
+            truncated = remaining <= 0 and bool(f.read(1))
+        
+        # Beim Kürzen kein final=True, sonst scheitert ein angeschnittenes Zeichen
+        parts.append(decoder.decode(b"", final=not truncated))
+        if truncated:
+            parts.append(f"\n... [gekürzt nach {max_bytes} Bytes]")
+        return "".join(parts)
     except Exception as e:
         return f"Fehler beim Lesen: {e}"
 
@@ -94,7 +217,8 @@ def write_file(path: str, content: str, encoding: str = "utf-8") -> str:
 def list_directory(
     path: str = ".", 
     pattern: str = "*",
-    include_hidden: bool = False
+    include_hidden: bool = False,
+    include_counts: bool = False
 ) -> dict:
     """
     Listet den Inhalt eines Verzeichnisses.
@@ -103,6 +227,8 @@ def list_directory(
         path: Pfad zum Verzeichnis (default: aktuelles Verzeichnis)
         pattern: Glob-Pattern zum Filtern (default: alle Dateien)
         include_hidden: Versteckte Dateien einschließen (default: False)
+        include_counts: Einträge je Unterordner zählen, sonst "items": None
+            (default: False)
     
     Returns:
         Dictionary mit Dateien und Ordnern
@@ -118,24 +244,34 @@ def list_directory(
     files = []
     directories = []
     
-    for item in dir_path.glob(pattern):
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        # Pfad-Patterns kann nur glob auflösen
+        entries = dir_path.glob(pattern)
+    else:
+        entries = scan_matching(dir_path, pattern)
+    
+    for item in entries:
         name = item.name
         
         # Versteckte Dateien überspringen
         if not include_hidden and name.startswith("."):
             continue
         
-        if item.is_file():
-            files.append({
-                "name": name,
-                "size": item.stat().st_size,
-                "modified": item.stat().st_mtime
-            })
-        elif item.is_dir():
-            directories.append({
-                "name": name,
-                "items": len(list(item.iterdir())) if item.exists() else 0
-            })
+        try:
+            if item.is_file():
+                st = item.stat()
+                files.append({
+                    "name": name,
+                    "size": st.st_size,
+                    "modified": st.st_mtime
+                })
+            elif item.is_dir():
+                directories.append({
+                    "name": name,
+                    "items": count_entries(item) if include_counts else None
+                })
+        except OSError:
+            continue
     
     return {
         "path": str(dir_path.resolve()),
@@ -168,13 +304,36 @@ def search_files(
     if not dir_path.exists():
         return [f"Fehler: Verzeichnis '{path}' existiert nicht"]
     
-    glob_method = dir_path.rglob if recursive else dir_path.glob
     results = []
-    
-    for match in glob_method(pattern):
-        if len(results) >= max_results:
-            break
-        results.append(str(match))
+    if max_results <= 0:
+        return results
+    
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        # Pfad-Patterns kann nur glob auflösen
+        glob_method = dir_path.rglob if recursive else dir_path.glob
+        for match in glob_method(pattern):
+            results.append(str(match))
+            if len(results) >= max_results:
+                break
+        return results
+    
+    if not recursive:
+        for entry in scan_matching(dir_path, pattern):
+            results.append(str(dir_path / entry.name))
+            if len(results) >= max_results:
+                break
+        return results
+    
+    normcase = os.path.normcase
+    match = re.compile(fnmatch.translate(normcase(pattern))).match
+    join = os.path.join
+    for root, dirs, files in os.walk(dir_path):
+        for names in (dirs, files):
+            for name in names:
+                if match(normcase(name)):
+                    results.append(join(root, name))
+                    if len(results) >= max_results:
+                        return results
     
     return results
 
@@ -192,20 +351,20 @@ def get_file_info(path: str) -> dict:
     """
     file_path = ensure_allowed(path)
     
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return {"error": f"'{path}' existiert nicht"}
     
-    stat = file_path.stat()
-    
     return {
         "name": file_path.name,
         "path": str(file_path.resolve()),
-        "type": "directory" if file_path.is_dir() else "file",
-        "size": stat.st_size,
-        "created": stat.st_ctime,
-        "modified": stat.st_mtime,
-        "accessed": stat.st_atime,
-        "extension": file_path.suffix if file_path.is_file() else None,
+        "type": "directory" if stat.S_ISDIR(st.st_mode) else "file",
+        "size": st.st_size,
+        "created": st.st_ctime,
+        "modified": st.st_mtime,
+        "accessed": st.st_atime,
+        "extension": file_path.suffix if stat.S_ISREG(st.st_mode) else None,
         "readable": os.access(file_path, os.R_OK),
         "writable": os.access(file_path, os.W_OK)
     }
@@ -262,13 +421,14 @@ def delete_file(path: str, confirm: bool = False) -> str:
 
 
 @mcp.tool
-def copy_file(source: str, destination: str) -> str:
+def copy_file(source: str, destination: str, preserve_metadata: bool = True) -> str:
     """
     Kopiert eine Datei.
     
     Args:
         source: Quellpfad
         destination: Zielpfad
+        preserve_metadata: Rechte und Zeitstempel übernehmen (default: True)
     
     Returns:
         Erfolgsmeldung oder Fehler
@@ -282,8 +442,12 @@ def copy_file(source: str, destination: str) -> str:
         return f"Fehler: Quelle '{source}' existiert nicht"
     
     try:
+        if dst.is_dir():
+            dst = dst / src.name
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        copy_contents(src, dst)
+        if preserve_metadata:
+            shutil.copystat(src, dst)
         return f"Kopiert: {source} -> {destination}"
     except Exception as e:
         return f"Fehler: {e}"
@@ -319,6 +483,6 @@ if __name__ == "__main__":
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
     
     # Optional: Erlaubte Roots setzen für Produktion
-    # ALLOWED_ROOTS.extend(["/home/user/projects", "/tmp"])
+    # reconfigure_allowed_roots(["/home/user/projects", "/tmp"])
     
     mcp.run()
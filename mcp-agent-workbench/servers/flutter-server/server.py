@@ -11,12 +11,18 @@ Tools für:
 """
 
 import os
+import json
+import re
+import signal
+import sys
 import subprocess
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from fastmcp import FastMCP
 from pydantic import Field
-from typing import Optional
+from typing import Callable, Optional
 
 # Server initialisieren
 mcp = FastMCP(
@@ -24,33 +30,168 @@ mcp = FastMCP(
     instructions="Flutter/Dart Entwicklung und Build-Verwaltung"
 )
 
+
+def _use_pidfd_watcher():
+    """
+    Python < 3.12 unter Linux: Kindprozesse per pidfd statt per Thread/SIGCHLD abwarten.
+    
+    Ab 3.12 nutzt asyncio pidfd bereits von selbst, dort ist nichts zu tun.
+    """
+    if sys.platform != "linux" or sys.version_info >= (3, 12):
+        return
+    if not hasattr(asyncio, "PidfdChildWatcher"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return  # Kernel < 5.3
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+
+_use_pidfd_watcher()
+
+# Gemeinsamer Pool für Datei-Arbeit über mehrere Projekte
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="flutter")
+
 # Standard-Pfad für Flutter-Projekte
 DEFAULT_PROJECTS_PATH = os.getenv("FLUTTER_PROJECTS_PATH", "d:\\")
 
+# Verzeichnisse, in die bei der Projektsuche nicht abgestiegen wird
+# (versteckte Verzeichnisse wie .git, .dart_tool, .pub-cache werden generell übersprungen)
+SKIP_DIRS = frozenset({"node_modules", "build", "Pods", "ephemeral"})
+
+
+# Maximal behaltene Ausgabe pro Stream (es bleibt das Ende erhalten)
+OUTPUT_CAP = 2 * 1024 * 1024
+
+# pubspec.yaml: zuerst nur den Kopf lesen, ganz nur bei kleinen Dateien
+PUBSPEC_HEAD = 4096
+PUBSPEC_MAX = 64 * 1024
+
+# Builds ohne Ausgabe seit so vielen Sekunden abbrechen (0 = aus)
+BUILD_STALL_TIMEOUT = int(os.getenv("FLUTTER_STALL_TIMEOUT", "0"))
+
+# flutter analyze: so viele Bytes vom Ende der Ausgabe als Details zurückgeben
+DETAILS_TAIL = 128 * 1024
+
+# flutter test: parallel laufende Test-Dateien und max. gemeldete Fehlschläge
+TEST_CONCURRENCY = min(os.cpu_count() or 2, 4)
+MAX_TEST_FAILURES = 20
+
+# Maximal parallel laufende flutter-Prozesse (mehr erzeugt nur Kontextwechsel)
+MAX_PARALLEL = 8
+
+# Marker, die flutter analyze pro Issue ausgibt (ein Regex statt drei Scans)
+ISSUE_MARKERS = {b"error": "errors", b"warning": "warnings", b"info": "infos"}
+ISSUE_RE = re.compile(rb" (error|warning|info)(?= )")
 
-async def run_command(cmd: list, cwd: str = None, timeout: int = 300) -> dict:
-    """Führe Shell-Befehl aus und gib Ergebnis zurück"""
+
+async def _drain(stream: asyncio.StreamReader, buf: bytearray, counters: Optional[dict],
+                 on_line: Callable[[bytes], None]):
+    """Lies einen Stream zeilenweise, zähle Issues und behalte nur das Ende"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        on_line(line)
+        if counters is not None:
+            for match in ISSUE_RE.finditer(line):
+                counters[ISSUE_MARKERS[match.group(1)]] += 1
+        buf += line
+        if len(buf) > OUTPUT_CAP:
+            del buf[:len(buf) - OUTPUT_CAP]
+
+
+def _kill_tree(process: asyncio.subprocess.Process):
+    """Beende einen Prozess samt Kindern (flutter startet dart/gradle als Unterprozesse)"""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                           capture_output=True)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        process.kill()
+
+
+async def run_command(cmd: list, cwd: str = None, timeout: int = 300,
+                      counters: Optional[dict] = None, stall_timeout: int = 0,
+                      on_line: Optional[Callable[[bytes], None]] = None,
+                      decode: bool = True) -> dict:
+    """
+    Führe Shell-Befehl aus und gib Ergebnis zurück.
+    
+    stdout/stderr werden parallel gelesen statt per communicate() gepuffert;
+    ist counters gesetzt, werden Issue-Marker dabei direkt mitgezählt.
+    Bei Timeout oder wenn stall_timeout Sekunden lang keine Ausgabe kommt,
+    wird der Prozess beendet. on_line erhält jede Ausgabezeile (Fortschritt).
+    Mit decode=False enthält das Ergebnis stdout_bytes/stderr_bytes statt
+    dekodierter Strings.
+    """
+    loop = asyncio.get_running_loop()
+    last_output = loop.time()
+    
+    def seen(line: bytes):
+        nonlocal last_output
+        last_output = loop.time()
+        if on_line is not None:
+            on_line(line)
+    
+    async def watchdog():
+        while loop.time() - last_output < stall_timeout:
+            await asyncio.sleep(min(5, stall_timeout))
+    
+    process = None
+    pending = []
     try:
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            cwd=cwd
-        )
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(),
-            timeout=timeout
+            cwd=cwd,
+            limit=OUTPUT_CAP,
+            start_new_session=os.name != "nt"
         )
-        return {
-            "success": process.returncode == 0,
-            "returncode": process.returncode,
-            "stdout": stdout.decode("utf-8", errors="replace"),
-            "stderr": stderr.decode("utf-8", errors="replace")
-        }
-    except asyncio.TimeoutError:
-        return {"success": False, "error": f"Timeout nach {timeout} Sekunden"}
+        stdout, stderr = bytearray(), bytearray()
+        work = asyncio.ensure_future(asyncio.gather(
+            _drain(process.stdout, stdout, counters, seen),
+            _drain(process.stderr, stderr, counters, seen),
+            process.wait()
+        ))
+        pending = [work]
+        if stall_timeout:
+            pending.append(asyncio.ensure_future(watchdog()))
+        done, _ = await asyncio.wait(pending, timeout=timeout,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        if work not in done:
+            if done:
+                return {"success": False,
+                        "error": f"Keine Ausgabe seit {stall_timeout} Sekunden - abgebrochen",
+                        "stdout": stdout.decode("utf-8", errors="replace")}
+            return {"success": False, "error": f"Timeout nach {timeout} Sekunden"}
+        work.result()
+        result = {"success": process.returncode == 0, "returncode": process.returncode}
+        if decode:
+            result["stdout"] = stdout.decode("utf-8", errors="replace")
+            result["stderr"] = stderr.decode("utf-8", errors="replace")
+        else:
+            result["stdout_bytes"] = stdout
+            result["stderr_bytes"] = stderr
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
+    finally:
+        # Kein verwaister Prozess(-baum) nach Timeout/Abbruch
+        if process is not None and process.returncode is None:
+            _kill_tree(process)
+        for task in pending[1:]:
+            task.cancel()
+        if pending:
+            # Nach dem Kill liefern die Pipes EOF; Reader sauber auslaufen lassen
+            _, stuck = await asyncio.wait(pending, timeout=5)
+            for task in stuck:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 # ==================== ENVIRONMENT TOOLS ====================
@@ -105,15 +246,34 @@ async def list_flutter_devices() -> dict:
 
 # ==================== PROJECT TOOLS ====================
 
+def pub_up_to_date(project_path: str) -> bool:
+    """
+    Prüfe, ob ein implizites `pub get` übersprungen werden kann.
+    
+    Das ist der Fall, wenn pubspec.lock und .dart_tool/package_config.json
+    existieren und das Lockfile nicht älter als pubspec.yaml ist.
+    """
+    root = Path(project_path)
+    try:
+        pubspec = (root / "pubspec.yaml").stat().st_mtime_ns
+        lock = (root / "pubspec.lock").stat().st_mtime_ns
+        (root / ".dart_tool" / "package_config.json").stat()
+    except OSError:
+        return False
+    return lock >= pubspec
+
+
 @mcp.tool()
 async def flutter_pub_get(
-    project_path: str = Field(description="Pfad zum Flutter-Projekt")
+    project_path: str = Field(description="Pfad zum Flutter-Projekt"),
+    force: bool = Field(default=False, description="Auch bei aktuellem pubspec.lock ausführen")
 ) -> dict:
     """
     Installiere Dependencies eines Flutter-Projekts (flutter pub get).
     
     Args:
         project_path: Pfad zum Projekt (mit pubspec.yaml)
+        force: pub get auch ausführen, wenn pubspec.lock aktuell ist
         
     Returns:
         Ergebnis der Installation
@@ -125,6 +285,14 @@ async def flutter_pub_get(
     if not pubspec.exists():
         return {"success": False, "error": "Kein pubspec.yaml gefunden - ist das ein Flutter-Projekt?"}
     
+    if not force and pub_up_to_date(project_path):
+        return {
+            "success": True,
+            "project": project_path,
+            "skipped": True,
+            "reason": "pubspec.lock ist aktuell"
+        }
+    
     result = await run_command(["flutter", "pub", "get"], cwd=project_path)
     return {
         "success": result.get("success", False),
@@ -160,6 +328,39 @@ async def flutter_pub_upgrade(
     }
 
 
+def decode_tail(data: bytes, limit: int) -> str:
+    """Dekodiere höchstens die letzten limit Bytes, beginnend an einer Zeilengrenze"""
+    if len(data) <= limit:
+        return data.decode("utf-8", errors="replace")
+    tail = data[-limit:]
+    newline = tail.find(b"\n")
+    if newline != -1:
+        tail = tail[newline + 1:]
+    return "…\n" + tail.decode("utf-8", errors="replace")
+
+
+async def analyze_project(project_path: str) -> dict:
+    """Führe flutter analyze aus; Issues werden schon beim Lesen gezählt"""
+    counters = dict.fromkeys(ISSUE_MARKERS.values(), 0)
+    cmd = ["flutter", "analyze"]
+    if pub_up_to_date(project_path):
+        cmd.append("--no-pub")
+    result = await run_command(cmd, cwd=project_path, timeout=180, counters=counters,
+                               decode=False)
+    
+    analysis = {
+        "success": result.get("success", False),
+        "project": project_path,
+        "summary": counters,
+        # Nur das Ende dekodieren - gezählt wurde bereits auf den Bytes
+        "details": decode_tail(result.get("stdout_bytes", b"") + result.get("stderr_bytes", b""),
+                               DETAILS_TAIL)
+    }
+    if "error" in result:
+        analysis["error"] = result["error"]
+    return analysis
+
+
 @mcp.tool()
 async def flutter_analyze(
     project_path: str = Field(description="Pfad zum Flutter-Projekt")
@@ -173,52 +374,126 @@ async def flutter_analyze(
     Returns:
         Liste aller Warnings und Errors
     """
-    result = await run_command(["flutter", "analyze"], cwd=project_path, timeout=180)
+    return await analyze_project(project_path)
+
+
+@mcp.tool()
+async def flutter_multi_analyze(
+    project_paths: str = Field(description="Komma-getrennte Projekt-Pfade")
+) -> dict:
+    """
+    Analysiere mehrere Projekte parallel.
+    
+    Args:
+        project_paths: Pfade mit Komma getrennt
+        
+    Returns:
+        Analyse-Ergebnis pro Projekt und Gesamtsumme der Issues
+    """
+    paths = [p.strip() for p in project_paths.split(",") if p.strip()]
+    if not paths:
+        return {"success": False, "error": "Keine Projekt-Pfade angegeben"}
+    
+    # Artefakte einmal vorab laden, damit die Worker nicht am Startup-Lock warten
+    await run_command(["flutter", "precache"], timeout=300)
     
-    output = result.get("stdout", "") + result.get("stderr", "")
+    sem = asyncio.Semaphore(min(len(paths), os.cpu_count() or 1, MAX_PARALLEL))
     
-    # Zähle Issues
-    errors = output.count(" error ")
-    warnings = output.count(" warning ")
-    infos = output.count(" info ")
+    async def one(path: str) -> dict:
+        async with sem:
+            return await analyze_project(path)
+    
+    results = await asyncio.gather(*(one(p) for p in paths))
+    
+    total = dict.fromkeys(ISSUE_MARKERS.values(), 0)
+    for r in results:
+        for key, value in r["summary"].items():
+            total[key] += value
     
     return {
-        "success": result.get("success", False),
-        "project": project_path,
-        "summary": {
-            "errors": errors,
-            "warnings": warnings,
-            "infos": infos
-        },
-        "details": output
+        "success": all(r["success"] for r in results),
+        "summary": total,
+        "projects": results
     }
 
 
+def tally_test_event(tally: dict, line: bytes):
+    """Werte eine Zeile des `flutter test --reporter json`-Streams aus"""
+    if not line.startswith(b"{"):
+        return  # Sonstige Ausgabe (z.B. von pub)
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return
+    kind = event.get("type")
+    if kind == "testStart":
+        test = event["test"]
+        tally["names"][test["id"]] = test.get("name", "")
+    elif kind == "error":
+        tally["failures"].setdefault(event["testID"], event.get("error", ""))
+    elif kind == "testDone":
+        summary = tally["summary"]
+        if event["result"] != "success":
+            summary["failed"] += 1
+            tally["failures"].setdefault(event["testID"], event["result"])
+        elif event.get("hidden"):
+            return  # Lade-/setUpAll-Pseudotests
+        elif event.get("skipped"):
+            summary["skipped"] += 1
+        else:
+            summary["passed"] += 1
+
+
 @mcp.tool()
 async def flutter_test(
     project_path: str = Field(description="Pfad zum Flutter-Projekt"),
-    coverage: bool = Field(default=False, description="Mit Code-Coverage")
+    coverage: bool = Field(default=False, description="Mit Code-Coverage"),
+    machine: bool = Field(default=True, description="JSON-Reporter, strukturierte Ergebnisse")
 ) -> dict:
     """
-    Führe Tests aus.
+    Führe Tests aus (parallel mit bis zu TEST_CONCURRENCY Test-Dateien).
     
     Args:
         project_path: Pfad zum Projekt
         coverage: Coverage-Report generieren
+        machine: Ergebnisse als Zähler + Fehlerliste statt Rohtext
         
     Returns:
         Test-Ergebnisse
     """
-    cmd = ["flutter", "test"]
+    cmd = ["flutter", "test", f"--concurrency={TEST_CONCURRENCY}"]
+    if pub_up_to_date(project_path):
+        cmd.append("--no-pub")
     if coverage:
         cmd.append("--coverage")
     
-    result = await run_command(cmd, cwd=project_path, timeout=300)
-    return {
+    if not machine:
+        result = await run_command(cmd, cwd=project_path, timeout=300)
+        return {
+            "success": result.get("success", False),
+            "project": project_path,
+            "test_output": result.get("stdout", "") + result.get("stderr", "")
+        }
+    
+    # JSON-Events werden schon beim Lesen ausgewertet
+    tally = {"summary": {"passed": 0, "failed": 0, "skipped": 0}, "names": {}, "failures": {}}
+    cmd += ["--reporter", "json"]
+    result = await run_command(cmd, cwd=project_path, timeout=300, decode=False,
+                               on_line=lambda line: tally_test_event(tally, line))
+    
+    response = {
         "success": result.get("success", False),
         "project": project_path,
-        "test_output": result.get("stdout", "") + result.get("stderr", "")
+        "summary": tally["summary"],
+        "failures": [
+            {"test": tally["names"].get(test_id, test_id), "error": error}
+            for test_id, error in list(tally["failures"].items())[:MAX_TEST_FAILURES]
+        ],
+        "stderr": decode_tail(result.get("stderr_bytes", b""), DETAILS_TAIL)
     }
+    if "error" in result:
+        response["error"] = result["error"]
+    return response
 
 
 # ==================== BUILD TOOLS ====================
@@ -248,7 +523,8 @@ async def flutter_build_apk(
     if split_per_abi:
         cmd.append("--split-per-abi")
     
-    result = await run_command(cmd, cwd=project_path, timeout=600)
+    result = await run_command(cmd, cwd=project_path, timeout=600,
+                               stall_timeout=BUILD_STALL_TIMEOUT)
     
     if result.get("success"):
         apk_path = Path(project_path) / "build" / "app" / "outputs" / "flutter-apk"
@@ -282,7 +558,8 @@ async def flutter_build_appbundle(
     result = await run_command(
         ["flutter", "build", "appbundle", "--release"],
         cwd=project_path,
-        timeout=600
+        timeout=600,
+        stall_timeout=BUILD_STALL_TIMEOUT
     )
     
     if result.get("success"):
@@ -316,7 +593,8 @@ async def flutter_build_web(
     result = await run_command(
         ["flutter", "build", "web", f"--web-renderer={renderer}"],
         cwd=project_path,
-        timeout=300
+        timeout=300,
+        stall_timeout=BUILD_STALL_TIMEOUT
     )
     
     if result.get("success"):
@@ -348,7 +626,8 @@ async def flutter_build_ios(
     result = await run_command(
         ["flutter", "build", "ios", "--release", "--no-codesign"],
         cwd=project_path,
-        timeout=600
+        timeout=600,
+        stall_timeout=BUILD_STALL_TIMEOUT
     )
     return {
         "success": result.get("success", False),
@@ -381,27 +660,75 @@ async def flutter_clean(
 
 # ==================== PROJECT INFO ====================
 
-@mcp.tool()
-async def flutter_project_info(
-    project_path: str = Field(description="Pfad zum Flutter-Projekt")
-) -> dict:
+@lru_cache(maxsize=512)
+def _parse_pubspec(path: str, mtime_ns: int) -> dict:
+    """Parse pubspec.yaml (gecacht pro Pfad und Änderungszeit)"""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def load_pubspec(path: str) -> dict:
+    """Lade pubspec.yaml; unveränderte Dateien werden nicht erneut geparst"""
+    return _parse_pubspec(path, os.stat(path).st_mtime_ns)
+
+
+def is_flutter_pubspec(path: str) -> bool:
     """
-    Zeige Projekt-Informationen aus pubspec.yaml.
+    Prüfe per Byte-Suche, ob ein pubspec.yaml Flutter nutzt.
     
-    Args:
-        project_path: Pfad zum Projekt
-        
-    Returns:
-        Name, Version, Dependencies
+    Meist steht `flutter:` in den ersten 4 KiB; nur kleine Dateien
+    (< 64 KiB) werden bei Bedarf weiter gelesen, nichts wird dekodiert.
     """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(PUBSPEC_HEAD)
+            if b"flutter:" in head:
+                return True
+            if len(head) < PUBSPEC_HEAD or os.fstat(f.fileno()).st_size >= PUBSPEC_MAX:
+                return False
+            # Überlappung, falls der Marker genau auf der Blockgrenze liegt
+            return b"flutter:" in head[-7:] + f.read()
+    except OSError:
+        return False
+
+
+def find_flutter_projects(root: str, limit: int = 50, max_depth: int = 3) -> list:
+    """Suche Flutter-Projekte iterativ per os.scandir (max_depth Ebenen tief)"""
+    projects = []
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name == "pubspec.yaml":
+                        if is_flutter_pubspec(entry.path):
+                            projects.append({
+                                "path": path,
+                                "name": os.path.basename(os.path.normpath(path))
+                            })
+                            if len(projects) >= limit:
+                                return projects
+                    elif (depth < max_depth and not name.startswith(".")
+                          and name not in SKIP_DIRS
+                          and entry.is_dir(follow_symlinks=False)):
+                        stack.append((entry.path, depth + 1))
+        except OSError:
+            pass
+    return projects
+
+
+def project_info(project_path: str) -> dict:
+    """Projekt-Infos aus pubspec.yaml; Dependency-Namen werden interniert"""
     pubspec = Path(project_path) / "pubspec.yaml"
     if not pubspec.exists():
-        return {"success": False, "error": "pubspec.yaml nicht gefunden"}
+        return {"success": False, "project": project_path, "error": "pubspec.yaml nicht gefunden"}
     
     try:
-        import yaml
-        with open(pubspec, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_pubspec(str(pubspec))
         
         return {
             "success": True,
@@ -410,48 +737,73 @@ async def flutter_project_info(
             "description": data.get("description"),
             "version": data.get("version"),
             "environment": data.get("environment", {}),
-            "dependencies": list(data.get("dependencies", {}).keys()),
-            "dev_dependencies": list(data.get("dev_dependencies", {}).keys())
+            # flutter, cupertino_icons, ... wiederholen sich über Projekte hinweg
+            "dependencies": [sys.intern(d) for d in data.get("dependencies") or {}],
+            "dev_dependencies": [sys.intern(d) for d in data.get("dev_dependencies") or {}]
         }
     except Exception as e:
-        return {"success": False, "error": str(e)}
+        return {"success": False, "project": project_path, "error": str(e)}
+
+
+@mcp.tool()
+async def flutter_project_info(
+    project_path: str = Field(description="Pfad zum Flutter-Projekt")
+) -> dict:
+    """
+    Zeige Projekt-Informationen aus pubspec.yaml.
+    
+    Args:
+        project_path: Pfad zum Projekt
+        
+    Returns:
+        Name, Version, Dependencies
+    """
+    return project_info(project_path)
+
+
+@mcp.tool()
+async def flutter_projects_info(
+    project_paths: str = Field(description="Komma-getrennte Projekt-Pfade")
+) -> dict:
+    """
+    Zeige pubspec-Informationen mehrerer Projekte auf einmal.
+    
+    Args:
+        project_paths: Pfade mit Komma getrennt
+        
+    Returns:
+        Name, Version, Dependencies pro Projekt
+    """
+    paths = [p.strip() for p in project_paths.split(",") if p.strip()]
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_POOL, project_info, path) for path in paths)
+    )
+    return {
+        "success": True,
+        "projects": results
+    }
 
 
 @mcp.tool()
 async def list_flutter_projects(
-    search_path: str = Field(default="d:\\", description="Pfad zum Durchsuchen")
+    search_path: str = Field(default="d:\\", description="Pfad zum Durchsuchen"),
+    limit: int = Field(default=50, description="Maximale Anzahl Projekte")
 ) -> dict:
     """
     Finde alle Flutter-Projekte in einem Verzeichnis.
     
     Args:
         search_path: Basis-Pfad für Suche
+        limit: Suche nach so vielen Treffern beenden
         
     Returns:
         Liste aller gefundenen Flutter-Projekte
     """
-    projects = []
-    search = Path(search_path)
-    
-    if not search.exists():
+    if not Path(search_path).exists():
         return {"success": False, "error": f"Pfad nicht gefunden: {search_path}"}
     
-    # Suche pubspec.yaml (max 3 Ebenen tief)
-    for pubspec in search.glob("**/pubspec.yaml"):
-        # Prüfe ob es Flutter ist (nicht nur Dart)
-        try:
-            with open(pubspec, "r", encoding="utf-8") as f:
-                content = f.read()
-            if "flutter:" in content:
-                projects.append({
-                    "path": str(pubspec.parent),
-                    "name": pubspec.parent.name
-                })
-        except:
-            pass
-        
-        if len(projects) >= 50:  # Limit
-            break
+    projects = await asyncio.to_thread(find_flutter_projects, search_path, limit)
     
     return {
         "success": True,
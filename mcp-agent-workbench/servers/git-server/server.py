@@ -10,8 +10,15 @@ Tools für:
 """
 
 import os
+import asyncio
+import codecs
+import subprocess
+import tempfile
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from fastmcp import FastMCP
 from pydantic import Field
 from typing import Optional
@@ -27,14 +34,90 @@ mcp = FastMCP(
 # Standard-Pfad für Projekte
 DEFAULT_PATH = os.getenv("GIT_PROJECTS_PATH", "d:\\")
 
+# Verzeichnisse, in die bei der Repo-Suche nicht abgestiegen wird
+SKIP_DIRS = frozenset({"node_modules", "build", "venv", "__pycache__"})
+
+
+# git log: Datensätze mit \x1e, Felder mit \x1f getrennt; danach folgt --numstat
+LOG_FORMAT = "--format=%x1e%H%x1f%an%x1f%ct%x1f%B%x1f"
+
+# Maximale Länge eines zurückgegebenen Diffs (Zeichen)
+DIFF_LIMIT = 5000
+
+# Offene Repo-Objekte pro Pfad: path -> (HEAD-mtime, Repo), älteste zuerst
+REPO_CACHE_SIZE = 32
+_repo_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+# Gemeinsamer Pool für Git-Aufrufe über mehrere Repos (begrenzt gegen Überlast)
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="git")
+
 
 def get_repo(path: str) -> Repo:
-    """Öffne Git Repository"""
-    return Repo(path)
+    """Öffne Git Repository (gecacht, solange sich .git/HEAD nicht ändert)"""
+    key = os.path.abspath(path)
+    try:
+        head = os.stat(os.path.join(key, ".git", "HEAD")).st_mtime_ns
+    except OSError:
+        return Repo(path)  # Bare Repo, Worktree o.ä.: nicht cachen
+    
+    cached = _repo_cache.get(key)
+    if cached is not None:
+        if cached[0] == head:
+            _repo_cache.move_to_end(key)
+            return cached[1]
+        cached[1].close()
+    
+    repo = Repo(key)
+    _repo_cache[key] = (head, repo)
+    if len(_repo_cache) > REPO_CACHE_SIZE:
+        # close() beendet die persistenten git-cat-file-Prozesse des Repos
+        _, (_, evicted) = _repo_cache.popitem(last=False)
+        evicted.close()
+    return repo
 
 
 # ==================== REPO INFO ====================
 
+def parse_status(raw: str) -> dict:
+    """
+    Parse die Ausgabe von `git status --porcelain=v2 -z --branch`.
+    
+    Args:
+        raw: NUL-getrennte Status-Ausgabe
+        
+    Returns:
+        Branch, Ahead/Behind sowie staged, geänderte und untracked Dateien
+    """
+    status = {"branch": None, "ahead": 0, "behind": 0,
+              "staged": [], "changed": [], "untracked": []}
+    records = iter(raw.split("\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == "#":
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.head":
+                status["branch"] = value
+            elif key == "branch.ab":
+                ahead, behind = value.split()
+                status["ahead"], status["behind"] = int(ahead), -int(behind)
+        elif kind == "?":
+            status["untracked"].append(record[2:])
+        elif kind in ("1", "2", "u"):
+            # Feldanzahl vor dem Pfad: 1 -> 8, 2 -> 9, u -> 10
+            fields = record.split(" ", {"1": 8, "2": 9, "u": 10}[kind])
+            xy, path = fields[1], fields[-1]
+            if kind == "2":
+                next(records, None)  # Ursprungspfad der Umbenennung
+            if kind == "u":
+                status["changed"].append(path)
+                continue
+            if xy[0] != ".":
+                status["staged"].append(path)
+            if xy[1] != ".":
+                status["changed"].append(path)
+    return status
+
+
 @mcp.tool()
 async def git_status(
     repo_path: str = Field(description="Pfad zum Git Repository")
@@ -51,36 +134,21 @@ async def git_status(
     try:
         repo = get_repo(repo_path)
         
-        # Status sammeln
-        changed = [item.a_path for item in repo.index.diff(None)]
-        staged = [item.a_path for item in repo.index.diff("HEAD")]
-        untracked = repo.untracked_files
-        
-        # Branch-Info
-        branch = repo.active_branch.name
-        
-        # Ahead/Behind (falls Remote existiert)
-        ahead, behind = 0, 0
-        try:
-            tracking = repo.active_branch.tracking_branch()
-            if tracking:
-                commits_behind = list(repo.iter_commits(f'{branch}..{tracking.name}'))
-                commits_ahead = list(repo.iter_commits(f'{tracking.name}..{branch}'))
-                behind = len(commits_behind)
-                ahead = len(commits_ahead)
-        except:
-            pass
+        # Ein Aufruf liefert Branch, Ahead/Behind und alle Dateien
+        status = parse_status(repo.git.status(
+            "--porcelain=v2", "-z", "--branch", "--untracked-files=all"
+        ))
         
         return {
             "success": True,
             "repo": repo_path,
-            "branch": branch,
-            "is_dirty": repo.is_dirty(),
-            "staged_files": staged,
-            "changed_files": changed,
-            "untracked_files": untracked[:20],  # Limit
-            "commits_ahead": ahead,
-            "commits_behind": behind
+            "branch": status["branch"],
+            "is_dirty": bool(status["staged"] or status["changed"]),
+            "staged_files": status["staged"],
+            "changed_files": status["changed"],
+            "untracked_files": status["untracked"][:20],  # Limit
+            "commits_ahead": status["ahead"],
+            "commits_behind": status["behind"]
         }
     except InvalidGitRepositoryError:
         return {"success": False, "error": f"Kein Git-Repo: {repo_path}"}
@@ -88,11 +156,18 @@ async def git_status(
         return {"success": False, "error": str(e)}
 
 
+@lru_cache(maxsize=1024)
+def iso_date(timestamp: int) -> str:
+    """Unix-Timestamp als ISO-Datum (gecacht pro Sekunde)"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
 @mcp.tool()
 async def git_log(
     repo_path: str = Field(description="Pfad zum Git Repository"),
     count: int = Field(default=10, description="Anzahl Commits"),
-    branch: Optional[str] = Field(default=None, description="Branch (optional)")
+    branch: Optional[str] = Field(default=None, description="Branch (optional)"),
+    iso_dates: bool = Field(default=False, description="Zusätzlich ISO-Datum pro Commit")
 ) -> dict:
     """
     Zeige Commit-Historie.
@@ -101,6 +176,7 @@ async def git_log(
         repo_path: Pfad zum Repo
         count: Anzahl der Commits
         branch: Spezifischer Branch
+        iso_dates: Neben dem Unix-Timestamp auch ein ISO-Datum liefern
         
     Returns:
         Liste der Commits
@@ -108,15 +184,25 @@ async def git_log(
     try:
         repo = get_repo(repo_path)
         
+        # Ein einziger git-log-Aufruf statt eines git diff pro Commit
+        raw = repo.git.log(
+            f"--max-count={count}", LOG_FORMAT, "--numstat",
+            "--diff-merges=first-parent", branch or "HEAD", "--"
+        )
+        
         commits = []
-        for commit in repo.iter_commits(branch, max_count=count):
-            commits.append({
-                "hash": commit.hexsha[:8],
-                "message": commit.message.strip()[:100],
-                "author": str(commit.author),
-                "date": datetime.fromtimestamp(commit.committed_date).isoformat(),
-                "files_changed": len(commit.stats.files)
-            })
+        for record in raw.split("\x1e")[1:]:
+            sha, author, timestamp, message, numstat = record.split("\x1f", 4)
+            entry = {
+                "hash": sha[:8],
+                "message": message.strip()[:100],
+                "author": author,
+                "timestamp": int(timestamp),
+                "files_changed": sum(1 for line in numstat.splitlines() if line)
+            }
+            if iso_dates:
+                entry["date"] = iso_date(entry["timestamp"])
+            commits.append(entry)
         
         return {
             "success": True,
@@ -128,6 +214,44 @@ async def git_log(
         return {"success": False, "error": str(e)}
 
 
+def read_diff(repo_path: str, args: list) -> tuple:
+    """
+    Lies höchstens DIFF_LIMIT Zeichen von `git diff` und beende git danach.
+    
+    Args:
+        repo_path: Pfad zum Repo
+        args: Zusätzliche Argumente für git diff
+        
+    Returns:
+        (Diff-Text, ob gekürzt wurde)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts, size = [], 0
+    # stderr in eine Temp-Datei statt Pipe: viele Warnungen (z.B. "LF will be
+    # replaced by CRLF") würden sonst den Pipe-Puffer füllen und git blockieren
+    with tempfile.TemporaryFile() as errfile, \
+         subprocess.Popen(["git", "-C", repo_path, "diff", *args],
+                          stdout=subprocess.PIPE, stderr=errfile) as proc:
+        while size <= DIFF_LIMIT:
+            chunk = proc.stdout.read(8192)
+            if not chunk:
+                parts.append(decoder.decode(b"", final=True))
+                break
+            text = decoder.decode(chunk)
+            parts.append(text)
+            size += len(text)
+        truncated = size > DIFF_LIMIT
+        if truncated:
+            proc.kill()  # Rest wird nicht gebraucht
+        returncode = proc.wait()
+        errfile.seek(0)
+        stderr = errfile.read()
+    if returncode != 0 and not truncated:
+        message = stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(message.splitlines()[0] if message else f"git diff Exit-Code {returncode}")
+    return "".join(parts)[:DIFF_LIMIT].rstrip("\n"), truncated
+
+
 @mcp.tool()
 async def git_diff(
     repo_path: str = Field(description="Pfad zum Git Repository"),
@@ -146,19 +270,18 @@ async def git_diff(
         Diff-Output
     """
     try:
-        repo = get_repo(repo_path)
-        
-        if staged:
-            diff = repo.git.diff("--staged", file_path) if file_path else repo.git.diff("--staged")
-        else:
-            diff = repo.git.diff(file_path) if file_path else repo.git.diff()
+        args = ["--staged"] if staged else []
+        if file_path:
+            args += ["--", file_path]
+        diff, truncated = read_diff(repo_path, args)
         
         return {
             "success": True,
             "repo": repo_path,
             "staged": staged,
             "file": file_path,
-            "diff": diff[:5000] if diff else "(keine Änderungen)"
+            "diff": diff or "(keine Änderungen)",
+            "truncated": truncated
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -420,7 +543,9 @@ async def git_push(
 async def git_fetch(
     repo_path: str = Field(description="Pfad zum Git Repository"),
     remote: str = Field(default="origin", description="Remote-Name"),
-    prune: bool = Field(default=True, description="Gelöschte Remote-Branches entfernen")
+    prune: bool = Field(default=True, description="Gelöschte Remote-Branches entfernen"),
+    filter_blobs: bool = Field(default=False, description="Nur Commits/Trees holen (Partial Clone, ohne Tags)"),
+    shallow: bool = Field(default=False, description="Nur den letzten Commit holen (--depth=1)")
 ) -> dict:
     """
     Hole Remote-Infos ohne Merge (git fetch).
@@ -429,6 +554,9 @@ async def git_fetch(
         repo_path: Pfad zum Repo
         remote: Remote
         prune: Aufräumen
+        filter_blobs: --filter=blob:none --no-tags; Dateiinhalte werden erst bei
+            Bedarf nachgeladen (macht das Remote dauerhaft zum Promisor)
+        shallow: --depth=1; macht das Repo flach
         
     Returns:
         Fetch-Ergebnis
@@ -436,10 +564,14 @@ async def git_fetch(
     try:
         repo = get_repo(repo_path)
         
+        args = [remote]
         if prune:
-            result = repo.git.fetch(remote, "--prune")
-        else:
-            result = repo.git.fetch(remote)
+            args.append("--prune")
+        if filter_blobs:
+            args += ["--filter=blob:none", "--no-tags"]
+        if shallow:
+            args.append("--depth=1")
+        result = repo.git.fetch(*args)
         
         return {
             "success": True,
@@ -453,6 +585,29 @@ async def git_fetch(
 
 # ==================== MULTI-REPO TOOLS ====================
 
+def find_repos(base_path: str, max_depth: int) -> list:
+    """Suche Git-Repos iterativ per os.scandir, ohne in Repos abzusteigen"""
+    repos = []
+    stack = [(base_path, 0)]
+    while stack:
+        path, depth = stack.pop()
+        if os.path.isdir(os.path.join(path, ".git")):
+            repos.append(path)
+            continue  # Nicht in Submodules suchen
+        if depth >= max_depth:
+            continue
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if (not entry.name.startswith(".") and entry.name not in SKIP_DIRS
+                            and entry.is_dir(follow_symlinks=False)):
+                        stack.append((entry.path, depth + 1))
+        except OSError:
+            pass
+    repos.sort()
+    return repos
+
+
 @mcp.tool()
 async def scan_repos(
     base_path: str = Field(default="d:\\", description="Basis-Pfad zum Scannen"),
@@ -468,25 +623,7 @@ async def scan_repos(
     Returns:
         Liste aller gefundenen Repos
     """
-    repos = []
-    base = Path(base_path)
-    
-    def scan(path: Path, depth: int):
-        if depth > max_depth:
-            return
-        try:
-            git_dir = path / ".git"
-            if git_dir.exists() and git_dir.is_dir():
-                repos.append(str(path))
-                return  # Nicht in Submodules suchen
-            
-            for sub in path.iterdir():
-                if sub.is_dir() and not sub.name.startswith("."):
-                    scan(sub, depth + 1)
-        except PermissionError:
-            pass
-    
-    scan(base, 0)
+    repos = await asyncio.to_thread(find_repos, base_path, max_depth)
     
     return {
         "success": True,
@@ -496,6 +633,31 @@ async def scan_repos(
     }
 
 
+def repo_summary(path: str) -> dict:
+    """Kurzstatus eines Repos per `git status` ohne Repo()-Objekt (läuft im Thread-Pool)"""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", path, "status", "--porcelain=v2", "-z", "--branch",
+             "--untracked-files=all"],
+            capture_output=True, text=True, encoding="utf-8", errors="replace"
+        )
+        if proc.returncode != 0:
+            return {"path": path, "error": proc.stderr.strip()}
+        status = parse_status(proc.stdout)
+        return {
+            "path": path,
+            "name": Path(path).name,
+            "branch": status["branch"],
+            "dirty": bool(status["staged"] or status["changed"]),
+            "untracked": len(status["untracked"])
+        }
+    except Exception as e:
+        return {
+            "path": path,
+            "error": str(e)
+        }
+
+
 @mcp.tool()
 async def multi_status(
     repo_paths: str = Field(description="Komma-getrennte Repo-Pfade")
@@ -510,23 +672,10 @@ async def multi_status(
         Status aller Repos
     """
     paths = [p.strip() for p in repo_paths.split(",")]
-    results = []
-    
-    for path in paths:
-        try:
-            repo = get_repo(path)
-            results.append({
-                "path": path,
-                "name": Path(path).name,
-                "branch": repo.active_branch.name,
-                "dirty": repo.is_dirty(),
-                "untracked": len(repo.untracked_files)
-            })
-        except Exception as e:
-            results.append({
-                "path": path,
-                "error": str(e)
-            })
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_POOL, repo_summary, path) for path in paths)
+    )
     
     return {
         "success": True,
@@ -6,26 +6,220 @@ Bietet Tools für Issues, PRs, Repos und mehr.
 """
 
 from fastmcp import FastMCP
-from github import Github, GithubException
-from typing import Optional
+from collections import OrderedDict
+from operator import itemgetter
+from pydantic_core import from_json
+from typing import Any, Optional
+from urllib.parse import quote
+import asyncio
+import hashlib
+import importlib.util
 import os
+import re
 import json
+import httpx
 
 mcp = FastMCP("github-server")
 
-# GitHub Client (wird bei Bedarf initialisiert)
-_github_client: Optional[Github] = None
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_WEB_URL = "https://github.com"
+
+# Einträge pro Seite bei paginierten Listen (GitHub-Maximum)
+PER_PAGE = 100
+
+# Maximal gleichzeitige Detail-Anfragen (z.B. PR-Anreicherung)
+MAX_CONCURRENT_REQUESTS = 10
+
+# Feldzugriff für Label- und User-Listen (läuft in C statt Python-Schleife)
+_name = itemgetter("name")
+_login = itemgetter("login")
+
+# ETag-Cache für bedingte GETs: Schlüssel -> (ETag, Inhalt, Content-Type)
+ETAG_CACHE_SIZE = 128
+_etag_cache: OrderedDict = OrderedDict()
+
+# Repository, offene Issues und PRs in einer Abfrage
+REPO_OVERVIEW_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!) {
+  repository(owner: $owner, name: $repo) {
+    name
+    nameWithOwner
+    description
+    url
+    stargazerCount
+    forkCount
+    primaryLanguage { name }
+    defaultBranchRef { name }
+    issues(first: $first, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      totalCount
+      nodes { number title url author { login } updatedAt }
+    }
+    pullRequests(first: $first, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      totalCount
+      nodes { number title url author { login } isDraft updatedAt }
+    }
+  }
+}
+"""
+
+# Vollständige Commit-SHA: Inhalt unter diesem Ref ändert sich nie
+COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+# HTTP/2 nur, wenn das optionale h2-Paket installiert ist
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# HTTP Client (wird bei Bedarf initialisiert, danach von allen Tools geteilt)
+_http_client: Optional[httpx.AsyncClient] = None
 
 
-def get_github() -> Github:
-    """Holt oder erstellt den GitHub Client."""
-    global _github_client
-    if _github_client is None:
+class GitHubAPIError(Exception):
+    """Fehlerantwort der GitHub API."""
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Holt oder erstellt den GitHub Client (Keep-Alive, Connection-Pool)."""
+    global _http_client
+    if _http_client is None:
         token = os.environ.get("GITHUB_TOKEN")
         if not token:
             raise ValueError("GITHUB_TOKEN Umgebungsvariable nicht gesetzt")
-        _github_client = Github(token)
-    return _github_client
+        _http_client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2,
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+            timeout=15.0,
+        )
+    return _http_client
+
+
+async def gh_request(method: str, path: str, **kwargs) -> httpx.Response:
+    """
+    Sendet eine Anfrage an die GitHub API.
+    
+    Raises:
+        GitHubAPIError: Bei einer Fehlerantwort (4xx/5xx)
+    """
+    client = await get_client()
+    response = await client.request(method, path, **kwargs)
+    if response.is_error:
+        try:
+            message = response.json().get("message")
+        except ValueError:
+            message = None
+        raise GitHubAPIError(message or f"HTTP {response.status_code}")
+    return response
+
+
+async def gh_get(path: str, **params) -> Any:
+    """GET-Anfrage, gibt das dekodierte JSON zurück."""
+    response = await gh_request("GET", path, params=params or None)
+    return from_json(response.content)
+
+
+async def gh_graphql(query: str, **variables) -> dict:
+    """
+    Führt eine GraphQL-Abfrage aus.
+    
+    Raises:
+        GitHubAPIError: Wenn die Antwort GraphQL-Fehler enthält
+    """
+    response = await gh_request("POST", "/graphql", json={"query": query, "variables": variables})
+    result = from_json(response.content)
+    if result.get("errors"):
+        raise GitHubAPIError(result["errors"][0].get("message", "GraphQL Fehler"))
+    return result["data"]
+
+
+async def gh_get_cached(
+    path: str, accept: Optional[str] = None, immutable: bool = False, **params
+) -> tuple[bytes, str]:
+    """
+    GET mit ETag-Cache. Bekannte Antworten werden mit If-None-Match
+    nachgefragt; ein 304 kommt ohne Body und zählt nicht gegen das Rate-Limit.
+    
+    Args:
+        path: API-Pfad
+        accept: Abweichender Accept-Header (z.B. Rohinhalt)
+        immutable: Inhalt ändert sich nie, Cache-Treffer ohne Anfrage nutzen
+    
+    Returns:
+        Tuple (Inhalt, Content-Type)
+    """
+    key = (path, accept, tuple(sorted(params.items())))
+    cached = _etag_cache.get(key)
+    if cached:
+        _etag_cache.move_to_end(key)
+        if immutable:
+            return cached[1], cached[2]
+    
+    headers = {}
+    if accept:
+        headers["Accept"] = accept
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    response = await gh_request("GET", path, params=params or None, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[1], cached[2]
+    
+    content_type = response.headers.get("content-type", "")
+    etag = response.headers.get("etag")
+    if etag:
+        _etag_cache[key] = (etag, response.content, content_type)
+        _etag_cache.move_to_end(key)
+        while len(_etag_cache) > ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+    return response.content, content_type
+
+
+async def gh_list(path: str, max_results: int, items_key: Optional[str] = None, **params) -> list:
+    """
+    Holt bis zu max_results Einträge eines paginierten Endpunkts.
+    
+    Args:
+        path: API-Pfad
+        max_results: Maximale Anzahl Einträge
+        items_key: Schlüssel der Liste in der Antwort (z.B. "items" bei Suchen)
+    
+    Returns:
+        Liste der Einträge als Dictionaries
+    """
+    # Kleine Abfragen passen so in eine Seite, ohne überzählige Einträge zu laden
+    per_page = min(max_results, PER_PAGE)
+    results = []
+    page = 1
+    while len(results) < max_results:
+        data = await gh_get(path, per_page=per_page, page=page, **params)
+        batch = data[items_key] if items_key else data
+        results.extend(batch)
+        if len(batch) < per_page:
+            break
+        page += 1
+    return results[:max_results]
+
+
+def repo_path(owner: str, repo: str) -> str:
+    """API-Pfad eines Repositories."""
+    return f"/repos/{quote(owner, safe='')}/{quote(repo, safe='')}"
+
+
+def repo_entry(repo: dict) -> dict:
+    """Kurzform eines Repositories für Listen und Suchergebnisse."""
+    return {
+        "name": repo["name"],
+        "full_name": repo["full_name"],
+        "description": repo["description"],
+        "url": repo["html_url"],
+        "stars": repo["stargazers_count"],
+        "language": repo["language"],
+    }
 
 
 # ============================================================================
@@ -33,7 +227,7 @@ def get_github() -> Github:
 # ============================================================================
 
 @mcp.tool
-def get_repo_info(owner: str, repo: str) -> dict:
+async def get_repo_info(owner: str, repo: str) -> dict:
     """
     Holt Informationen über ein GitHub Repository.
     
@@ -45,29 +239,80 @@ def get_repo_info(owner: str, repo: str) -> dict:
         Dictionary mit Repository-Informationen
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
+        content, _ = await gh_get_cached(repo_path(owner, repo))
+        repository = from_json(content)
+        
+        return {
+            "name": repository["name"],
+            "full_name": repository["full_name"],
+            "description": repository["description"],
+            "url": repository["html_url"],
+            "stars": repository["stargazers_count"],
+            "forks": repository["forks_count"],
+            "open_issues": repository["open_issues_count"],
+            "language": repository["language"],
+            "default_branch": repository["default_branch"],
+            "created_at": repository.get("created_at"),
+            "updated_at": repository.get("updated_at"),
+            "topics": repository.get("topics", []),
+        }
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
+
+
+@mcp.tool
+async def get_repo_overview(owner: str, repo: str, max_items: int = 10) -> dict:
+    """
+    Übersicht eines Repositories mit offenen Issues und PRs in einer
+    einzigen GraphQL-Anfrage (statt mehrerer REST-Aufrufe).
+    
+    Args:
+        owner: Repository-Owner
+        repo: Repository-Name
+        max_items: Maximale Anzahl Issues und PRs (je, max. 100)
+    
+    Returns:
+        Repository-Daten mit den zuletzt aktualisierten offenen Issues und PRs
+    """
+    try:
+        data = await gh_graphql(
+            REPO_OVERVIEW_QUERY, owner=owner, repo=repo, first=max(1, min(max_items, 100))
+        )
+        repository = data["repository"]
+        if repository is None:
+            return {"error": f"Repository {owner}/{repo} nicht gefunden"}
+        
+        def author(node):
+            return node["author"]["login"] if node["author"] else None
         
         return {
-            "name": repository.name,
-            "full_name": repository.full_name,
-            "description": repository.description,
-            "url": repository.html_url,
-            "stars": repository.stargazers_count,
-            "forks": repository.forks_count,
-            "open_issues": repository.open_issues_count,
-            "language": repository.language,
-            "default_branch": repository.default_branch,
-            "created_at": repository.created_at.isoformat() if repository.created_at else None,
-            "updated_at": repository.updated_at.isoformat() if repository.updated_at else None,
-            "topics": repository.get_topics(),
+            "name": repository["name"],
+            "full_name": repository["nameWithOwner"],
+            "description": repository["description"],
+            "url": repository["url"],
+            "stars": repository["stargazerCount"],
+            "forks": repository["forkCount"],
+            "language": (repository["primaryLanguage"] or {}).get("name"),
+            "default_branch": (repository["defaultBranchRef"] or {}).get("name"),
+            "open_issues": repository["issues"]["totalCount"],
+            "issues": [
+                {"number": i["number"], "title": i["title"], "url": i["url"],
+                 "author": author(i), "updated_at": i["updatedAt"]}
+                for i in repository["issues"]["nodes"]
+            ],
+            "open_pull_requests": repository["pullRequests"]["totalCount"],
+            "pull_requests": [
+                {"number": pr["number"], "title": pr["title"], "url": pr["url"],
+                 "author": author(pr), "draft": pr["isDraft"], "updated_at": pr["updatedAt"]}
+                for pr in repository["pullRequests"]["nodes"]
+            ],
         }
-    except GithubException as e:
-        return {"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
 
 
 @mcp.tool
-def list_repos(username: str, max_results: int = 10) -> list[dict]:
+async def list_repos(username: str, max_results: int = 10) -> list[dict]:
     """
     Listet Repositories eines Users oder einer Organisation.
     
@@ -79,27 +324,13 @@ def list_repos(username: str, max_results: int = 10) -> list[dict]:
         Liste von Repository-Informationen
     """
     try:
-        g = get_github()
-        user = g.get_user(username)
-        repos = []
-        
-        for repo in user.get_repos()[:max_results]:
-            repos.append({
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "url": repo.html_url,
-                "stars": repo.stargazers_count,
-                "language": repo.language,
-            })
-        
-        return repos
-    except GithubException as e:
-        return [{"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}]
+        return [repo_entry(repo) for repo in await gh_list(f"/users/{quote(username, safe='')}/repos", max_results)]
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return [{"error": f"GitHub API Fehler: {e}"}]
 
 
 @mcp.tool
-def search_repos(query: str, max_results: int = 10) -> list[dict]:
+async def search_repos(query: str, max_results: int = 10) -> list[dict]:
     """
     Sucht nach Repositories auf GitHub.
     
@@ -111,22 +342,9 @@ def search_repos(query: str, max_results: int = 10) -> list[dict]:
         Liste gefundener Repositories
     """
     try:
-        g = get_github()
-        repos = []
-        
-        for repo in g.search_repositories(query)[:max_results]:
-            repos.append({
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "url": repo.html_url,
-                "stars": repo.stargazers_count,
-                "language": repo.language,
-            })
-        
-        return repos
-    except GithubException as e:
-        return [{"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}]
+        return [repo_entry(repo) for repo in await gh_list("/search/repositories", max_results, items_key="items", q=query)]
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return [{"error": f"GitHub API Fehler: {e}"}]
 
 
 # ============================================================================
@@ -134,7 +352,7 @@ def search_repos(query: str, max_results: int = 10) -> list[dict]:
 # ============================================================================
 
 @mcp.tool
-def list_issues(
+async def list_issues(
     owner: str, 
     repo: str, 
     state: str = "open",
@@ -153,30 +371,26 @@ def list_issues(
         Liste von Issues
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        issues = []
-        
-        for issue in repository.get_issues(state=state)[:max_results]:
-            if not issue.pull_request:  # Nur echte Issues, keine PRs
-                issues.append({
-                    "number": issue.number,
-                    "title": issue.title,
-                    "state": issue.state,
-                    "url": issue.html_url,
-                    "author": issue.user.login,
-                    "labels": [l.name for l in issue.labels],
-                    "created_at": issue.created_at.isoformat(),
-                    "comments": issue.comments,
-                })
-        
-        return issues
-    except GithubException as e:
-        return [{"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}]
+        return [
+            {
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"],
+                "url": issue["html_url"],
+                "author": issue["user"]["login"],
+                "labels": list(map(_name, issue["labels"])),
+                "created_at": issue["created_at"],
+                "comments": issue["comments"],
+            }
+            for issue in await gh_list(f"{repo_path(owner, repo)}/issues", max_results, state=state)
+            if "pull_request" not in issue  # Nur echte Issues, keine PRs
+        ]
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return [{"error": f"GitHub API Fehler: {e}"}]
 
 
 @mcp.tool
-def get_issue(owner: str, repo: str, issue_number: int) -> dict:
+async def get_issue(owner: str, repo: str, issue_number: int) -> dict:
     """
     Holt Details zu einem spezifischen Issue.
     
@@ -189,34 +403,32 @@ def get_issue(owner: str, repo: str, issue_number: int) -> dict:
         Issue-Details
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        issue = repository.get_issue(issue_number)
+        issue = await gh_get(f"{repo_path(owner, repo)}/issues/{issue_number}")
         
         return {
-            "number": issue.number,
-            "title": issue.title,
-            "body": issue.body,
-            "state": issue.state,
-            "url": issue.html_url,
-            "author": issue.user.login,
-            "labels": [l.name for l in issue.labels],
-            "assignees": [a.login for a in issue.assignees],
-            "created_at": issue.created_at.isoformat(),
-            "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
-            "comments": issue.comments,
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "state": issue["state"],
+            "url": issue["html_url"],
+            "author": issue["user"]["login"],
+            "labels": list(map(_name, issue["labels"])),
+            "assignees": list(map(_login, issue["assignees"])),
+            "created_at": issue["created_at"],
+            "updated_at": issue.get("updated_at"),
+            "comments": issue["comments"],
         }
-    except GithubException as e:
-        return {"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
 
 
 @mcp.tool
-def create_issue(
+async def create_issue(
     owner: str, 
     repo: str, 
     title: str, 
     body: str = "",
-    labels: list[str] = []
+    labels: Optional[list[str]] = None
 ) -> dict:
     """
     Erstellt ein neues Issue.
@@ -232,18 +444,20 @@ def create_issue(
         Erstelltes Issue
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        issue = repository.create_issue(title=title, body=body, labels=labels)
+        payload = {"title": title, "body": body}
+        if labels:
+            payload["labels"] = labels
+        response = await gh_request("POST", f"{repo_path(owner, repo)}/issues", json=payload)
+        issue = from_json(response.content)
         
         return {
             "success": True,
-            "number": issue.number,
-            "title": issue.title,
-            "url": issue.html_url,
+            "number": issue["number"],
+            "title": issue["title"],
+            "url": issue["html_url"],
         }
-    except GithubException as e:
-        return {"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
 
 
 # ============================================================================
@@ -251,11 +465,12 @@ def create_issue(
 # ============================================================================
 
 @mcp.tool
-def list_pull_requests(
+async def list_pull_requests(
     owner: str, 
     repo: str, 
     state: str = "open",
-    max_results: int = 10
+    max_results: int = 10,
+    enrich: bool = False
 ) -> list[dict]:
     """
     Listet Pull Requests eines Repositories.
@@ -265,35 +480,58 @@ def list_pull_requests(
         repo: Repository-Name
         state: PR-Status ("open", "closed", "all")
         max_results: Maximale Anzahl Ergebnisse
+        enrich: Details (mergeable, Änderungsumfang) je PR parallel nachladen
     
     Returns:
         Liste von Pull Requests
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        prs = []
+        prs = [
+            {
+                "number": pr["number"],
+                "title": pr["title"],
+                "state": pr["state"],
+                "url": pr["html_url"],
+                "author": pr["user"]["login"],
+                "head": pr["head"]["ref"],
+                "base": pr["base"]["ref"],
+                "created_at": pr["created_at"],
+                # Die Liste enthält kein "merged"; merged_at ist gleichwertig
+                "merged": pr.get("merged_at") is not None,
+            }
+            for pr in await gh_list(f"{repo_path(owner, repo)}/pulls", max_results, state=state)
+        ]
         
-        for pr in repository.get_pulls(state=state)[:max_results]:
-            prs.append({
-                "number": pr.number,
-                "title": pr.title,
-                "state": pr.state,
-                "url": pr.html_url,
-                "author": pr.user.login,
-                "head": pr.head.ref,
-                "base": pr.base.ref,
-                "created_at": pr.created_at.isoformat(),
-                "merged": pr.merged,
-            })
+        if enrich and prs:
+            # Details parallel holen, begrenzt wegen Rate-Limit
+            sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            
+            async def fetch(number):
+                async with sem:
+                    return await gh_get(f"{repo_path(owner, repo)}/pulls/{number}")
+            
+            details = await asyncio.gather(
+                *(fetch(pr["number"]) for pr in prs), return_exceptions=True
+            )
+            for pr, detail in zip(prs, details):
+                if isinstance(detail, Exception):
+                    pr["details_error"] = str(detail)
+                    continue
+                pr.update({
+                    "mergeable": detail["mergeable"],
+                    "additions": detail["additions"],
+                    "deletions": detail["deletions"],
+                    "changed_files": detail["changed_files"],
+                    "commits": detail["commits"],
+                })
         
         return prs
-    except GithubException as e:
-        return [{"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}]
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return [{"error": f"GitHub API Fehler: {e}"}]
 
 
 @mcp.tool
-def get_pull_request(owner: str, repo: str, pr_number: int) -> dict:
+async def get_pull_request(owner: str, repo: str, pr_number: int) -> dict:
     """
     Holt Details zu einem spezifischen Pull Request.
     
@@ -306,29 +544,27 @@ def get_pull_request(owner: str, repo: str, pr_number: int) -> dict:
         Pull Request Details
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        pr = repository.get_pull(pr_number)
+        pr = await gh_get(f"{repo_path(owner, repo)}/pulls/{pr_number}")
         
         return {
-            "number": pr.number,
-            "title": pr.title,
-            "body": pr.body,
-            "state": pr.state,
-            "url": pr.html_url,
-            "author": pr.user.login,
-            "head": pr.head.ref,
-            "base": pr.base.ref,
-            "mergeable": pr.mergeable,
-            "merged": pr.merged,
-            "additions": pr.additions,
-            "deletions": pr.deletions,
-            "changed_files": pr.changed_files,
-            "commits": pr.commits,
-            "created_at": pr.created_at.isoformat(),
+            "number": pr["number"],
+            "title": pr["title"],
+            "body": pr["body"],
+            "state": pr["state"],
+            "url": pr["html_url"],
+            "author": pr["user"]["login"],
+            "head": pr["head"]["ref"],
+            "base": pr["base"]["ref"],
+            "mergeable": pr["mergeable"],
+            "merged": pr["merged"],
+            "additions": pr["additions"],
+            "deletions": pr["deletions"],
+            "changed_files": pr["changed_files"],
+            "commits": pr["commits"],
+            "created_at": pr["created_at"],
         }
-    except GithubException as e:
-        return {"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
 
 
 # ============================================================================
@@ -336,7 +572,7 @@ def get_pull_request(owner: str, repo: str, pr_number: int) -> dict:
 # ============================================================================
 
 @mcp.tool
-def get_file_content(
+async def get_file_content(
     owner: str, 
     repo: str, 
     path: str,
@@ -355,28 +591,37 @@ def get_file_content(
         Dateiinhalt und Metadaten
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        content = repository.get_contents(path, ref=ref)
+        # Rohinhalt statt Base64-JSON: ca. ein Drittel weniger Daten, kein Dekodieren
+        data, content_type = await gh_get_cached(
+            f"{repo_path(owner, repo)}/contents/{quote(path)}",
+            accept="application/vnd.github.raw",
+            immutable=bool(COMMIT_SHA_RE.fullmatch(ref)),
+            ref=ref
+        )
         
-        if isinstance(content, list):
-            return {"error": "Pfad ist ein Verzeichnis, keine Datei"}
+        # Verzeichnisse liefert GitHub trotzdem als JSON-Liste
+        if content_type.startswith("application/json"):
+            if isinstance(from_json(data), list):
+                return {"error": "Pfad ist ein Verzeichnis, keine Datei"}
+        
+        # Blob-SHA wie von Git berechnet, spart die Metadaten-Anfrage
+        sha = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
         
         return {
-            "name": content.name,
-            "path": content.path,
-            "size": content.size,
-            "encoding": content.encoding,
-            "content": content.decoded_content.decode("utf-8"),
-            "sha": content.sha,
-            "url": content.html_url,
+            "name": path.rstrip("/").rsplit("/", 1)[-1],
+            "path": path.strip("/"),
+            "size": len(data),
+            "encoding": "utf-8",
+            "content": data.decode("utf-8"),
+            "sha": sha,
+            "url": f"{GITHUB_WEB_URL}/{owner}/{repo}/blob/{quote(ref)}/{quote(path.strip('/'))}",
         }
-    except GithubException as e:
-        return {"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
 
 
 @mcp.tool
-def list_directory(
+async def list_directory(
     owner: str, 
     repo: str, 
     path: str = "",
@@ -395,25 +640,25 @@ def list_directory(
         Liste von Dateien und Verzeichnissen
     """
     try:
-        g = get_github()
-        repository = g.get_repo(f"{owner}/{repo}")
-        contents = repository.get_contents(path, ref=ref)
+        contents = await gh_get(f"{repo_path(owner, repo)}/contents/{quote(path)}", ref=ref)
         
         if not isinstance(contents, list):
             contents = [contents]
         
-        items = []
+        # Nach Namen sortieren (Schlüssel in C), dann stabil Verzeichnisse vor Dateien
+        contents.sort(key=_name)
+        dirs, files = [], []
         for item in contents:
-            items.append({
-                "name": item.name,
-                "path": item.path,
-                "type": item.type,  # "file" oder "dir"
-                "size": item.size if item.type == "file" else None,
+            (dirs if item["type"] == "dir" else files).append({
+                "name": item["name"],
+                "path": item["path"],
+                "type": item["type"],  # "file" oder "dir"
+                "size": item["size"] if item["type"] == "file" else None,
             })
         
-        return sorted(items, key=lambda x: (x["type"] != "dir", x["name"]))
-    except GithubException as e:
-        return [{"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}]
+        return dirs + files
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return [{"error": f"GitHub API Fehler: {e}"}]
 
 
 # ============================================================================
@@ -421,7 +666,7 @@ def list_directory(
 # ============================================================================
 
 @mcp.tool
-def get_user_info(username: str) -> dict:
+async def get_user_info(username: str) -> dict:
     """
     Holt Informationen über einen GitHub User.
     
@@ -432,23 +677,22 @@ def get_user_info(username: str) -> dict:
         User-Informationen
     """
     try:
-        g = get_github()
-        user = g.get_user(username)
+        user = await gh_get(f"/users/{quote(username, safe='')}")
         
         return {
-            "login": user.login,
-            "name": user.name,
-            "bio": user.bio,
-            "company": user.company,
-            "location": user.location,
-            "url": user.html_url,
-            "public_repos": user.public_repos,
-            "followers": user.followers,
-            "following": user.following,
-            "created_at": user.created_at.isoformat() if user.created_at else None,
+            "login": user["login"],
+            "name": user.get("name"),
+            "bio": user.get("bio"),
+            "company": user.get("company"),
+            "location": user.get("location"),
+            "url": user["html_url"],
+            "public_repos": user.get("public_repos"),
+            "followers": user.get("followers"),
+            "following": user.get("following"),
+            "created_at": user.get("created_at"),
         }
-    except GithubException as e:
-        return {"error": f"GitHub API Fehler: {e.data.get('message', str(e))}"}
+    except (GitHubAPIError, httpx.HTTPError) as e:
+        return {"error": f"GitHub API Fehler: {e}"}
 
 
 # ============================================================================
@@ -456,15 +700,14 @@ def get_user_info(username: str) -> dict:
 # ============================================================================
 
 @mcp.resource("github://authenticated-user")
-def get_authenticated_user() -> str:
+async def get_authenticated_user() -> str:
     """Informationen über den authentifizierten User"""
     try:
-        g = get_github()
-        user = g.get_user()
+        user = await gh_get("/user")
         return json.dumps({
-            "login": user.login,
-            "name": user.name,
-            "email": user.email,
+            "login": user["login"],
+            "name": user.get("name"),
+            "email": user.get("email"),
         }, indent=2)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -483,4 +726,12 @@ if __name__ == "__main__":
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
     
+    # libuv-Eventloop auf POSIX (weniger Overhead pro Task), falls installiert
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    
     mcp.run()
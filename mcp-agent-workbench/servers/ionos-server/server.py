@@ -12,10 +12,17 @@ API Docs: https://developer.hosting.ionos.de/docs/dns
 """
 
 import os
+import importlib.util
+import asyncio
+import functools
+import random
+import time
+from collections import OrderedDict
 import httpx
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic_core import from_json
+from typing import Annotated, Optional
 from datetime import datetime
 
 # Server initialisieren
@@ -29,20 +36,206 @@ IONOS_API_KEY = os.getenv("IONOS_API_KEY", "")
 IONOS_API_URL = "https://api.hosting.ionos.com"
 DNS_API_URL = "https://dns.api.ionos.com/v1"
 
+# Maximal gleichzeitige Anfragen an die IONOS API
+MAX_CONCURRENT_REQUESTS = 8
 
-def get_headers():
-    """API Headers mit Key"""
-    if not IONOS_API_KEY:
-        raise ValueError("IONOS_API_KEY nicht konfiguriert! Bitte in .env setzen.")
-    return {
-        "X-API-Key": IONOS_API_KEY,
-        "Content-Type": "application/json"
+# Wiederholungen bei Rate-Limit (HTTP 429) und maximale Wartezeit (Sekunden)
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 30.0
+
+# Maximale Anzahl gemerkter Antworten für bedingte GETs
+COND_CACHE_SIZE = 128
+
+# Zonen-Liste ändert sich selten - so lange (Sekunden) im Speicher halten
+ZONES_CACHE_TTL = 120
+
+
+# HTTP Client (wird bei Bedarf initialisiert, danach von allen Tools geteilt)
+_http_client: Optional[httpx.AsyncClient] = None
+
+# HTTP/2 nur, wenn das optionale h2-Paket installiert ist
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class RateLimitRetryTransport(httpx.AsyncHTTPTransport):
+    """Transport, der Anfragen bei HTTP 429 mit Backoff und Jitter wiederholt."""
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(MAX_RETRIES):
+            response = await super().handle_async_request(request)
+            if response.status_code != 429:
+                return response
+            await response.aclose()
+            await asyncio.sleep(retry_delay(response, attempt))
+        return await super().handle_async_request(request)
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Wartezeit vor dem nächsten Versuch: Retry-After oder exponentiell mit Jitter."""
+    retry_after = response.headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    return min(2 ** attempt + random.uniform(0, 1), MAX_RETRY_DELAY)
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Holt oder erstellt den HTTP Client (Keep-Alive statt TLS-Handshake pro Aufruf).
+    Die API-Header werden einmalig als Client-Standard gesetzt.
+    
+    Raises:
+        ValueError: Wenn IONOS_API_KEY fehlt
+    """
+    global _http_client
+    if _http_client is None:
+        if not IONOS_API_KEY:
+            raise ValueError("IONOS_API_KEY nicht konfiguriert! Bitte in .env setzen.")
+        _http_client = httpx.AsyncClient(
+            base_url=DNS_API_URL,
+            headers={
+                "X-API-Key": IONOS_API_KEY,
+                "Content-Type": "application/json"
+            },
+            transport=RateLimitRetryTransport(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=10)
+            ),
+            timeout=30.0
+        )
+    return _http_client
+
+
+# Bedingte GETs: (Pfad, Parameter) -> (Validator-Header, Daten)
+_cond_cache: OrderedDict = OrderedDict()
+
+
+async def get_json(path: str, timeout: Optional[float] = None, **params):
+    """
+    GET mit ETag/Last-Modified. Bekannte Antworten werden bedingt
+    nachgefragt; bei 304 (ohne Body) kommen die gemerkten Daten zurück.
+    
+    Args:
+        path: API-Pfad relativ zu DNS_API_URL
+        timeout: Abweichender Timeout für die Anfrage
+        
+    Returns:
+        Dekodierte JSON-Antwort
+    """
+    client = await get_client()
+    key = (path, tuple(sorted(params.items())))
+    cached = _cond_cache.get(key)
+    kwargs = {"timeout": timeout} if timeout else {}
+    response = await client.get(
+        path, params=params or None, headers=cached[0] if cached else None, **kwargs
+    )
+    if response.status_code == 304 and cached:
+        _cond_cache.move_to_end(key)
+        return cached[1]
+    response.raise_for_status()
+    data = from_json(response.content)
+    
+    validators = {}
+    if "etag" in response.headers:
+        validators["If-None-Match"] = response.headers["etag"]
+    if "last-modified" in response.headers:
+        validators["If-Modified-Since"] = response.headers["last-modified"]
+    if validators:
+        _cond_cache[key] = (validators, data)
+        _cond_cache.move_to_end(key)
+        while len(_cond_cache) > COND_CACHE_SIZE:
+            _cond_cache.popitem(last=False)
+    return data
+
+
+# Zonen-Cache: (Zeitpunkt, Zonen)
+_zones_cache: Optional[tuple[float, list]] = None
+
+
+async def get_zones(refresh: bool = False, timeout: Optional[float] = None) -> list:
+    """
+    Holt die Zonen-Liste, innerhalb von ZONES_CACHE_TTL aus dem Cache.
+    
+    Args:
+        refresh: Cache ignorieren und neu laden
+        timeout: Abweichender Timeout für die Anfrage
+        
+    Returns:
+        Liste der Zonen wie von /zones geliefert
+    """
+    global _zones_cache
+    now = time.monotonic()
+    if not refresh and _zones_cache and now - _zones_cache[0] < ZONES_CACHE_TTL:
+        return _zones_cache[1]
+    _zones_cache = (now, await get_json("/zones", timeout=timeout))
+    return _zones_cache[1]
+
+
+# Wiederkehrende Tool-Parameter
+ZoneId = Annotated[str, Field(description="Zone-ID")]
+
+
+class DNSRecordInput(BaseModel):
+    """Ein neu anzulegender DNS-Record"""
+    name: str = Field(description="Record-Name (z.B. 'www' oder '@' für Root)")
+    type: str = Field(description="Record-Typ: A, AAAA, CNAME, MX, TXT, NS, SRV")
+    content: str = Field(description="Record-Inhalt (z.B. IP-Adresse für A-Record)")
+    ttl: int = Field(default=3600, description="Time-to-Live in Sekunden")
+    priority: Optional[int] = Field(default=None, description="Priorität (nur für MX/SRV)")
+
+
+def record_payload(record: DNSRecordInput) -> dict:
+    """API-Darstellung eines neuen Records"""
+    data = {
+        "name": record.name,
+        "type": record.type.upper(),
+        "content": record.content,
+        "ttl": record.ttl,
+        "disabled": False
     }
+    if record.priority is not None:
+        data["prio"] = record.priority
+    return data
+
+
+async def post_records(zone_id: str, records: list[DNSRecordInput]) -> list[dict]:
+    """
+    Legt alle Records mit einer einzigen Anfrage an (die API nimmt eine Liste).
+    
+    Returns:
+        Die gesendeten Record-Daten
+    """
+    payload = [record_payload(r) for r in records]
+    client = await get_client()
+    response = await client.post(f"/zones/{zone_id}/records", json=payload)
+    response.raise_for_status()
+    return payload
+
+
+def ionos_errors(func):
+    """
+    Einheitliche Fehlerantworten für die Tools.
+    Rate-Limits (429) wiederholt bereits der Transport.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except httpx.HTTPStatusError as e:
+            return {"success": False, "error": f"API Fehler: {e.response.status_code}", "details": e.response.text}
+        except ValueError as e:
+            error = {"success": False, "error": str(e)}
+            if not IONOS_API_KEY:
+                error["hint"] = "IONOS_API_KEY in .env setzen"
+            return error
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    return wrapper
 
 
 # ==================== DNS TOOLS ====================
 
 @mcp.tool()
+@ionos_errors
 async def list_dns_zones() -> dict:
     """
     Liste alle DNS-Zonen (Domains) im IONOS-Account.
@@ -50,30 +243,17 @@ async def list_dns_zones() -> dict:
     Returns:
         Liste aller DNS-Zonen mit ID und Name
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{DNS_API_URL}/zones",
-                headers=get_headers(),
-                timeout=30.0
-            )
-            response.raise_for_status()
-            zones = response.json()
-            return {
-                "success": True,
-                "count": len(zones),
-                "zones": [{"id": z.get("id"), "name": z.get("name"), "type": z.get("type")} for z in zones]
-            }
-    except ValueError as e:
-        return {"success": False, "error": str(e), "hint": "IONOS_API_KEY in .env setzen"}
-    except httpx.HTTPStatusError as e:
-        return {"success": False, "error": f"API Fehler: {e.response.status_code}", "details": e.response.text}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    zones = await get_zones()
+    return {
+        "success": True,
+        "count": len(zones),
+        "zones": [{"id": z.get("id"), "name": z.get("name"), "type": z.get("type")} for z in zones]
+    }
 
 
 @mcp.tool()
-async def get_dns_zone(zone_id: str = Field(description="Zone-ID oder Domain-Name")) -> dict:
+@ionos_errors
+async def get_dns_zone(zone_id: Annotated[str, Field(description="Zone-ID oder Domain-Name")]) -> dict:
     """
     Zeige Details einer DNS-Zone inkl. aller Records.
     
@@ -83,40 +263,27 @@ async def get_dns_zone(zone_id: str = Field(description="Zone-ID oder Domain-Nam
     Returns:
         Alle DNS-Records der Zone
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{DNS_API_URL}/zones/{zone_id}",
-                headers=get_headers(),
-                timeout=30.0
-            )
-            response.raise_for_status()
-            zone = response.json()
-            return {
-                "success": True,
-                "zone": {
-                    "id": zone.get("id"),
-                    "name": zone.get("name"),
-                    "type": zone.get("type")
-                },
-                "records": zone.get("records", [])
-            }
-    except ValueError as e:
-        return {"success": False, "error": str(e)}
-    except httpx.HTTPStatusError as e:
-        return {"success": False, "error": f"API Fehler: {e.response.status_code}"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    zone = await get_json(f"/zones/{zone_id}")
+    return {
+        "success": True,
+        "zone": {
+            "id": zone.get("id"),
+            "name": zone.get("name"),
+            "type": zone.get("type")
+        },
+        "records": zone.get("records", [])
+    }
 
 
 @mcp.tool()
+@ionos_errors
 async def create_dns_record(
-    zone_id: str = Field(description="Zone-ID"),
-    name: str = Field(description="Record-Name (z.B. 'www' oder '@' für Root)"),
-    record_type: str = Field(description="Record-Typ: A, AAAA, CNAME, MX, TXT, NS, SRV"),
-    content: str = Field(description="Record-Inhalt (z.B. IP-Adresse für A-Record)"),
-    ttl: int = Field(default=3600, description="Time-to-Live in Sekunden"),
-    priority: Optional[int] = Field(default=None, description="Priorität (nur für MX/SRV)")
+    zone_id: ZoneId,
+    name: Annotated[str, Field(description="Record-Name (z.B. 'www' oder '@' für Root)")],
+    record_type: Annotated[str, Field(description="Record-Typ: A, AAAA, CNAME, MX, TXT, NS, SRV")],
+    content: Annotated[str, Field(description="Record-Inhalt (z.B. IP-Adresse für A-Record)")],
+    ttl: Annotated[int, Field(description="Time-to-Live in Sekunden")] = 3600,
+    priority: Annotated[Optional[int], Field(description="Priorität (nur für MX/SRV)")] = None
 ) -> dict:
     """
     Erstelle einen neuen DNS-Record.
@@ -132,44 +299,50 @@ async def create_dns_record(
     Returns:
         Erstellter Record
     """
-    try:
-        record_data = {
-            "name": name,
-            "type": record_type.upper(),
-            "content": content,
-            "ttl": ttl,
-            "disabled": False
-        }
-        if priority is not None:
-            record_data["prio"] = priority
-            
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{DNS_API_URL}/zones/{zone_id}/records",
-                headers=get_headers(),
-                json=[record_data],
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return {
-                "success": True,
-                "message": f"DNS-Record {record_type} für '{name}' erstellt",
-                "record": record_data
-            }
-    except ValueError as e:
-        return {"success": False, "error": str(e)}
-    except httpx.HTTPStatusError as e:
-        return {"success": False, "error": f"API Fehler: {e.response.status_code}", "details": e.response.text}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    record = DNSRecordInput(
+        name=name, type=record_type, content=content, ttl=ttl, priority=priority
+    )
+    record_data, = await post_records(zone_id, [record])
+    return {
+        "success": True,
+        "message": f"DNS-Record {record_type} für '{name}' erstellt",
+        "record": record_data
+    }
 
 
 @mcp.tool()
+@ionos_errors
+async def create_dns_records(
+    zone_id: ZoneId,
+    records: Annotated[list[DNSRecordInput], Field(description="Anzulegende Records")]
+) -> dict:
+    """
+    Erstelle mehrere DNS-Records mit einer einzigen API-Anfrage.
+    
+    Args:
+        zone_id: ID der DNS-Zone
+        records: Liste von Records mit name, type, content, ttl, priority
+        
+    Returns:
+        Erstellte Records
+    """
+    if not records:
+        return {"success": False, "error": "Keine Records angegeben"}
+    created = await post_records(zone_id, records)
+    return {
+        "success": True,
+        "message": f"{len(created)} DNS-Records erstellt",
+        "records": created
+    }
+
+
+@mcp.tool()
+@ionos_errors
 async def update_dns_record(
-    zone_id: str = Field(description="Zone-ID"),
-    record_id: str = Field(description="Record-ID"),
-    content: str = Field(description="Neuer Record-Inhalt"),
-    ttl: Optional[int] = Field(default=None, description="Neue TTL")
+    zone_id: ZoneId,
+    record_id: Annotated[str, Field(description="Record-ID")],
+    content: Annotated[str, Field(description="Neuer Record-Inhalt")],
+    ttl: Annotated[Optional[int], Field(description="Neue TTL")] = None
 ) -> dict:
     """
     Aktualisiere einen bestehenden DNS-Record.
@@ -183,36 +356,28 @@ async def update_dns_record(
     Returns:
         Aktualisierter Record
     """
-    try:
-        update_data = {"content": content}
-        if ttl:
-            update_data["ttl"] = ttl
-            
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{DNS_API_URL}/zones/{zone_id}/records/{record_id}",
-                headers=get_headers(),
-                json=update_data,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return {
-                "success": True,
-                "message": "DNS-Record aktualisiert",
-                "new_content": content
-            }
-    except ValueError as e:
-        return {"success": False, "error": str(e)}
-    except httpx.HTTPStatusError as e:
-        return {"success": False, "error": f"API Fehler: {e.response.status_code}"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    update_data = {"content": content}
+    if ttl:
+        update_data["ttl"] = ttl
+        
+    client = await get_client()
+    response = await client.put(
+        f"/zones/{zone_id}/records/{record_id}",
+        json=update_data
+    )
+    response.raise_for_status()
+    return {
+        "success": True,
+        "message": "DNS-Record aktualisiert",
+        "new_content": content
+    }
 
 
 @mcp.tool()
+@ionos_errors
 async def delete_dns_record(
-    zone_id: str = Field(description="Zone-ID"),
-    record_id: str = Field(description="Record-ID zum Löschen")
+    zone_id: ZoneId,
+    record_id: Annotated[str, Field(description="Record-ID zum Löschen")]
 ) -> dict:
     """
     Lösche einen DNS-Record.
@@ -224,24 +389,13 @@ async def delete_dns_record(
     Returns:
         Bestätigung
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{DNS_API_URL}/zones/{zone_id}/records/{record_id}",
-                headers=get_headers(),
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return {
-                "success": True,
-                "message": f"DNS-Record {record_id} gelöscht"
-            }
-    except ValueError as e:
-        return {"success": False, "error": str(e)}
-    except httpx.HTTPStatusError as e:
-        return {"success": False, "error": f"API Fehler: {e.response.status_code}"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    client = await get_client()
+    response = await client.delete(f"/zones/{zone_id}/records/{record_id}")
+    response.raise_for_status()
+    return {
+        "success": True,
+        "message": f"DNS-Record {record_id} gelöscht"
+    }
 
 
 # ==================== DOMAIN TOOLS ====================
@@ -271,20 +425,14 @@ async def check_ionos_config() -> dict:
     
     # Test API-Verbindung
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{DNS_API_URL}/zones",
-                headers=get_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            zones = response.json()
-            return {
-                "success": True,
-                "config": config_status,
-                "connection": "OK",
-                "zones_found": len(zones)
-            }
+        # Verbindungstest: immer frisch laden (aktualisiert dabei den Cache)
+        zones = await get_zones(refresh=True, timeout=10.0)
+        return {
+            "success": True,
+            "config": config_status,
+            "connection": "OK",
+            "zones_found": len(zones)
+        }
     except httpx.HTTPStatusError as e:
         return {
             "success": False,
@@ -301,9 +449,10 @@ async def check_ionos_config() -> dict:
 
 
 @mcp.tool()
+@ionos_errors
 async def quick_dns_update(
-    domain: str = Field(description="Domain-Name (z.B. example.com)"),
-    ip_address: str = Field(description="Neue IP-Adresse")
+    domain: Annotated[str, Field(description="Domain-Name (z.B. example.com)")],
+    ip_address: Annotated[str, Field(description="Neue IP-Adresse")]
 ) -> dict:
     """
     Schnelle Aktualisierung der Haupt-IP einer Domain (A-Record für @).
@@ -315,81 +464,60 @@ async def quick_dns_update(
     Returns:
         Ergebnis der Aktualisierung
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            # Erst Zone finden
-            response = await client.get(
-                f"{DNS_API_URL}/zones",
-                headers=get_headers(),
-                timeout=30.0
-            )
-            response.raise_for_status()
-            zones = response.json()
-            
-            # Zone mit passendem Namen finden
-            zone = next((z for z in zones if z.get("name") == domain), None)
-            if not zone:
-                return {
-                    "success": False,
-                    "error": f"Domain '{domain}' nicht gefunden",
-                    "available_zones": [z.get("name") for z in zones]
-                }
-            
-            zone_id = zone.get("id")
-            
-            # Records holen
-            response = await client.get(
-                f"{DNS_API_URL}/zones/{zone_id}",
-                headers=get_headers(),
-                timeout=30.0
-            )
-            response.raise_for_status()
-            zone_data = response.json()
-            
-            # A-Record für Root (@) finden
-            records = zone_data.get("records", [])
-            root_a = next((r for r in records if r.get("type") == "A" and r.get("name") in ["@", domain, ""]), None)
-            
-            if root_a:
-                # Update existierenden Record
-                record_id = root_a.get("id")
-                response = await client.put(
-                    f"{DNS_API_URL}/zones/{zone_id}/records/{record_id}",
-                    headers=get_headers(),
-                    json={"content": ip_address},
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return {
-                    "success": True,
-                    "action": "updated",
-                    "domain": domain,
-                    "old_ip": root_a.get("content"),
-                    "new_ip": ip_address
-                }
-            else:
-                # Neuen Record erstellen
-                response = await client.post(
-                    f"{DNS_API_URL}/zones/{zone_id}/records",
-                    headers=get_headers(),
-                    json=[{"name": "@", "type": "A", "content": ip_address, "ttl": 3600}],
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return {
-                    "success": True,
-                    "action": "created",
-                    "domain": domain,
-                    "new_ip": ip_address
-                }
-                
-    except ValueError as e:
-        return {"success": False, "error": str(e)}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    client = await get_client()
+    # Erst Zone finden
+    zones = await get_zones()
+    
+    # Zone mit passendem Namen finden (bei Cache-Treffer ohne Anfrage)
+    zone = next((z for z in zones if z.get("name") == domain), None)
+    if not zone:
+        # Evtl. neue Zone, die der Cache noch nicht kennt
+        zones = await get_zones(refresh=True)
+        zone = next((z for z in zones if z.get("name") == domain), None)
+    if not zone:
+        return {
+            "success": False,
+            "error": f"Domain '{domain}' nicht gefunden",
+            "available_zones": [z.get("name") for z in zones]
+        }
+    
+    zone_id = zone.get("id")
+    
+    # Nur A-Records holen, serverseitig gefiltert
+    zone_data = await get_json(f"/zones/{zone_id}", recordType="A")
+    
+    # A-Record für Root (@) finden
+    records = zone_data.get("records", [])
+    root_a = next((r for r in records if r.get("type") == "A" and r.get("name") in ["@", domain, ""]), None)
+    
+    if root_a:
+        # Update existierenden Record
+        record_id = root_a.get("id")
+        response = await client.put(
+            f"/zones/{zone_id}/records/{record_id}",
+            json={"content": ip_address}
+        )
+        response.raise_for_status()
+        return {
+            "success": True,
+            "action": "updated",
+            "domain": domain,
+            "old_ip": root_a.get("content"),
+            "new_ip": ip_address
+        }
+    else:
+        # Neuen Record erstellen
+        await post_records(zone_id, [DNSRecordInput(name="@", type="A", content=ip_address)])
+        return {
+            "success": True,
+            "action": "created",
+            "domain": domain,
+            "new_ip": ip_address
+        }
 
 
 @mcp.tool()
+@ionos_errors
 async def list_all_dns_records() -> dict:
     """
     Liste ALLE DNS-Records über ALLE Zonen.
@@ -398,51 +526,52 @@ async def list_all_dns_records() -> dict:
     Returns:
         Komplette DNS-Übersicht
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            # Alle Zonen holen
-            response = await client.get(
-                f"{DNS_API_URL}/zones",
-                headers=get_headers(),
-                timeout=30.0
-            )
-            response.raise_for_status()
-            zones = response.json()
-            
-            all_records = []
-            for zone in zones:
-                zone_id = zone.get("id")
-                zone_name = zone.get("name")
-                
-                # Records dieser Zone holen
-                response = await client.get(
-                    f"{DNS_API_URL}/zones/{zone_id}",
-                    headers=get_headers(),
-                    timeout=30.0
-                )
-                if response.status_code == 200:
-                    zone_data = response.json()
-                    for record in zone_data.get("records", []):
-                        all_records.append({
-                            "zone": zone_name,
-                            "name": record.get("name"),
-                            "type": record.get("type"),
-                            "content": record.get("content"),
-                            "ttl": record.get("ttl")
-                        })
-            
-            return {
-                "success": True,
-                "total_zones": len(zones),
-                "total_records": len(all_records),
-                "records": all_records
-            }
-    except ValueError as e:
-        return {"success": False, "error": str(e)}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    # Alle Zonen holen
+    zones = await get_zones()
+    
+    # Zonen parallel abfragen, begrenzt wegen Rate-Limit
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch(zone_id):
+        async with sem:
+            return await get_json(f"/zones/{zone_id}")
+    
+    results = await asyncio.gather(
+        *(fetch(zone.get("id")) for zone in zones), return_exceptions=True
+    )
+    
+    all_records = []
+    for zone, zone_data in zip(zones, results):
+        if isinstance(zone_data, Exception):
+            continue
+        zone_name = zone.get("name")
+        for record in zone_data.get("records", []):
+            all_records.append({
+                "zone": zone_name,
+                "name": record.get("name"),
+                "type": record.get("type"),
+                "content": record.get("content"),
+                "ttl": record.get("ttl")
+            })
+    
+    return {
+        "success": True,
+        "total_zones": len(zones),
+        "total_records": len(all_records),
+        "records": all_records
+    }
 
 
 # Server starten
 if __name__ == "__main__":
+    import sys
+    
+    # libuv-Eventloop auf POSIX (weniger Overhead pro Task), falls installiert
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    
     mcp.run()
@@ -12,10 +12,17 @@ Verbindet sich mit Remote-Ollama auf Docker-Host
 """
 
 import os
+import asyncio
+import base64
+import functools
+import importlib.util
+import struct
+import time
 import httpx
 from fastmcp import FastMCP
 from pydantic import Field
-from typing import Optional
+from pydantic_core import from_json
+from typing import Literal, Optional
 from datetime import datetime
 
 # Server initialisieren
@@ -27,15 +34,93 @@ mcp = FastMCP(
 # Ollama-Konfiguration (Remote Docker oder lokal)
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://192.168.0.27:11434")
 
+# Max. gleichzeitige Anfragen an Ollama (Ollama arbeitet sie ohnehin nacheinander ab)
+MAX_INFLIGHT = int(os.getenv("OLLAMA_MAX_INFLIGHT", "8"))
+
+# Status-/Listen-Antworten so lange (Sekunden) wiederverwenden; Modell-Infos länger
+CACHE_TTL = float(os.getenv("OLLAMA_CACHE_TTL", "30"))
+MODEL_INFO_TTL = 300
+
+# Micro-Batching für Einzel-Embeddings: Sammelfenster (Sekunden) und max. Batchgröße
+EMBED_BATCH_WINDOW = 0.01
+EMBED_MAX_BATCH = 64
+
+# Blockgröße beim Lesen des /api/pull-Fortschritts-Streams
+PULL_CHUNK_SIZE = 64 * 1024
+
+# Bytes pro GB für Größenangaben
+GB = 1024 ** 3
+
+# HTTP/2 nur, wenn das optionale h2-Paket installiert ist (greift bei https, z.B. hinter Reverse-Proxy)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Kompakte Embedding-Formate: struct-Code (Little Endian) pro Wert
+EMBED_FORMATS = {"f32_b64": "f", "f16_b64": "e"}
+
 
 def get_base_url():
     """Hole Ollama API URL"""
     return OLLAMA_HOST.rstrip("/")
 
 
+# HTTP Client (wird bei Bedarf initialisiert, danach von allen Tools geteilt)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Holt oder erstellt den HTTP Client (Keep-Alive statt Verbindungsaufbau pro Aufruf)."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=get_base_url(),
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(120.0, connect=5.0)
+        )
+    return _http_client
+
+
+# Begrenzt Modell-Anfragen; Status-Checks laufen ohne, Downloads über eigenen Slot
+_ollama_sem = asyncio.Semaphore(MAX_INFLIGHT)
+_pull_sem = asyncio.Semaphore(1)
+
+
+# Gecachte Tool-Antworten: (Tool, Argumente) -> (Zeitpunkt, Antwort)
+_response_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+def ttl_cache(seconds: float):
+    """
+    Erfolgreiche Tool-Antworten für seconds Sekunden wiederverwenden
+    (Modell-Liste, VRAM-Status etc. ändern sich nur im Minutenbereich).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = _response_cache.get(key)
+            if cached and now - cached[0] < seconds:
+                return cached[1]
+            result = await func(*args, **kwargs)
+            if result.get("success"):
+                _response_cache[key] = (now, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def clear_response_cache() -> int:
+    """Alle gecachten Antworten verwerfen (nach Änderungen an Modellen)"""
+    count = len(_response_cache)
+    _response_cache.clear()
+    return count
+
+
 # ==================== STATUS TOOLS ====================
 
 @mcp.tool()
+@ttl_cache(CACHE_TTL)
 async def ollama_status() -> dict:
     """
     Prüfe ob Ollama-Server erreichbar ist.
@@ -44,21 +129,21 @@ async def ollama_status() -> dict:
         Server-Status und Version
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{get_base_url()}/api/version", timeout=10.0)
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "status": "online",
-                    "host": OLLAMA_HOST,
-                    "version": response.json()
-                }
+        client = await get_client()
+        response = await client.get("/api/version", timeout=10.0)
+        if response.status_code == 200:
             return {
-                "success": False,
-                "status": "error",
+                "success": True,
+                "status": "online",
                 "host": OLLAMA_HOST,
-                "http_code": response.status_code
+                "version": from_json(response.content)
             }
+        return {
+            "success": False,
+            "status": "error",
+            "host": OLLAMA_HOST,
+            "http_code": response.status_code
+        }
     except httpx.ConnectError:
         return {
             "success": False,
@@ -72,6 +157,7 @@ async def ollama_status() -> dict:
 
 
 @mcp.tool()
+@ttl_cache(CACHE_TTL)
 async def list_models() -> dict:
     """
     Liste alle lokal verfügbaren Ollama-Modelle.
@@ -80,26 +166,27 @@ async def list_models() -> dict:
         Liste der installierten Modelle mit Größe
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{get_base_url()}/api/tags", timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
-            
-            models = []
-            for m in data.get("models", []):
-                size_gb = m.get("size", 0) / (1024**3)
-                models.append({
-                    "name": m.get("name"),
-                    "size": f"{size_gb:.1f} GB",
-                    "modified": m.get("modified_at"),
-                    "family": m.get("details", {}).get("family")
-                })
-            
-            return {
-                "success": True,
-                "count": len(models),
-                "models": models
+        client = await get_client()
+        async with _ollama_sem:
+            response = await client.get("/api/tags", timeout=30.0)
+        response.raise_for_status()
+        data = from_json(response.content)
+        
+        models = [
+            {
+                "name": m.get("name"),
+                "size": f"{m.get('size', 0) / GB:.1f} GB",
+                "modified": m.get("modified_at"),
+                "family": m.get("details", {}).get("family")
             }
+            for m in data.get("models", [])
+        ]
+        
+        return {
+            "success": True,
+            "count": len(models),
+            "models": models
+        }
     except httpx.ConnectError:
         return {"success": False, "error": "Ollama nicht erreichbar", "host": OLLAMA_HOST}
     except Exception as e:
@@ -107,6 +194,7 @@ async def list_models() -> dict:
 
 
 @mcp.tool()
+@ttl_cache(MODEL_INFO_TTL)
 async def model_info(
     model: str = Field(description="Modell-Name (z.B. llama3.2, mistral, codellama)")
 ) -> dict:
@@ -120,24 +208,25 @@ async def model_info(
         Modell-Architektur, Parameter, Kontext-Länge
     """
     try:
-        async with httpx.AsyncClient() as client:
+        client = await get_client()
+        async with _ollama_sem:
             response = await client.post(
-                f"{get_base_url()}/api/show",
+                "/api/show",
                 json={"name": model},
                 timeout=30.0
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            return {
-                "success": True,
-                "model": model,
-                "license": data.get("license", "")[:200],
-                "modelfile": data.get("modelfile", "")[:500],
-                "parameters": data.get("parameters"),
-                "template": data.get("template"),
-                "details": data.get("details")
-            }
+        response.raise_for_status()
+        data = from_json(response.content)
+        
+        return {
+            "success": True,
+            "model": model,
+            "license": data.get("license", "")[:200],
+            "modelfile": data.get("modelfile", "")[:500],
+            "parameters": data.get("parameters"),
+            "template": data.get("template"),
+            "details": data.get("details")
+        }
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return {"success": False, "error": f"Modell '{model}' nicht gefunden"}
@@ -148,6 +237,18 @@ async def model_info(
 
 # ==================== MODEL MANAGEMENT ====================
 
+def pull_error(lines: bytes) -> Optional[str]:
+    """Erste Fehlermeldung in einem Block von /api/pull-Zeilen (None, wenn keine)"""
+    if b'"error"' not in lines:
+        return None
+    for line in lines.splitlines():
+        if b'"error"' in line:
+            data = from_json(line)
+            if "error" in data:
+                return data["error"]
+    return None
+
+
 @mcp.tool()
 async def pull_model(
     model: str = Field(description="Modell zum Herunterladen (z.B. llama3.2:8b, mistral, codellama)")
@@ -162,29 +263,45 @@ async def pull_model(
         Download-Status
     """
     try:
-        async with httpx.AsyncClient() as client:
-            # Stream für Progress
-            async with client.stream(
-                "POST",
-                f"{get_base_url()}/api/pull",
-                json={"name": model},
-                timeout=None  # Kein Timeout für große Downloads
-            ) as response:
-                last_status = ""
-                async for line in response.aiter_lines():
-                    if line:
-                        import json
-                        data = json.loads(line)
-                        last_status = data.get("status", "")
-                        if "error" in data:
-                            return {"success": False, "error": data["error"]}
-                
-                return {
-                    "success": True,
-                    "model": model,
-                    "status": last_status,
-                    "message": f"Modell '{model}' erfolgreich geladen"
-                }
+        client = await get_client()
+        # Stream für Progress (eigener Slot, blockiert keine Inferenz-Anfragen)
+        async with _pull_sem, client.stream(
+            "POST",
+            "/api/pull",
+            json={"name": model},
+            timeout=None  # Kein Timeout für große Downloads
+        ) as response:
+            # In großen Blöcken lesen statt Zeile für Zeile; nur Fehlerzeilen
+            # und die letzte Zeile parsen, nicht jede Fortschrittsmeldung
+            buffer = b""
+            last_line = b""
+            async for chunk in response.aiter_bytes(PULL_CHUNK_SIZE):
+                buffer += chunk
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                complete, buffer = buffer[:end], buffer[end + 1:]
+                error = pull_error(complete)
+                if error:
+                    return {"success": False, "error": error}
+                complete = complete.rstrip()
+                if complete:
+                    last_line = complete[complete.rfind(b"\n") + 1:]
+            
+            if buffer.strip():
+                error = pull_error(buffer)
+                if error:
+                    return {"success": False, "error": error}
+                last_line = buffer
+            
+            last_status = from_json(last_line).get("status", "") if last_line.strip() else ""
+            clear_response_cache()
+            return {
+                "success": True,
+                "model": model,
+                "status": last_status,
+                "message": f"Modell '{model}' erfolgreich geladen"
+            }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -203,21 +320,25 @@ async def delete_model(
         Bestätigung
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{get_base_url()}/api/delete",
+        client = await get_client()
+        # client.delete() erlaubt keinen Body, daher request()
+        async with _ollama_sem:
+            response = await client.request(
+                "DELETE",
+                "/api/delete",
                 json={"name": model},
                 timeout=30.0
             )
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "message": f"Modell '{model}' gelöscht"
-                }
+        if response.status_code == 200:
+            clear_response_cache()
             return {
-                "success": False,
-                "error": f"Fehler: {response.status_code}"
+                "success": True,
+                "message": f"Modell '{model}' gelöscht"
             }
+        return {
+            "success": False,
+            "error": f"Fehler: {response.status_code}"
+        }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -238,18 +359,20 @@ async def copy_model(
         Bestätigung
     """
     try:
-        async with httpx.AsyncClient() as client:
+        client = await get_client()
+        async with _ollama_sem:
             response = await client.post(
-                f"{get_base_url()}/api/copy",
+                "/api/copy",
                 json={"source": source, "destination": destination},
                 timeout=60.0
             )
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "message": f"Modell kopiert: {source} → {destination}"
-                }
-            return {"success": False, "error": f"Fehler: {response.status_code}"}
+        if response.status_code == 200:
+            clear_response_cache()
+            return {
+                "success": True,
+                "message": f"Modell kopiert: {source} → {destination}"
+            }
+        return {"success": False, "error": f"Fehler: {response.status_code}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -281,9 +404,10 @@ async def chat(
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": message})
         
-        async with httpx.AsyncClient() as client:
+        client = await get_client()
+        async with _ollama_sem:
             response = await client.post(
-                f"{get_base_url()}/api/chat",
+                "/api/chat",
                 json={
                     "model": model,
                     "messages": messages,
@@ -292,19 +416,19 @@ async def chat(
                 },
                 timeout=120.0
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            return {
-                "success": True,
-                "model": model,
-                "response": data.get("message", {}).get("content", ""),
-                "stats": {
-                    "total_duration_ms": data.get("total_duration", 0) / 1_000_000,
-                    "eval_count": data.get("eval_count"),
-                    "tokens_per_second": data.get("eval_count", 0) / max(data.get("eval_duration", 1) / 1_000_000_000, 0.001)
-                }
+        response.raise_for_status()
+        data = from_json(response.content)
+        
+        return {
+            "success": True,
+            "model": model,
+            "response": data.get("message", {}).get("content", ""),
+            "stats": {
+                "total_duration_ms": data.get("total_duration", 0) / 1_000_000,
+                "eval_count": data.get("eval_count"),
+                "tokens_per_second": data.get("eval_count", 0) / max(data.get("eval_duration", 1) / 1_000_000_000, 0.001)
             }
+        }
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return {"success": False, "error": f"Modell '{model}' nicht gefunden. Erst mit pull_model laden!"}
@@ -331,9 +455,10 @@ async def generate(
         Generierter Text
     """
     try:
-        async with httpx.AsyncClient() as client:
+        client = await get_client()
+        async with _ollama_sem:
             response = await client.post(
-                f"{get_base_url()}/api/generate",
+                "/api/generate",
                 json={
                     "model": model,
                     "prompt": prompt,
@@ -342,24 +467,103 @@ async def generate(
                 },
                 timeout=120.0
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            return {
-                "success": True,
-                "model": model,
-                "response": data.get("response", ""),
-                "done": data.get("done"),
-                "context_length": len(data.get("context", []))
-            }
+        response.raise_for_status()
+        data = from_json(response.content)
+        
+        return {
+            "success": True,
+            "model": model,
+            "response": data.get("response", ""),
+            "done": data.get("done"),
+            "context_length": len(data.get("context", []))
+        }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+async def embed(model: str, inputs: list[str]) -> list[list[float]]:
+    """
+    Embeddings für mehrere Texte in einem Aufruf (/api/embed, ein Batch-Durchlauf).
+    
+    Returns:
+        Ein Vektor pro Eingabetext, in gleicher Reihenfolge
+    """
+    client = await get_client()
+    async with _ollama_sem:
+        response = await client.post(
+            "/api/embed",
+            json={"model": model, "input": inputs},
+            timeout=60.0
+        )
+    response.raise_for_status()
+    return from_json(response.content).get("embeddings", [])
+
+
+def encode_embedding(vector: list[float], return_format: str):
+    """
+    Embedding im gewünschten Format: "json" als Liste, sonst als base64-kodierte
+    Little-Endian-Bytes (float32 bzw. float16, 4- bis 8-mal kleiner als JSON).
+    """
+    code = EMBED_FORMATS.get(return_format)
+    if code is None:
+        return vector
+    return base64.b64encode(struct.pack(f"<{len(vector)}{code}", *vector)).decode("ascii")
+
+
+class EmbedBatcher:
+    """
+    Sammelt gleichzeitige Einzel-Embeddings pro Modell und schickt sie
+    gebündelt an /api/embed (ein Batch-Durchlauf statt vieler kleiner).
+    """
+    
+    def __init__(self, window: float, max_batch: int):
+        self.window = window
+        self.max_batch = max_batch
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+    
+    async def submit(self, model: str, text: str) -> list[float]:
+        """Reiht einen Text ein und wartet auf seinen Vektor."""
+        queue = self._queues.get(model)
+        if queue is None:
+            queue = self._queues[model] = asyncio.Queue()
+            self._workers[model] = asyncio.create_task(self._run(model, queue))
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        return await future
+    
+    async def _run(self, model: str, queue: asyncio.Queue):
+        """Worker je Modell: erstes Element abwarten, Fenster lang sammeln, senden."""
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.window)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                vectors = await embed(model, [text for text, _ in batch])
+                if len(vectors) != len(batch):
+                    raise RuntimeError(f"{len(vectors)} Embeddings für {len(batch)} Texte erhalten")
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+
+_embed_batcher = EmbedBatcher(EMBED_BATCH_WINDOW, EMBED_MAX_BATCH)
+
+
 @mcp.tool()
 async def embeddings(
     model: str = Field(description="Embedding-Modell (z.B. nomic-embed-text, mxbai-embed-large)"),
-    text: str = Field(description="Text zum Embedden")
+    text: str = Field(description="Text zum Embedden"),
+    return_preview: bool = Field(default=True, description="Zusätzlich die ersten 10 Werte als Vorschau liefern"),
+    return_format: Literal["json", "f32_b64", "f16_b64"] = Field(default="json", description="Format des Vektors: json, f32_b64 oder f16_b64"),
+    include_full: bool = Field(default=True, description="Vollständigen Vektor mitliefern")
 ) -> dict:
     """
     Generiere Embeddings für einen Text (für Semantic Search, RAG).
@@ -367,28 +571,60 @@ async def embeddings(
     Args:
         model: Embedding-Modell
         text: Der zu verarbeitende Text
+        return_preview: Vorschau der ersten 10 Werte mitliefern
+        return_format: "json" (Liste) oder base64-kodierte float32/float16-Bytes
+        include_full: Vollständigen Vektor mitliefern (sonst nur Dimensionen/Vorschau)
         
     Returns:
         Embedding-Vektor und Dimensionen
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{get_base_url()}/api/embeddings",
-                json={"model": model, "prompt": text},
-                timeout=60.0
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            embedding = data.get("embedding", [])
-            return {
-                "success": True,
-                "model": model,
-                "dimensions": len(embedding),
-                "embedding_preview": embedding[:10] if embedding else [],
-                "full_embedding": embedding
-            }
+        # Gleichzeitige Aufrufe werden zu einem /api/embed-Batch zusammengefasst
+        embedding = await _embed_batcher.submit(model, text)
+        result = {
+            "success": True,
+            "model": model,
+            "dimensions": len(embedding)
+        }
+        if include_full:
+            result["format"] = return_format
+            result["full_embedding"] = encode_embedding(embedding, return_format)
+        if return_preview:
+            result["embedding_preview"] = embedding[:10]
+        return result
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def embeddings_batch(
+    model: str = Field(description="Embedding-Modell (z.B. nomic-embed-text, mxbai-embed-large)"),
+    texts: list[str] = Field(description="Liste der Texte zum Embedden"),
+    return_format: Literal["json", "f32_b64", "f16_b64"] = Field(default="json", description="Format der Vektoren: json, f32_b64 oder f16_b64")
+) -> dict:
+    """
+    Generiere Embeddings für viele Texte in einer Anfrage (statt eines Aufrufs pro Text).
+    
+    Args:
+        model: Embedding-Modell
+        texts: Die zu verarbeitenden Texte
+        return_format: "json" (Listen) oder base64-kodierte float32/float16-Bytes
+        
+    Returns:
+        Ein Embedding-Vektor pro Text und Dimensionen
+    """
+    if not texts:
+        return {"success": False, "error": "Keine Texte angegeben"}
+    try:
+        vectors = await embed(model, texts)
+        return {
+            "success": True,
+            "model": model,
+            "count": len(vectors),
+            "dimensions": len(vectors[0]) if vectors else 0,
+            "format": return_format,
+            "embeddings": [encode_embedding(vector, return_format) for vector in vectors]
+        }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -396,6 +632,7 @@ async def embeddings(
 # ==================== RUNNING MODELS ====================
 
 @mcp.tool()
+@ttl_cache(CACHE_TTL)
 async def list_running() -> dict:
     """
     Zeige aktuell in VRAM geladene Modelle.
@@ -404,32 +641,42 @@ async def list_running() -> dict:
         Liste aktiver Modelle mit VRAM-Nutzung
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{get_base_url()}/api/ps", timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
-            
-            models = []
-            for m in data.get("models", []):
-                size_gb = m.get("size", 0) / (1024**3)
-                vram_gb = m.get("size_vram", 0) / (1024**3)
-                models.append({
-                    "name": m.get("name"),
-                    "size": f"{size_gb:.1f} GB",
-                    "vram": f"{vram_gb:.1f} GB",
-                    "processor": m.get("details", {}).get("processor", "unknown"),
-                    "expires": m.get("expires_at")
-                })
-            
-            return {
-                "success": True,
-                "running_models": models,
-                "count": len(models)
+        client = await get_client()
+        response = await client.get("/api/ps", timeout=10.0)
+        response.raise_for_status()
+        data = from_json(response.content)
+        
+        models = [
+            {
+                "name": m.get("name"),
+                "size": f"{m.get('size', 0) / GB:.1f} GB",
+                "vram": f"{m.get('size_vram', 0) / GB:.1f} GB",
+                "processor": m.get("details", {}).get("processor", "unknown"),
+                "expires": m.get("expires_at")
             }
+            for m in data.get("models", [])
+        ]
+        
+        return {
+            "success": True,
+            "running_models": models,
+            "count": len(models)
+        }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+async def invalidate_ollama_cache() -> dict:
+    """
+    Verwirf gecachte Status-, Modell-Listen- und Modell-Info-Antworten.
+    
+    Returns:
+        Anzahl verworfener Einträge
+    """
+    return {"success": True, "cleared": clear_response_cache()}
+
+
 # Server starten
 if __name__ == "__main__":
     mcp.run()
@@ -10,13 +10,28 @@ Tools für:
 """
 
 import os
+import re
 import json
+import stat
+import asyncio
+import heapq
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.metadata import distributions
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from fastmcp import FastMCP
 from pydantic import Field
 from typing import Optional
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import toml as tomllib
+
 # Server initialisieren
 mcp = FastMCP(
     "Project Manager Server",
@@ -26,32 +41,329 @@ mcp = FastMCP(
 # Basis-Pfad
 BASE_PATH = os.getenv("PROJECTS_BASE_PATH", "d:\\")
 
+# Schwere Ordner, die bei Datei-Scans übersprungen werden
+SKIP_DIRS = {
+    "node_modules", ".git", "venv", ".venv", "__pycache__",
+    "dist", "build", "target", ".next", ".cache"
+}
+
+# Maximale Ordner-Tiefe bei Datei-Scans (tiefer wird nicht abgestiegen)
+MAX_DEPTH = int(os.getenv("SCAN_MAX_DEPTH", "6"))
+
+# Gemeinsamer Pool für Projekt-Scans (Datei-I/O gibt die GIL frei; begrenzt gegen Platten-Überlast)
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="scan")
+
+# Konfigurationsdateien, an denen Projekt-Typen erkannt werden
+MARKER_FILES = {
+    "requirements.txt", "pyproject.toml", "setup.py", "package.json", "pubspec.yaml",
+    "docker-compose.yml", "docker-compose.yaml", "Dockerfile", "Cargo.toml", "go.mod",
+    "pom.xml", "build.gradle", ".git"
+}
+
+# Python-Frameworks, erkannt an Abhängigkeiten in pyproject.toml
+PYTHON_FRAMEWORKS = {"fastapi": "FastAPI", "django": "Django", "flask": "Flask"}
+
+# "flutter:" als YAML-Schlüssel (SDK-Abhängigkeit oder Flutter-Sektion), nicht in Kommentaren
+FLUTTER_KEY_RE = re.compile(r"^\s*flutter:", re.MULTILINE)
+
+# Paketname am Anfang einer Abhängigkeits-Angabe (z.B. "fastapi>=0.100")
+DEP_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+# Ausgabe von "pip list" so lange (Sekunden) wiederverwenden
+PIP_LIST_TTL = 60
+
+# Projekt-Zusammenfassung (Größe, letzte Änderung) so lange wiederverwenden
+SUMMARY_TTL = 30
+
+# Projekt-Zusammenfassungen: Pfad -> (Zeitpunkt, Zusammenfassung)
+_summary_cache: dict[str, tuple[float, tuple]] = {}
+
+# Quellcode-Endungen für die Datei-Statistik
+SOURCE_EXTENSIONS = {".py", ".js", ".ts", ".dart", ".java", ".go", ".rs"}
+
+
+def is_reparse_point(entry: os.DirEntry) -> bool:
+    """Windows-Junction/Reparse-Point (is_dir(follow_symlinks=False) erkennt sie nicht)"""
+    if os.name != "nt":
+        return False
+    attributes = entry.stat(follow_symlinks=False).st_file_attributes
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def walk_files(root, prune: bool = True, heavy: bool = False,
+               max_depth: int = MAX_DEPTH, truncated: Optional[list] = None):
+    """
+    Iterativer Datei-Walk mit os.scandir. DirEntry liefert den Typ (unter
+    Windows auch Größe und mtime) ohne zusätzlichen stat-Aufruf.
+    Symlinks und Junctions werden nicht verfolgt.
+    
+    Args:
+        root: Start-Verzeichnis
+        prune: Schwere (SKIP_DIRS) und versteckte Ordner überspringen.
+            Bei False werden sie durchlaufen und ihre Dateien als heavy markiert.
+        heavy: root selbst ist bereits ein schwerer Ordner
+        max_depth: Maximale Ordner-Tiefe unterhalb von root
+        truncated: Liste, in die Ordner jenseits von max_depth eingetragen werden
+    
+    Yields:
+        (DirEntry, heavy) pro Datei
+    """
+    stack = [(str(root), heavy, 0)]
+    while stack:
+        directory, heavy, depth = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        skip = entry.name in SKIP_DIRS or entry.name.startswith(".")
+                        if (skip and prune) or is_reparse_point(entry):
+                            continue
+                        if depth >= max_depth:
+                            if truncated is not None:
+                                truncated.append(entry.path)
+                            continue
+                        stack.append((entry.path, heavy or skip, depth + 1))
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry, heavy
+                except OSError:
+                    continue
+
+
+def project_dirs(base: Path) -> list[Path]:
+    """Direkte, nicht versteckte Unterordner als Projekt-Kandidaten"""
+    return [item for item in base.iterdir() if item.is_dir() and not item.name.startswith(".")]
+
+
+async def map_projects(func, dirs: list[Path]) -> list:
+    """Führt func für alle Projektordner parallel im Scan-Pool aus (Fehler als Ergebnis)."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(_POOL, func, item) for item in dirs),
+        return_exceptions=True
+    )
+
+
+def summarize_project(path: Path) -> tuple[int, float, list]:
+    """
+    Größe und letzte Änderung eines Projekts in einem Durchlauf (ein stat pro Datei).
+    Schwere Ordner zählen zur Größe, aber nicht zur letzten Änderung.
+    Das Ergebnis wird SUMMARY_TTL Sekunden wiederverwendet, damit
+    find_outdated_projects und find_large_projects nicht doppelt laufen.
+    
+    Returns:
+        Tuple (Gesamtgröße in Bytes, neueste mtime, [(Unterordner, Bytes), ...])
+    """
+    cached = cached_summary(path)
+    if cached:
+        return cached
+    
+    size = 0
+    newest = 0.0
+    subdir_sizes = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if is_reparse_point(entry):
+                    continue
+                skip = entry.name in SKIP_DIRS or entry.name.startswith(".")
+                sub_size = 0
+                files = walk_files(entry.path, prune=False, heavy=skip, max_depth=MAX_DEPTH - 1)
+                for file_entry, heavy in files:
+                    try:
+                        st = file_entry.stat()
+                    except OSError:
+                        continue
+                    sub_size += st.st_size
+                    if not heavy and st.st_mtime > newest:
+                        newest = st.st_mtime
+                subdir_sizes.append((entry.name, sub_size))
+                size += sub_size
+            elif entry.is_file(follow_symlinks=False):
+                st = entry.stat()
+                size += st.st_size
+                newest = max(newest, st.st_mtime)
+    
+    summary = (size, newest, subdir_sizes)
+    _summary_cache[str(path)] = (time.monotonic(), summary)
+    return summary
+
+
+def cached_summary(path: Path) -> Optional[tuple]:
+    """Noch gültige Projekt-Zusammenfassung aus dem Cache (sonst None)"""
+    cached = _summary_cache.get(str(path))
+    if cached and time.monotonic() - cached[0] < SUMMARY_TTL:
+        return cached[1]
+    return None
+
+
+def latest_change(path: Path, threshold_ts: Optional[float] = None) -> Optional[float]:
+    """
+    mtime der neuesten Quelldatei eines Projekts (None, wenn kein Projekt).
+    
+    Args:
+        path: Projektordner
+        threshold_ts: Walk abbrechen, sobald eine Datei neuer ist
+            (das Projekt ist dann nicht veraltet, das Maximum egal)
+    """
+    if not detect_project_type(path)["types"]:
+        return None
+    cached = cached_summary(path)
+    if cached:
+        return cached[1]
+    
+    newest = 0.0
+    for entry, _ in walk_files(path):
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        if mtime > newest:
+            newest = mtime
+            if threshold_ts is not None and newest >= threshold_ts:
+                break
+    return newest
+
+
+def marker_key(path: Path) -> tuple:
+    """
+    Vorhandene Konfigurationsdateien mit mtime (ein scandir statt vieler exists()).
+    Ändert sich eine davon, ändert sich der Schlüssel.
+    """
+    try:
+        with os.scandir(path) as it:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in it if entry.name in MARKER_FILES
+            ))
+    except OSError:
+        return ()
+
+
+@lru_cache(maxsize=1024)
+def read_json_cached(path_str: str, mtime_ns: int) -> dict:
+    """JSON-Datei lesen, gecacht bis sich die mtime ändert (nur lesend verwenden)"""
+    return json.loads(Path(path_str).read_text())
+
+
+def read_package_json(path: Path) -> dict:
+    """package.json eines Projekts (gecacht per mtime)"""
+    pkg_file = path / "package.json"
+    return read_json_cached(str(pkg_file), pkg_file.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def read_requirements_cached(path_str: str, mtime_ns: int) -> tuple:
+    """requirements.txt ohne Leerzeilen und Kommentare, gecacht bis sich die mtime ändert"""
+    lines = (line.strip() for line in Path(path_str).read_text().splitlines())
+    return tuple(line for line in lines if line and not line.startswith("#"))
+
+
+def read_requirements(path: Path) -> tuple:
+    """Einträge der requirements.txt eines Projekts (gecacht per mtime)"""
+    req_file = path / "requirements.txt"
+    return read_requirements_cached(str(req_file), req_file.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def read_toml_cached(path_str: str, mtime_ns: int) -> dict:
+    """TOML-Datei lesen, gecacht bis sich die mtime ändert (nur lesend verwenden)"""
+    return tomllib.loads(Path(path_str).read_text())
+
+
+@lru_cache(maxsize=1024)
+def read_yaml_cached(path_str: str, mtime_ns: int) -> dict:
+    """YAML-Datei lesen (C-Loader, falls vorhanden), gecacht bis sich die mtime ändert"""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path_str).read_text(), Loader=loader) or {}
+
+
+def pyproject_dependencies(data: dict) -> set:
+    """Paketnamen (klein) aus [project] und [tool.poetry] einer pyproject.toml"""
+    project = data.get("project", {})
+    specs = list(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        specs.extend(extra)
+    names = set()
+    for spec in specs:
+        match = DEP_NAME_RE.match(spec.strip())
+        if match:
+            names.add(match.group().lower())
+    poetry = data.get("tool", {}).get("poetry", {})
+    names.update(name.lower() for name in poetry.get("dependencies", {}))
+    for group in poetry.get("group", {}).values():
+        names.update(name.lower() for name in group.get("dependencies", {}))
+    return names
+
+
+# Installierte Pakete: (Zeitpunkt, {name: version})
+_pip_cache: Optional[tuple[float, dict]] = None
+
+
+def installed_packages() -> dict:
+    """Installierte Pakete (Name klein -> Version), PIP_LIST_TTL Sekunden gecacht"""
+    global _pip_cache
+    now = time.monotonic()
+    if _pip_cache and now - _pip_cache[0] < PIP_LIST_TTL:
+        return _pip_cache[1]
+    
+    # Metadaten direkt lesen statt "pip list" als Subprozess zu starten
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed[name.lower()] = dist.version
+    _pip_cache = (now, installed)
+    return installed
+
 
 def detect_project_type(path: Path) -> dict:
     """Erkenne Projekt-Typ anhand von Konfigurationsdateien"""
+    types, frameworks, has_git = detect_cached(str(path), marker_key(path))
+    return {
+        "types": list(types),
+        "frameworks": list(frameworks),
+        "has_git": has_git
+    }
+
+
+@lru_cache(maxsize=4096)
+def detect_cached(path_str: str, markers: tuple) -> tuple:
+    """
+    Projekt-Typ-Erkennung, gecacht pro Ordner und Marker-Stand.
+    
+    Returns:
+        Tuple (types, frameworks, has_git)
+    """
+    path = Path(path_str)
+    mtimes = dict(markers)
+    names = mtimes.keys()
     types = []
     frameworks = []
     
     # Python
-    if (path / "requirements.txt").exists() or (path / "pyproject.toml").exists() or (path / "setup.py").exists():
+    if "requirements.txt" in names or "pyproject.toml" in names or "setup.py" in names:
         types.append("python")
-        if (path / "pyproject.toml").exists():
+        if "pyproject.toml" in names:
+            # Echte Abhängigkeiten statt Textsuche (trifft sonst auch Kommentare/URLs)
             try:
-                content = (path / "pyproject.toml").read_text()
-                if "fastapi" in content.lower():
-                    frameworks.append("FastAPI")
-                if "django" in content.lower():
-                    frameworks.append("Django")
-                if "flask" in content.lower():
-                    frameworks.append("Flask")
+                data = read_toml_cached(str(path / "pyproject.toml"), mtimes["pyproject.toml"])
+                deps = pyproject_dependencies(data)
+                for package, framework in PYTHON_FRAMEWORKS.items():
+                    if package in deps:
+                        frameworks.append(framework)
             except:
                 pass
     
     # Node.js
-    if (path / "package.json").exists():
+    if "package.json" in names:
         types.append("nodejs")
         try:
-            pkg = json.loads((path / "package.json").read_text())
+            pkg = read_json_cached(str(path / "package.json"), mtimes["package.json"])
             deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
             if "react" in deps:
                 frameworks.append("React")
@@ -65,37 +377,38 @@ def detect_project_type(path: Path) -> dict:
             pass
     
     # Flutter/Dart
-    if (path / "pubspec.yaml").exists():
-        types.append("flutter" if (path / "pubspec.yaml").read_text().find("flutter:") >= 0 else "dart")
+    if "pubspec.yaml" in names:
+        # Nur der flutter-Schlüssel zählt, dafür reicht ein Regex statt YAML-Parse
+        try:
+            is_flutter = FLUTTER_KEY_RE.search((path / "pubspec.yaml").read_text()) is not None
+        except OSError:
+            is_flutter = False
+        types.append("flutter" if is_flutter else "dart")
     
     # Docker
-    if (path / "docker-compose.yml").exists() or (path / "docker-compose.yaml").exists():
+    if "docker-compose.yml" in names or "docker-compose.yaml" in names:
         types.append("docker-compose")
-    if (path / "Dockerfile").exists():
+    if "Dockerfile" in names:
         types.append("dockerfile")
     
     # Rust
-    if (path / "Cargo.toml").exists():
+    if "Cargo.toml" in names:
         types.append("rust")
     
     # Go
-    if (path / "go.mod").exists():
+    if "go.mod" in names:
         types.append("go")
     
     # Java
-    if (path / "pom.xml").exists():
+    if "pom.xml" in names:
         types.append("java-maven")
-    if (path / "build.gradle").exists():
+    if "build.gradle" in names:
         types.append("java-gradle")
     
     # Git
-    has_git = (path / ".git").exists()
+    has_git = ".git" in names
     
-    return {
-        "types": types,
-        "frameworks": frameworks,
-        "has_git": has_git
-    }
+    return tuple(types), tuple(frameworks), has_git
 
 
 # ==================== SCAN TOOLS ====================
@@ -121,18 +434,19 @@ async def scan_all_projects(
     if not base.exists():
         return {"success": False, "error": f"Pfad nicht gefunden: {base_path}"}
     
-    # Direkte Unterordner scannen
-    for item in base.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            project_info = detect_project_type(item)
-            if project_info["types"]:  # Nur wenn als Projekt erkannt
-                projects.append({
-                    "name": item.name,
-                    "path": str(item),
-                    "types": project_info["types"],
-                    "frameworks": project_info["frameworks"],
-                    "has_git": project_info["has_git"]
-                })
+    # Direkte Unterordner parallel scannen
+    dirs = project_dirs(base)
+    for item, project_info in zip(dirs, await map_projects(detect_project_type, dirs)):
+        if isinstance(project_info, Exception):
+            continue
+        if project_info["types"]:  # Nur wenn als Projekt erkannt
+            projects.append({
+                "name": item.name,
+                "path": str(item),
+                "types": project_info["types"],
+                "frameworks": project_info["frameworks"],
+                "has_git": project_info["has_git"]
+            })
     
     # Nach Typ gruppieren
     by_type = {}
@@ -182,7 +496,7 @@ async def project_details(
     if "python" in info["types"]:
         req_file = path / "requirements.txt"
         if req_file.exists():
-            deps = [l.strip() for l in req_file.read_text().splitlines() if l.strip() and not l.startswith("#")]
+            deps = list(read_requirements(path))
             details["python_dependencies"] = deps[:30]
             details["python_dep_count"] = len(deps)
     
@@ -191,7 +505,7 @@ async def project_details(
         pkg_file = path / "package.json"
         if pkg_file.exists():
             try:
-                pkg = json.loads(pkg_file.read_text())
+                pkg = read_package_json(path)
                 details["node_name"] = pkg.get("name")
                 details["node_version"] = pkg.get("version")
                 details["node_scripts"] = list(pkg.get("scripts", {}).keys())
@@ -205,28 +519,32 @@ async def project_details(
         pubspec = path / "pubspec.yaml"
         if pubspec.exists():
             try:
-                import yaml
-                data = yaml.safe_load(pubspec.read_text())
+                data = read_yaml_cached(str(pubspec), pubspec.stat().st_mtime_ns)
                 details["flutter_name"] = data.get("name")
                 details["flutter_version"] = data.get("version")
                 details["flutter_dependencies"] = list(data.get("dependencies", {}).keys())
             except:
                 pass
     
-    # Datei-Statistiken
-    file_counts = {}
-    for ext in [".py", ".js", ".ts", ".dart", ".java", ".go", ".rs"]:
-        count = len(list(path.rglob(f"*{ext}")))
-        if count > 0:
-            file_counts[ext] = count
-    details["file_counts"] = file_counts
-    
-    # Größe
-    try:
-        total_size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
-        details["total_size_mb"] = round(total_size / (1024 * 1024), 1)
-    except:
-        pass
+    # Datei-Statistiken und Größe in einem Durchlauf
+    # (Endungen ohne node_modules, build etc.; die Größe zählt alles)
+    file_counts = Counter()
+    total_size = 0
+    truncated = []
+    for entry, heavy in walk_files(path, prune=False, truncated=truncated):
+        if not heavy:
+            ext = os.path.splitext(entry.name)[1]
+            if ext in SOURCE_EXTENSIONS:
+                file_counts[ext] += 1
+        try:
+            total_size += entry.stat().st_size
+        except OSError:
+            pass
+    details["file_counts"] = dict(file_counts.most_common())
+    details["total_size_mb"] = round(total_size / (1024 * 1024), 1)
+    if truncated:
+        # Ordner jenseits von SCAN_MAX_DEPTH sind nicht mitgezählt
+        details["size_mb_truncated"] = True
     
     return {
         "success": True,
@@ -255,26 +573,14 @@ async def check_python_deps(
     if not req_file.exists():
         return {"success": False, "error": "Keine requirements.txt gefunden"}
     
-    import subprocess
-    
     deps = []
-    for line in req_file.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#"):
-            # Parse Paketname
-            pkg = line.split(">=")[0].split("==")[0].split("<")[0].split("[")[0].strip()
-            deps.append(pkg)
+    for line in read_requirements(path):
+        # Parse Paketname
+        pkg = line.split(">=")[0].split("==")[0].split("<")[0].split("[")[0].strip()
+        deps.append(pkg)
     
     # Prüfe welche installiert sind
-    result = subprocess.run(
-        ["pip", "list", "--format=json"],
-        capture_output=True,
-        text=True
-    )
-    installed = {}
-    if result.returncode == 0:
-        for pkg in json.loads(result.stdout):
-            installed[pkg["name"].lower()] = pkg["version"]
+    installed = installed_packages()
     
     status = []
     for dep in deps:
@@ -315,7 +621,7 @@ async def check_node_deps(
     if not pkg_file.exists():
         return {"success": False, "error": "Keine package.json gefunden"}
     
-    pkg = json.loads(pkg_file.read_text())
+    pkg = read_package_json(path)
     deps = pkg.get("dependencies", {})
     dev_deps = pkg.get("devDependencies", {})
     
@@ -353,27 +659,28 @@ async def projects_summary() -> dict:
     
     projects = []
     
-    for item in base.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            info = detect_project_type(item)
-            if info["types"]:
-                stats["total"] += 1
-                if "python" in info["types"]:
-                    stats["python"] += 1
-                if "nodejs" in info["types"]:
-                    stats["nodejs"] += 1
-                if "flutter" in info["types"]:
-                    stats["flutter"] += 1
-                if "docker-compose" in info["types"] or "dockerfile" in info["types"]:
-                    stats["docker"] += 1
-                if info["has_git"]:
-                    stats["with_git"] += 1
-                
-                projects.append({
-                    "name": item.name,
-                    "types": info["types"],
-                    "frameworks": info["frameworks"]
-                })
+    dirs = project_dirs(base)
+    for item, info in zip(dirs, await map_projects(detect_project_type, dirs)):
+        if isinstance(info, Exception):
+            continue
+        if info["types"]:
+            stats["total"] += 1
+            if "python" in info["types"]:
+                stats["python"] += 1
+            if "nodejs" in info["types"]:
+                stats["nodejs"] += 1
+            if "flutter" in info["types"]:
+                stats["flutter"] += 1
+            if "docker-compose" in info["types"] or "dockerfile" in info["types"]:
+                stats["docker"] += 1
+            if info["has_git"]:
+                stats["with_git"] += 1
+            
+            projects.append({
+                "name": item.name,
+                "types": info["types"],
+                "frameworks": info["frameworks"]
+            })
     
     return {
         "success": True,
@@ -402,31 +709,26 @@ async def find_outdated_projects(
     
     base = Path(base_path)
     threshold = datetime.now() - timedelta(days=days)
+    threshold_ts = threshold.timestamp()
     outdated = []
     
-    for item in base.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            info = detect_project_type(item)
-            if info["types"]:
-                # Finde neueste Datei
-                try:
-                    newest = max(
-                        (f.stat().st_mtime for f in item.rglob("*") if f.is_file()),
-                        default=0
-                    )
-                    newest_date = datetime.fromtimestamp(newest) if newest else None
-                    
-                    if newest_date and newest_date < threshold:
-                        outdated.append({
-                            "name": item.name,
-                            "path": str(item),
-                            "last_modified": newest_date.isoformat(),
-                            "days_ago": (datetime.now() - newest_date).days
-                        })
-                except:
-                    pass
-    
-    outdated.sort(key=lambda x: x["days_ago"], reverse=True)
+    # Neueste Quelldatei je Projekt parallel ermitteln (Abbruch bei erster neuerer Datei)
+    dirs = project_dirs(base)
+    check = partial(latest_change, threshold_ts=threshold_ts)
+    for item, newest in zip(dirs, await map_projects(check, dirs)):
+        if isinstance(newest, Exception) or not newest:
+            continue
+        
+        if newest < threshold_ts:
+            newest_date = datetime.fromtimestamp(newest)
+            outdated.append({
+                "name": item.name,
+                "path": str(item),
+                "last_modified": newest_date.isoformat(),
+                "days_ago": (datetime.now() - newest_date).days
+            })
+    
+    outdated.sort(key=itemgetter("days_ago"), reverse=True)
     
     return {
         "success": True,
@@ -454,31 +756,29 @@ async def find_large_projects(
     base = Path(base_path)
     large = []
     
-    for item in base.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            try:
-                size = sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
-                size_mb = size / (1024 * 1024)
-                
-                if size_mb >= min_size_mb:
-                    # Finde größte Unterordner
-                    subdir_sizes = []
-                    for sub in item.iterdir():
-                        if sub.is_dir():
-                            sub_size = sum(f.stat().st_size for f in sub.rglob("*") if f.is_file())
-                            subdir_sizes.append((sub.name, sub_size / (1024 * 1024)))
-                    subdir_sizes.sort(key=lambda x: x[1], reverse=True)
-                    
-                    large.append({
-                        "name": item.name,
-                        "path": str(item),
-                        "size_mb": round(size_mb, 1),
-                        "largest_subdirs": subdir_sizes[:5]
-                    })
-            except:
-                pass
-    
-    large.sort(key=lambda x: x["size_mb"], reverse=True)
+    # Projekte parallel vermessen
+    dirs = project_dirs(base)
+    for item, summary in zip(dirs, await map_projects(summarize_project, dirs)):
+        if isinstance(summary, Exception):
+            continue
+        size, _, subdir_sizes = summary
+        size_mb = size / (1024 * 1024)
+        
+        if size_mb >= min_size_mb:
+            # Größte Unterordner; erst die Top 5 in MB umrechnen (Liste liegt im Cache)
+            largest = [
+                (name, round(sub_size / (1024 * 1024), 1))
+                for name, sub_size in heapq.nlargest(5, subdir_sizes, key=itemgetter(1))
+            ]
+            
+            large.append({
+                "name": item.name,
+                "path": str(item),
+                "size_mb": round(size_mb, 1),
+                "largest_subdirs": largest
+            })
+    
+    large.sort(key=itemgetter("size_mb"), reverse=True)
     
     return {
         "success": True,
@@ -13,13 +13,15 @@ WICHTIG: SSH-Keys oder Passwort in .env konfigurieren
 
 import os
 import asyncio
+import shlex
+import uuid
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from fastmcp import FastMCP
 from pydantic import Field
 from typing import Optional
-import paramiko
-import io
+import asyncssh
 
 # Server initialisieren
 mcp = FastMCP(
@@ -30,8 +32,26 @@ mcp = FastMCP(
 # SSH-Konfiguration aus Environment
 SSH_HOSTS = {}  # Wird aus .env geladen
 
+# Keepalive-Intervall (Sekunden) für offen gehaltene Verbindungen
+SSH_KEEPALIVE = 30
+
+# zlib-Kompression auf der Verbindung (spart Bandbreite bei Logs/Quelltext)
+SSH_COMPRESSION = os.getenv("SSH_COMPRESSION", "true").lower() in ("1", "true", "yes")
+
+# Kanalfenster: mehr ausstehende Daten pro Round-Trip als der 2 MiB-Standard
+SSH_WINDOW_SIZE = 4 * 1024 * 1024
+
+# Dateien blockweise lesen; Blöcke wachsen bis SFTP_MAX_CHUNK statt die ganze Datei anzufordern
+SFTP_READ_CHUNK = 64 * 1024
+SFTP_MAX_CHUNK = 4 * 1024 * 1024
+
+# Transfers: Blockgröße und parallel ausstehende SFTP-Requests
+SFTP_BLOCK_SIZE = 64 * 1024
+SFTP_MAX_REQUESTS = 64
+
+@lru_cache(maxsize=1)
 def load_ssh_config():
-    """Lade SSH-Hosts aus Environment"""
+    """Lade SSH-Hosts aus Environment (einmal; neu laden mit reload_ssh_config)"""
     hosts = {}
     
     # Format: SSH_HOST_name=user@host:port
@@ -66,8 +86,8 @@ def load_ssh_config():
     return hosts
 
 
-def get_ssh_client(host_name: str) -> paramiko.SSHClient:
-    """Erstelle SSH-Verbindung"""
+async def connect_ssh(host_name: str) -> asyncssh.SSHClientConnection:
+    """Erstelle SSH-Verbindung (TCP, Key-Exchange, Auth) nativ auf dem Event-Loop"""
     hosts = load_ssh_config()
     
     if host_name not in hosts:
@@ -75,24 +95,199 @@ def get_ssh_client(host_name: str) -> paramiko.SSHClient:
     
     config = hosts[host_name]
     
-    client = paramiko.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    
     connect_args = {
-        "hostname": config["host"],
+        "host": config["host"],
         "port": config["port"],
-        "username": config["user"]
+        "username": config["user"],
+        # Unbekannte Host-Keys akzeptieren (wie bisher AutoAddPolicy)
+        "known_hosts": None,
+        "keepalive_interval": SSH_KEEPALIVE,
+        "window": SSH_WINDOW_SIZE,
+        "compression_algs": ["zlib@openssh.com", "none"] if SSH_COMPRESSION else ["none"]
     }
     
     if config["key_file"]:
-        connect_args["key_filename"] = config["key_file"]
+        connect_args["client_keys"] = [config["key_file"]]
     elif config["password"]:
         connect_args["password"] = config["password"]
     else:
         raise ValueError(f"Weder Passwort noch Key für Host '{host_name}' konfiguriert")
     
-    client.connect(**connect_args)
-    return client
+    return await asyncssh.connect(**connect_args)
+
+
+class SSHSessionManager:
+    """
+    Hält pro Host eine SSH-Verbindung und einen SFTP-Kanal offen und verwendet
+    sie für alle Tools wieder (wie ControlMaster/ControlPersist). Parallele
+    Befehle laufen als eigene Kanäle auf derselben Verbindung. Tote
+    Verbindungen werden beim nächsten Zugriff samt SFTP-Kanal neu aufgebaut.
+    """
+    
+    def __init__(self):
+        self._sessions: dict[str, asyncssh.SSHClientConnection] = {}
+        self._sftp: dict[str, asyncssh.SFTPClient] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+    
+    async def _connect(self, host_name: str) -> asyncssh.SSHClientConnection:
+        """Offene Verbindung oder neu verbinden (Lock muss gehalten werden)"""
+        conn = self._sessions.get(host_name)
+        if conn is not None:
+            if not conn.is_closed():
+                return conn
+            self._sftp.pop(host_name, None)
+        
+        conn = await connect_ssh(host_name)
+        self._sessions[host_name] = conn
+        return conn
+    
+    async def get(self, host_name: str) -> asyncssh.SSHClientConnection:
+        """Offene Verbindung zum Host oder neu verbinden"""
+        async with self._locks.setdefault(host_name, asyncio.Lock()):
+            return await self._connect(host_name)
+    
+    async def get_sftp(self, host_name: str) -> asyncssh.SFTPClient:
+        """Offener SFTP-Kanal zum Host; das Subsystem wird nur einmal ausgehandelt"""
+        async with self._locks.setdefault(host_name, asyncio.Lock()):
+            conn = await self._connect(host_name)
+            sftp = self._sftp.get(host_name)
+            if sftp is None:
+                sftp = await conn.start_sftp_client()
+                self._sftp[host_name] = sftp
+            return sftp
+    
+    async def drop(self, host_name: str) -> None:
+        """Verbindung zum Host schließen (z.B. nach geänderter Konfiguration)"""
+        async with self._locks.setdefault(host_name, asyncio.Lock()):
+            self._sftp.pop(host_name, None)
+            conn = self._sessions.pop(host_name, None)
+            if conn is not None:
+                conn.close()
+
+
+_ssh_sessions = SSHSessionManager()
+
+
+# ==================== SSH/SFTP HELPERS ====================
+
+async def _exec(conn: asyncssh.SSHClientConnection, command: str, timeout: Optional[float] = None) -> tuple[str, str, int]:
+    """Befehl ausführen und vollständig lesen: (stdout, stderr, exit_code)"""
+    try:
+        result = await conn.run(command, timeout=timeout, encoding="utf-8", errors="replace")
+    except asyncssh.TimeoutError as e:
+        raise TimeoutError(f"Befehl nach {timeout}s abgebrochen") from e
+    return result.stdout or "", result.stderr or "", result.returncode
+
+
+def _decode_line(line: bytes) -> str:
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+async def _sftp_read_lines(sftp: asyncssh.SFTPClient, remote_path: str, max_lines: int, max_bytes: int) -> tuple[list[str], bool, int]:
+    """
+    Die ersten max_lines Zeilen einer Datei blockweise lesen, höchstens
+    max_bytes; der Rest wird weder übertragen noch dekodiert.
+    
+    Returns:
+        Tuple (Zeilen, abgeschnitten, Dateigröße in Bytes)
+    """
+    async with sftp.open(remote_path, "rb") as f:
+        size = (await f.stat()).size
+        
+        lines = []
+        buffer = b""
+        position = 0
+        # Blockgröße verdoppeln: kleine Dateien in einem Round-Trip, große
+        # Blöcke fordert asyncssh parallel an
+        chunk_size = SFTP_READ_CHUNK
+        while len(lines) <= max_lines and position < max_bytes:
+            chunk = await f.read(min(chunk_size, max_bytes - position))
+            if not chunk:
+                if buffer:
+                    lines.append(buffer)
+                    buffer = b""
+                break
+            position += len(chunk)
+            chunk_size = min(chunk_size * 2, SFTP_MAX_CHUNK)
+            buffer += chunk
+            parts = buffer.split(b"\n")
+            buffer = parts.pop()
+            lines.extend(parts)
+        
+        truncated = len(lines) > max_lines or bool(buffer) or position < size
+        return [_decode_line(line) for line in lines[:max_lines]], truncated, size
+
+
+async def _sftp_tail_lines(sftp: asyncssh.SFTPClient, remote_path: str, lines: int, max_bytes: Optional[int] = None) -> tuple[list[str], bool, int]:
+    """
+    Letzte Zeilen einer Datei: vom Dateiende rückwärts nur so viele Blöcke
+    wie nötig, höchstens max_bytes.
+    
+    Returns:
+        Tuple (Zeilen, abgeschnitten, Dateigröße in Bytes)
+    """
+    if lines <= 0:
+        return [], False, 0
+    async with sftp.open(remote_path, "rb") as f:
+        size = (await f.stat()).size
+        floor = max(0, size - max_bytes) if max_bytes else 0
+        position = size
+        data = b""
+        while position > floor and data.count(b"\n") <= lines:
+            step = min(SFTP_READ_CHUNK, position - floor)
+            position -= step
+            data = await f.read(step, position) + data
+    parts = data.splitlines()
+    # Nicht ab Dateianfang gelesen: die erste Zeile ist evtl. unvollständig
+    if position > 0 and parts:
+        parts.pop(0)
+    truncated = position > 0 or len(parts) > lines
+    return [_decode_line(line) for line in parts[-lines:]], truncated, size
+
+
+async def _sftp_tail(sftp: asyncssh.SFTPClient, remote_path: str, lines: int) -> str:
+    """Letzte Zeilen einer Datei als Text"""
+    tail, _, _ = await _sftp_tail_lines(sftp, remote_path, lines)
+    return "".join(line + "\n" for line in tail)
+
+
+async def _sftp_write(sftp: asyncssh.SFTPClient, remote_path: str, data: bytes) -> None:
+    """Datei per SFTP schreiben (große Inhalte sendet asyncssh in parallelen Blöcken)"""
+    async with sftp.open(remote_path, "wb", block_size=SFTP_BLOCK_SIZE, max_requests=SFTP_MAX_REQUESTS) as f:
+        await f.write(data)
+
+
+async def _find_dir(conn: asyncssh.SSHClientConnection, remote_path: str) -> Optional[list[tuple[str, bool, int, int]]]:
+    """
+    Verzeichnisinhalt mit einem einzigen find-Aufruf auf dem Server
+    (NUL-getrennt, auch für versteckte Dateien).
+    
+    Returns:
+        Liste von (Name, ist Verzeichnis, Größe, mtime) oder None ohne
+        GNU find bzw. bei Fehlern (dann per SFTP listen)
+    """
+    command = (
+        f"cd -- {shlex.quote(remote_path)} && "
+        "find . -mindepth 1 -maxdepth 1 -printf '%y\\t%s\\t%T@\\t%f\\0'"
+    )
+    result = await conn.run(command, encoding=None)
+    if result.returncode == 0:
+        items = []
+        for record in result.stdout.decode("utf-8", errors="replace").split("\0"):
+            if record:
+                kind, size, mtime, name = record.split("\t", 3)
+                items.append((name, kind == "d", int(size), int(float(mtime))))
+        return items
+    return None
+
+
+async def _sftp_listdir(sftp: asyncssh.SFTPClient, remote_path: str) -> list[tuple[str, bool, int, int]]:
+    """Verzeichnisinhalt per SFTP: (Name, ist Verzeichnis, Größe, mtime)"""
+    return [
+        (entry.filename, entry.attrs.type == asyncssh.FILEXFER_TYPE_DIRECTORY, entry.attrs.size, entry.attrs.mtime)
+        for entry in await sftp.readdir(remote_path)
+        if entry.filename not in (".", "..")
+    ]
 
 
 # ==================== CONNECTION TOOLS ====================
@@ -129,6 +324,30 @@ async def list_ssh_hosts() -> dict:
     }
 
 
+@mcp.tool()
+async def reload_ssh_config() -> dict:
+    """
+    Lade die SSH-Hosts neu aus dem Environment (sonst einmal pro Prozess gelesen).
+    Offene Verbindungen zu geänderten oder entfernten Hosts werden geschlossen.
+    
+    Returns:
+        Neu geladene Host-Namen
+    """
+    old = load_ssh_config()
+    load_ssh_config.cache_clear()
+    hosts = load_ssh_config()
+    
+    changed = [name for name, config in old.items() if hosts.get(name) != config]
+    for name in changed:
+        await _ssh_sessions.drop(name)
+    
+    return {
+        "success": True,
+        "hosts": list(hosts),
+        "closed_connections": changed
+    }
+
+
 @mcp.tool()
 async def test_ssh_connection(
     host_name: str = Field(description="Name des SSH-Hosts aus Konfiguration")
@@ -143,13 +362,11 @@ async def test_ssh_connection(
         Verbindungsstatus
     """
     try:
-        client = get_ssh_client(host_name)
+        conn = await _ssh_sessions.get(host_name)
         
         # Test mit einfachem Befehl
-        stdin, stdout, stderr = client.exec_command("hostname && whoami")
-        output = stdout.read().decode().strip()
-        
-        client.close()
+        output, _, _ = await _exec(conn, "hostname && whoami")
+        output = output.strip()
         
         return {
             "success": True,
@@ -181,15 +398,9 @@ async def ssh_exec(
         Befehlsausgabe
     """
     try:
-        client = get_ssh_client(host_name)
-        
-        stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
-        
-        output = stdout.read().decode("utf-8", errors="replace")
-        errors = stderr.read().decode("utf-8", errors="replace")
-        exit_code = stdout.channel.recv_exit_status()
+        conn = await _ssh_sessions.get(host_name)
         
-        client.close()
+        output, errors, exit_code = await _exec(conn, command, timeout)
         
         return {
             "success": exit_code == 0,
@@ -206,48 +417,124 @@ async def ssh_exec(
 @mcp.tool()
 async def ssh_multi_exec(
     host_name: str = Field(description="Name des SSH-Hosts"),
-    commands: str = Field(description="Befehle, getrennt durch Semikolon")
+    commands: str = Field(description="Befehle, getrennt durch Semikolon"),
+    mode: str = Field(default="parallel", description="parallel (unabhängige Befehle) oder chain (mit && verketten)")
 ) -> dict:
     """
-    Führe mehrere Befehle nacheinander aus.
+    Führe mehrere Befehle aus: parallel als eigene Kanäle auf derselben
+    Verbindung oder als &&-Kette, die beim ersten Fehler abbricht.
     
     Args:
         host_name: SSH-Host
         commands: "cmd1; cmd2; cmd3"
+        mode: "parallel" oder "chain"
         
     Returns:
-        Kombinierte Ausgabe
+        Ausgabe pro Befehl (parallel) bzw. kombinierte Ausgabe (chain)
     """
+    if mode not in ("parallel", "chain"):
+        return {"success": False, "error": f"Unbekannter Modus: {mode} (parallel oder chain)"}
+    
     try:
-        client = get_ssh_client(host_name)
-        
-        # Kombiniere zu einem Befehl
-        combined = commands.replace(";", " && ")
-        
-        stdin, stdout, stderr = client.exec_command(combined, timeout=60)
+        conn = await _ssh_sessions.get(host_name)
         
-        output = stdout.read().decode("utf-8", errors="replace")
-        errors = stderr.read().decode("utf-8", errors="replace")
+        if mode == "chain":
+            # Kombiniere zu einem Befehl
+            combined = commands.replace(";", " && ")
+            
+            output, errors, _ = await _exec(conn, combined, 60)
+            
+            return {
+                "success": True,
+                "host": host_name,
+                "output": output[:10000],
+                "errors": errors[:2000] if errors else None
+            }
         
-        client.close()
+        cmds = [cmd.strip() for cmd in commands.split(";") if cmd.strip()]
+        # Gesamtdauer = langsamster Befehl statt Summe aller Befehle
+        outcomes = await asyncio.gather(*(_exec(conn, cmd, 60) for cmd in cmds), return_exceptions=True)
+        
+        results = []
+        for cmd, outcome in zip(cmds, outcomes):
+            if isinstance(outcome, Exception):
+                results.append({"command": cmd, "success": False, "error": str(outcome)})
+                continue
+            output, errors, exit_code = outcome
+            results.append({
+                "command": cmd,
+                "success": exit_code == 0,
+                "exit_code": exit_code,
+                "stdout": output[:10000],
+                "stderr": errors[:2000] if errors else None
+            })
         
         return {
-            "success": True,
+            "success": all(result["success"] for result in results),
             "host": host_name,
-            "output": output[:10000],
-            "errors": errors[:2000] if errors else None
+            "results": results
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+async def ssh_exec_fanout(
+    host_names: str = Field(description="SSH-Hosts, kommagetrennt"),
+    command: str = Field(description="Auszuführender Befehl"),
+    timeout: int = Field(default=30, description="Timeout in Sekunden")
+) -> dict:
+    """
+    Führe denselben Befehl parallel auf mehreren Hosts aus.
+    
+    Args:
+        host_names: "web1,web2,db"
+        command: Shell-Befehl
+        timeout: Max. Wartezeit pro Host
+        
+    Returns:
+        Ausgabe und Exit-Code pro Host
+    """
+    hosts = [name.strip() for name in host_names.split(",") if name.strip()]
+    if not hosts:
+        return {"success": False, "error": "Keine Hosts angegeben"}
+    
+    async def run(host_name: str) -> tuple[str, str, int]:
+        conn = await _ssh_sessions.get(host_name)
+        return await _exec(conn, command, timeout)
+    
+    # Gesamtdauer = langsamster Host statt Summe aller Hosts
+    outcomes = await asyncio.gather(*(run(host) for host in hosts), return_exceptions=True)
+    
+    results = {}
+    for host, outcome in zip(hosts, outcomes):
+        if isinstance(outcome, Exception):
+            results[host] = {"success": False, "error": str(outcome)}
+            continue
+        output, errors, exit_code = outcome
+        results[host] = {
+            "success": exit_code == 0,
+            "exit_code": exit_code,
+            "stdout": output[:10000],
+            "stderr": errors[:2000] if errors else None
+        }
+    
+    return {
+        "success": all(result["success"] for result in results.values()),
+        "command": command,
+        "results": results
+    }
+
+
 # ==================== FILE TOOLS ====================
 
 @mcp.tool()
 async def ssh_read_file(
     host_name: str = Field(description="Name des SSH-Hosts"),
     remote_path: str = Field(description="Pfad zur Datei auf dem Server"),
-    max_lines: int = Field(default=500, description="Max. Zeilen")
+    max_lines: int = Field(default=500, description="Max. Zeilen"),
+    max_bytes: int = Field(default=2_000_000, description="Max. zu lesende Bytes"),
+    from_end: bool = Field(default=False, description="Letzte statt erste Zeilen lesen (z.B. Logs)")
 ) -> dict:
     """
     Lese eine Datei vom Remote-Server.
@@ -256,32 +543,28 @@ async def ssh_read_file(
         host_name: SSH-Host
         remote_path: Dateipfad
         max_lines: Zeilenlimit
+        max_bytes: Byte-Limit (begrenzt Speicher und SFTP-Transfer)
+        from_end: Vom Dateiende lesen
         
     Returns:
         Dateiinhalt
     """
     try:
-        client = get_ssh_client(host_name)
-        sftp = client.open_sftp()
-        
-        with sftp.file(remote_path, "r") as f:
-            content = f.read().decode("utf-8", errors="replace")
-        
-        sftp.close()
-        client.close()
-        
-        lines = content.splitlines()
-        truncated = len(lines) > max_lines
+        sftp = await _ssh_sessions.get_sftp(host_name)
+        read = _sftp_tail_lines if from_end else _sftp_read_lines
+        lines, truncated, size = await read(sftp, remote_path, max_lines, max_bytes)
         
         return {
             "success": True,
             "host": host_name,
             "path": remote_path,
-            "content": "\n".join(lines[:max_lines]),
-            "total_lines": len(lines),
+            "content": "\n".join(lines),
+            # Bei abgeschnittenen Dateien wird der Rest nicht gelesen, die Zeilenzahl ist unbekannt
+            "total_lines": None if truncated else len(lines),
+            "size_bytes": size,
             "truncated": truncated
         }
-    except FileNotFoundError:
+    except asyncssh.SFTPNoSuchFile:
         return {"success": False, "error": f"Datei nicht gefunden: {remote_path}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -305,20 +588,15 @@ async def ssh_write_file(
         Bestätigung
     """
     try:
-        client = get_ssh_client(host_name)
-        sftp = client.open_sftp()
-        
-        with sftp.file(remote_path, "w") as f:
-            f.write(content.encode("utf-8"))
-        
-        sftp.close()
-        client.close()
+        data = content.encode("utf-8")
+        sftp = await _ssh_sessions.get_sftp(host_name)
+        await _sftp_write(sftp, remote_path, data)
         
         return {
             "success": True,
             "host": host_name,
             "path": remote_path,
-            "bytes_written": len(content.encode("utf-8"))
+            "bytes_written": len(data)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -340,27 +618,27 @@ async def ssh_list_dir(
         Dateien und Ordner
     """
     try:
-        client = get_ssh_client(host_name)
-        sftp = client.open_sftp()
-        
-        items = []
-        for item in sftp.listdir_attr(remote_path):
-            is_dir = item.st_mode and (item.st_mode & 0o40000)
-            items.append({
-                "name": item.filename,
-                "type": "dir" if is_dir else "file",
-                "size": item.st_size,
-                "modified": datetime.fromtimestamp(item.st_mtime).isoformat() if item.st_mtime else None
-            })
-        
-        sftp.close()
-        client.close()
+        conn = await _ssh_sessions.get(host_name)
+        entries = await _find_dir(conn, remote_path)
+        if entries is None:
+            sftp = await _ssh_sessions.get_sftp(host_name)
+            entries = await _sftp_listdir(sftp, remote_path)
+        # Sortieren auf den Tupeln, Dicts erst danach bauen
+        entries.sort(key=lambda e: (not e[1], e[0]))
         
         return {
             "success": True,
             "host": host_name,
             "path": remote_path,
-            "items": sorted(items, key=lambda x: (x["type"] != "dir", x["name"]))
+            "items": [
+                {
+                    "name": name,
+                    "type": "dir" if is_dir else "file",
+                    "size": size,
+                    "modified": datetime.fromtimestamp(mtime).isoformat() if mtime else None
+                }
+                for name, is_dir, size, mtime in entries
+            ]
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -387,23 +665,17 @@ async def ssh_upload_file(
         if not Path(local_path).exists():
             return {"success": False, "error": f"Lokale Datei nicht gefunden: {local_path}"}
         
-        client = get_ssh_client(host_name)
-        sftp = client.open_sftp()
-        
-        sftp.put(local_path, remote_path)
-        
-        # Größe prüfen
-        stat = sftp.stat(remote_path)
-        
-        sftp.close()
-        client.close()
+        sftp = await _ssh_sessions.get_sftp(host_name)
+        # Hochladen mit parallelen Requests, dann Größe prüfen
+        await sftp.put(local_path, remote_path, block_size=SFTP_BLOCK_SIZE, max_requests=SFTP_MAX_REQUESTS)
+        size = (await sftp.stat(remote_path)).size
         
         return {
             "success": True,
             "host": host_name,
             "local": local_path,
             "remote": remote_path,
-            "size_bytes": stat.st_size
+            "size_bytes": size
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -427,16 +699,11 @@ async def ssh_download_file(
         Übertragungsstatus
     """
     try:
-        client = get_ssh_client(host_name)
-        sftp = client.open_sftp()
-        
+        sftp = await _ssh_sessions.get_sftp(host_name)
         # Lokales Verzeichnis erstellen falls nötig
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
         
-        sftp.get(remote_path, local_path)
-        
-        sftp.close()
-        client.close()
+        await sftp.get(remote_path, local_path, block_size=SFTP_BLOCK_SIZE, max_requests=SFTP_MAX_REQUESTS)
         
         local_size = Path(local_path).stat().st_size
         
@@ -467,7 +734,7 @@ async def server_status(
         Systeminfo
     """
     try:
-        client = get_ssh_client(host_name)
+        conn = await _ssh_sessions.get(host_name)
         
         commands = {
             "hostname": "hostname",
@@ -478,12 +745,14 @@ async def server_status(
             "os": "cat /etc/os-release | head -2"
         }
         
-        results = {}
-        for name, cmd in commands.items():
-            stdin, stdout, stderr = client.exec_command(cmd)
-            results[name] = stdout.read().decode().strip()
+        # Alle Abfragen in einem exec statt einem Kanal pro Befehl;
+        # zufälliger Trenner, damit keine Ausgabe ihn enthalten kann
+        separator = f"__SEP_{uuid.uuid4().hex}__"
+        combined = f"; echo {separator}; ".join(commands.values())
+        output, _, _ = await _exec(conn, combined)
+        parts = output.split(f"{separator}\n")
         
-        client.close()
+        results = {name: part.strip() for name, part in zip(commands, parts)}
         
         return {
             "success": True,
@@ -512,12 +781,10 @@ async def read_server_logs(
         Log-Inhalt
     """
     try:
-        client = get_ssh_client(host_name)
-        
-        stdin, stdout, stderr = client.exec_command(f"tail -n {lines} {log_file}")
-        output = stdout.read().decode("utf-8", errors="replace")
+        sftp = await _ssh_sessions.get_sftp(host_name)
         
-        client.close()
+        # Per SFTP vom Dateiende lesen statt "tail" über die Shell (kein Quoting des Pfads nötig)
+        output = await _sftp_tail(sftp, log_file, lines)
         
         return {
             "success": True,
@@ -526,6 +793,8 @@ async def read_server_logs(
             "lines": lines,
             "content": output
         }
+    except asyncssh.SFTPNoSuchFile:
+        return {"success": False, "error": f"Log-Datei nicht gefunden: {log_file}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -546,17 +815,14 @@ async def list_processes(
         Prozessliste
     """
     try:
-        client = get_ssh_client(host_name)
+        conn = await _ssh_sessions.get(host_name)
         
         if filter_name:
             cmd = f"ps aux | grep -i {filter_name} | grep -v grep"
         else:
             cmd = "ps aux --sort=-%mem | head -20"
         
-        stdin, stdout, stderr = client.exec_command(cmd)
-        output = stdout.read().decode()
-        
-        client.close()
+        output, _, _ = await _exec(conn, cmd)
         
         return {
             "success": True,
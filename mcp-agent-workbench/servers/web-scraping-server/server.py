@@ -7,17 +7,41 @@ Extrahiert Inhalte von Webseiten.
 
 from fastmcp import FastMCP
 import httpx
-from bs4 import BeautifulSoup
-from typing import Optional
+import importlib.util
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from selectolax.lexbor import LexborHTMLParser
+from typing import Callable, NamedTuple, Optional
 import json
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
+
+try:
+    import re2  # google-re2: DFA, lineare Laufzeit ohne Backtracking (optional)
+except ImportError:
+    re2 = None
 
 mcp = FastMCP("web-scraping-server")
 
 # HTTP Client
 _http_client: Optional[httpx.AsyncClient] = None
 
+# HTTP/2 nur, wenn das optionale h2-Paket installiert ist
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Bereiche von scrape_page (Standard ohne "selectors", der braucht Selektoren)
+SCRAPE_SECTIONS = ("metadata", "links", "images", "tables", "text")
+ALL_SCRAPE_SECTIONS = SCRAPE_SECTIONS + ("selectors",)
+
+# Seiten-Cache für bedingte GETs: max. Einträge und Lebensdauer (Sekunden)
+PAGE_CACHE_SIZE = 512
+PAGE_CACHE_TTL = 300
+
+# fetch_page: max. geladene Bytes; check_url: max. verfolgte Weiterleitungen
+FETCH_PAGE_LIMIT = 50_000
+MAX_REDIRECTS = 10
+
 # Default Headers für realistische Anfragen
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -31,13 +55,321 @@ async def get_client() -> httpx.AsyncClient:
     global _http_client
     if _http_client is None:
         _http_client = httpx.AsyncClient(
+            http2=_HTTP2,
             headers=DEFAULT_HEADERS,
             follow_redirects=True,
-            timeout=30.0
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
         )
     return _http_client
 
 
+class Page(NamedTuple):
+    """Geladene Seite (auch aus dem Cache)"""
+    url: str
+    status_code: int
+    content_type: str
+    text: str
+
+
+# Seiten-Cache: URL -> (Zeitpunkt, Validatoren, Page), älteste zuerst
+_page_cache: OrderedDict = OrderedDict()
+
+
+async def fetch(url: str) -> Page:
+    """
+    GET mit ETag/Last-Modified. Bekannte Seiten werden bedingt nachgefragt;
+    bei 304 (ohne Body) kommt die gemerkte Seite zurück.
+    
+    Args:
+        url: Die URL der Webseite
+    
+    Returns:
+        Geladene Seite
+    
+    Raises:
+        httpx.HTTPStatusError: Bei Fehler-Status
+    """
+    client = await get_client()
+    now = time.monotonic()
+    cached = _page_cache.get(url)
+    if cached and now - cached[0] > PAGE_CACHE_TTL:
+        del _page_cache[url]
+        cached = None
+    
+    response = await client.get(url, headers=cached[1] if cached else None)
+    if response.status_code == 304 and cached:
+        _page_cache.move_to_end(url)
+        return cached[2]
+    response.raise_for_status()
+    page = Page(str(response.url), response.status_code, response.headers.get("content-type", ""), response.text)
+    
+    validators = {}
+    if "etag" in response.headers:
+        validators["If-None-Match"] = response.headers["etag"]
+    if "last-modified" in response.headers:
+        validators["If-Modified-Since"] = response.headers["last-modified"]
+    if validators:
+        _page_cache[url] = (now, validators, page)
+        _page_cache.move_to_end(url)
+        while len(_page_cache) > PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+    return page
+
+
+def _parse(html: str) -> LexborHTMLParser:
+    """HTML mit dem Lexbor-Parser (C, HTML5) parsen - deutlich schneller als BeautifulSoup."""
+    return LexborHTMLParser(html)
+
+
+async def _get_tree(url: str) -> tuple[Page, LexborHTMLParser]:
+    """Seite laden (mit Cache) und parsen"""
+    page = await fetch(url)
+    return page, _parse(page.text)
+
+
+def _url_joiner(base: str) -> Callable[[str], str]:
+    """
+    urljoin mit fester Basis: Basis-URL einmal zerlegen, häufige Fälle
+    (absolut, //host, /pfad, #anker) per String-Verkettung auflösen.
+    Alles, was urljoin normalisieren würde (Punkt-Segmente, Whitespace,
+    leere ?/#, ;params), geht weiter über urljoin.
+    """
+    parts = urlsplit(base)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    scheme = parts.scheme + ":"
+    page = urljoin(base, "#")
+    
+    def join(href: str) -> str:
+        if (not href or href[0] <= " " or href[-1] <= " " or href.endswith(("?", "#"))
+                or any(token in href for token in ("\t", "\n", "\r", "\\", ";", "/.", "?#"))):
+            return urljoin(base, href)
+        if href.startswith(("https://", "http://", "//")):
+            host = href.partition("//")[2]
+            if not host or host[0] in "/?#":
+                return urljoin(base, href)
+            return scheme + href if href[0] == "/" else href
+        if href[0] == "/":
+            return origin + href
+        if href[0] == "#":
+            return page + href
+        return urljoin(base, href)
+    
+    return join
+
+
+# "^literal"-Filter (nur Zeichen ohne Regex-Bedeutung oder escapte Satzzeichen)
+_LITERAL_PREFIX_RE = re.compile(r"\^((?:[^.^$*+?{}\[\]\\|()]|\\[^\w\s])*)")
+
+
+@lru_cache(maxsize=128)
+def _link_filter(pattern: str) -> Callable[[str], bool]:
+    """
+    Filterfunktion für filter_pattern, pro Pattern einmal gebaut (Crawls
+    nutzen dasselbe Pattern für viele Seiten). "^https://host\\.tld/"
+    wird zu str.startswith, sonst re2 und bei nicht unterstützter Syntax
+    (z.B. Lookarounds) das re-Modul.
+    
+    Raises:
+        re.error: Bei ungültigem Pattern
+    """
+    literal = _LITERAL_PREFIX_RE.fullmatch(pattern)
+    if literal:
+        prefix = re.sub(r"\\(.)", r"\1", literal.group(1))
+        return lambda url: url.startswith(prefix)
+    if re2 is not None:
+        try:
+            return re2.compile(pattern).search
+        except Exception:
+            pass
+    return re.compile(pattern).search
+
+
+# ============================================================================
+# EXTRAKTION (auf bereits geparstem Dokument, von Einzel-Tools und scrape_page genutzt)
+# ============================================================================
+
+def _extract_text(page: Page, tree: LexborHTMLParser, selector: Optional[str] = None) -> dict:
+    """Text aus dem geparsten Dokument (entfernt script/style/nav/... im Baum)"""
+    # Script und Style entfernen
+    tree.strip_tags(["script", "style", "nav", "footer", "header"])
+    
+    if selector:
+        elements = tree.css(selector)
+        text = "\n\n".join(el.text(separator=" ", strip=True) for el in elements)
+    else:
+        # Versuche Hauptinhalt zu finden
+        main = tree.css_first("main") or tree.css_first("article") or tree.body
+        text = main.text(separator=" ", strip=True) if main else ""
+    
+    # Mehrfache Whitespaces entfernen (str.split statt Regex)
+    text = " ".join(text.split())
+    
+    return {
+        "url": page.url,
+        "selector": selector or "auto",
+        "text_length": len(text),
+        "text": text[:20000]  # Erste 20KB
+    }
+
+
+def _extract_links(page: Page, tree: LexborHTMLParser, url: str, filter_pattern: Optional[str] = None) -> dict:
+    """Links aus dem geparsten Dokument"""
+    found = []
+    matches = _link_filter(filter_pattern) if filter_pattern else None
+    join = _url_joiner(url)
+    
+    for a_tag in tree.css("a[href]"):
+        absolute_url = join(a_tag.attributes["href"] or "")
+        if matches and not matches(absolute_url):
+            continue
+        found.append((absolute_url, a_tag))
+    
+    return {
+        "url": page.url,
+        "total_links": len(found),
+        # Erste 100; Linktext nur für diese extrahieren
+        "links": [
+            {"url": absolute_url, "text": a_tag.text(strip=True)[:100]}
+            for absolute_url, a_tag in found[:100]
+        ]
+    }
+
+
+def _extract_images(page: Page, tree: LexborHTMLParser, url: str) -> dict:
+    """Bilder aus dem geparsten Dokument"""
+    images = []
+    join = _url_joiner(url)
+    
+    for img in tree.css("img"):
+        attrs = img.attributes
+        src = attrs.get("src") or attrs.get("data-src")
+        if src:
+            images.append({
+                "url": join(src),
+                "alt": (attrs.get("alt") or "")[:100],
+                "width": attrs.get("width"),
+                "height": attrs.get("height")
+            })
+    
+    return {
+        "url": page.url,
+        "total_images": len(images),
+        "images": images[:50]
+    }
+
+
+def _extract_metadata(page: Page, tree: LexborHTMLParser) -> dict:
+    """Metadaten aus dem geparsten Dokument"""
+    # Title
+    title = ""
+    title_tag = tree.css_first("title")
+    if title_tag:
+        title = title_tag.text(strip=True)
+    
+    # Meta Description
+    description = ""
+    meta_desc = tree.css_first('meta[name="description"]')
+    if meta_desc:
+        description = meta_desc.attributes.get("content") or ""
+    
+    # Open Graph Tags
+    og_tags = {}
+    for og in tree.css('meta[property^="og:"]'):
+        prop = og.attributes["property"][3:]
+        og_tags[prop] = og.attributes.get("content") or ""
+    
+    # Keywords
+    keywords = []
+    meta_keywords = tree.css_first('meta[name="keywords"]')
+    if meta_keywords:
+        keywords = [k.strip() for k in (meta_keywords.attributes.get("content") or "").split(",")]
+    
+    # Canonical URL
+    canonical = ""
+    canonical_tag = tree.css_first('link[rel~="canonical"]')
+    if canonical_tag:
+        canonical = canonical_tag.attributes.get("href") or ""
+    
+    return {
+        "url": page.url,
+        "title": title,
+        "description": description,
+        "keywords": keywords[:20],
+        "canonical": canonical,
+        "og_tags": og_tags
+    }
+
+
+def _extract_tables(page: Page, tree: LexborHTMLParser) -> dict:
+    """
+    Tabellen aus dem geparsten Dokument. Zelltexte werden nur für die
+    ausgegebenen Tabellen und Zeilen extrahiert, der Rest nur gezählt.
+    """
+    all_tables = tree.css("table")
+    tables = []
+    
+    def cells(tr) -> list[str]:
+        return [td.text(strip=True) for td in tr.css("td, th")]
+    
+    for table_idx, table in enumerate(all_tables[:10]):  # Erste 10 Tabellen
+        headers = []
+        
+        # Headers extrahieren
+        thead = table.css_first("thead")
+        if thead:
+            headers = [th.text(strip=True) for th in thead.css("th, td")]
+        
+        # Rows mit Zellen; ohne thead wird die erste davon zum Header
+        tbody = table.css_first("tbody") or table
+        trs = [tr for tr in tbody.css("tr") if tr.css_first("td, th") is not None]
+        if not headers and trs:
+            headers = cells(trs[0])
+            trs = trs[1:]
+        
+        tables.append({
+            "index": table_idx,
+            "headers": headers,
+            "rows": [cells(tr) for tr in trs[:50]],  # Erste 50 Zeilen
+            "total_rows": len(trs)
+        })
+    
+    return {
+        "url": page.url,
+        "total_tables": len(all_tables),
+        "tables": tables
+    }
+
+
+def _extract_by_selector(page: Page, tree: LexborHTMLParser, selectors: list[str]) -> dict:
+    """
+    Elemente pro CSS-Selektor aus dem geparsten Dokument. Doppelte Selektoren
+    werden nur einmal abgefragt, Elemente, die mehrere Selektoren treffen,
+    nur einmal serialisiert.
+    """
+    results = {}
+    # Knoten-Adresse (mem_id) -> bereits serialisiertes Element
+    seen = {}
+    
+    def serialize(el) -> dict:
+        item = seen.get(el.mem_id)
+        if item is None:
+            item = seen[el.mem_id] = {
+                "text": el.text(strip=True)[:500],
+                "html": el.html[:1000],
+                "attrs": el.attributes
+            }
+        return item
+    
+    for selector in dict.fromkeys(selectors):
+        results[selector] = [serialize(el) for el in tree.css(selector)[:20]]
+    
+    return {
+        "url": page.url,
+        "results": results
+    }
+
+
 # ============================================================================
 # SCRAPING TOOLS
 # ============================================================================
@@ -46,24 +378,33 @@ async def get_client() -> httpx.AsyncClient:
 async def fetch_page(url: str) -> dict:
     """
     Lädt eine Webseite und gibt den rohen HTML-Inhalt zurück.
+    Der Body wird gestreamt und nach FETCH_PAGE_LIMIT Bytes abgebrochen.
     
     Args:
         url: Die URL der Webseite
     
     Returns:
-        HTML-Inhalt und Metadaten
+        HTML-Inhalt (erste 50KB) und Metadaten
     """
     try:
         client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
+        buf = bytearray()
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) >= FETCH_PAGE_LIMIT:
+                    break
+            truncated = len(buf) > FETCH_PAGE_LIMIT or not response.is_stream_consumed
+            encoding = response.charset_encoding or "utf-8"
         
         return {
             "url": str(response.url),
             "status_code": response.status_code,
             "content_type": response.headers.get("content-type", ""),
-            "content_length": len(response.text),
-            "html": response.text[:50000]  # Erste 50KB
+            "content_length": response.headers.get("content-length"),
+            "truncated": truncated,
+            "html": buf[:FETCH_PAGE_LIMIT].decode(encoding, errors="replace")
         }
     except httpx.HTTPStatusError as e:
         return {"error": f"HTTP Fehler: {e.response.status_code}"}
@@ -84,33 +425,8 @@ async def extract_text(url: str, selector: str = None) -> dict:
         Extrahierter Text
     """
     try:
-        client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "lxml")
-        
-        # Script und Style entfernen
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        
-        if selector:
-            elements = soup.select(selector)
-            text = "\n\n".join(el.get_text(strip=True, separator=" ") for el in elements)
-        else:
-            # Versuche Hauptinhalt zu finden
-            main = soup.find("main") or soup.find("article") or soup.find("body")
-            text = main.get_text(strip=True, separator=" ") if main else ""
-        
-        # Mehrfache Whitespaces entfernen
-        text = re.sub(r'\s+', ' ', text)
-        
-        return {
-            "url": str(response.url),
-            "selector": selector or "auto",
-            "text_length": len(text),
-            "text": text[:20000]  # Erste 20KB
-        }
+        page, tree = await _get_tree(url)
+        return _extract_text(page, tree, selector)
     except Exception as e:
         return {"error": str(e)}
 
@@ -128,32 +444,8 @@ async def extract_links(url: str, filter_pattern: str = None) -> dict:
         Liste der gefundenen Links
     """
     try:
-        client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "lxml")
-        links = []
-        
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag["href"]
-            absolute_url = urljoin(url, href)
-            text = a_tag.get_text(strip=True)[:100]
-            
-            if filter_pattern:
-                if not re.search(filter_pattern, absolute_url):
-                    continue
-            
-            links.append({
-                "url": absolute_url,
-                "text": text
-            })
-        
-        return {
-            "url": str(response.url),
-            "total_links": len(links),
-            "links": links[:100]  # Erste 100
-        }
+        page, tree = await _get_tree(url)
+        return _extract_links(page, tree, url, filter_pattern)
     except Exception as e:
         return {"error": str(e)}
 
@@ -170,29 +462,8 @@ async def extract_images(url: str) -> dict:
         Liste der gefundenen Bilder
     """
     try:
-        client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "lxml")
-        images = []
-        
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src")
-            if src:
-                absolute_url = urljoin(url, src)
-                images.append({
-                    "url": absolute_url,
-                    "alt": img.get("alt", "")[:100],
-                    "width": img.get("width"),
-                    "height": img.get("height")
-                })
-        
-        return {
-            "url": str(response.url),
-            "total_images": len(images),
-            "images": images[:50]
-        }
+        page, tree = await _get_tree(url)
+        return _extract_images(page, tree, url)
     except Exception as e:
         return {"error": str(e)}
 
@@ -209,50 +480,8 @@ async def extract_metadata(url: str) -> dict:
         Metadaten der Seite
     """
     try:
-        client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "lxml")
-        
-        # Title
-        title = ""
-        title_tag = soup.find("title")
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-        
-        # Meta Description
-        description = ""
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc:
-            description = meta_desc.get("content", "")
-        
-        # Open Graph Tags
-        og_tags = {}
-        for og in soup.find_all("meta", attrs={"property": re.compile(r"^og:")}):
-            prop = og.get("property", "").replace("og:", "")
-            og_tags[prop] = og.get("content", "")
-        
-        # Keywords
-        keywords = []
-        meta_keywords = soup.find("meta", attrs={"name": "keywords"})
-        if meta_keywords:
-            keywords = [k.strip() for k in meta_keywords.get("content", "").split(",")]
-        
-        # Canonical URL
-        canonical = ""
-        canonical_tag = soup.find("link", attrs={"rel": "canonical"})
-        if canonical_tag:
-            canonical = canonical_tag.get("href", "")
-        
-        return {
-            "url": str(response.url),
-            "title": title,
-            "description": description,
-            "keywords": keywords[:20],
-            "canonical": canonical,
-            "og_tags": og_tags
-        }
+        page, tree = await _get_tree(url)
+        return _extract_metadata(page, tree)
     except Exception as e:
         return {"error": str(e)}
 
@@ -269,45 +498,8 @@ async def extract_tables(url: str) -> dict:
         Liste der Tabellen als strukturierte Daten
     """
     try:
-        client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "lxml")
-        tables = []
-        
-        for table_idx, table in enumerate(soup.find_all("table")):
-            rows = []
-            headers = []
-            
-            # Headers extrahieren
-            thead = table.find("thead")
-            if thead:
-                for th in thead.find_all(["th", "td"]):
-                    headers.append(th.get_text(strip=True))
-            
-            # Rows extrahieren
-            tbody = table.find("tbody") or table
-            for tr in tbody.find_all("tr"):
-                cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
-                if cells:
-                    if not headers and all(tr.find_all("th")):
-                        headers = cells
-                    else:
-                        rows.append(cells)
-            
-            tables.append({
-                "index": table_idx,
-                "headers": headers,
-                "rows": rows[:50],  # Erste 50 Zeilen
-                "total_rows": len(rows)
-            })
-        
-        return {
-            "url": str(response.url),
-            "total_tables": len(tables),
-            "tables": tables[:10]  # Erste 10 Tabellen
-        }
+        page, tree = await _get_tree(url)
+        return _extract_tables(page, tree)
     except Exception as e:
         return {"error": str(e)}
 
@@ -325,28 +517,61 @@ async def extract_by_selector(url: str, selectors: list[str]) -> dict:
         Gefundene Elemente pro Selektor
     """
     try:
-        client = await get_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "lxml")
-        results = {}
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            results[selector] = [
-                {
-                    "text": el.get_text(strip=True)[:500],
-                    "html": str(el)[:1000],
-                    "attrs": dict(el.attrs)
-                }
-                for el in elements[:20]
-            ]
-        
-        return {
-            "url": str(response.url),
-            "results": results
+        page, tree = await _get_tree(url)
+        return _extract_by_selector(page, tree, selectors)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool
+async def scrape_page(
+    url: str,
+    sections: list[str] = None,
+    selector: str = None,
+    filter_pattern: str = None,
+    selectors: list[str] = None
+) -> dict:
+    """
+    Lädt und parst eine Seite einmal und extrahiert mehrere Bereiche
+    (statt mehrerer extract_*-Aufrufe mit je eigenem Abruf und Parse).
+    
+    Args:
+        url: Die URL der Webseite
+        sections: Bereiche aus "metadata", "links", "images", "tables", "text",
+            "selectors" (default: metadata, links, images, tables, text)
+        selector: CSS-Selector für "text" (optional)
+        filter_pattern: Regex-Pattern für "links" (optional)
+        selectors: CSS-Selektoren für "selectors"
+    
+    Returns:
+        Ergebnis pro Bereich
+    """
+    sections = sections or list(SCRAPE_SECTIONS)
+    unknown = [name for name in sections if name not in ALL_SCRAPE_SECTIONS]
+    if unknown:
+        return {"error": f"Unbekannte Bereiche: {unknown}", "available": list(ALL_SCRAPE_SECTIONS)}
+    if "selectors" in sections and not selectors:
+        return {"error": "Für 'selectors' müssen selectors angegeben werden"}
+    
+    try:
+        page, tree = await _get_tree(url)
+        extractors = {
+            "metadata": lambda: _extract_metadata(page, tree),
+            "links": lambda: _extract_links(page, tree, url, filter_pattern),
+            "images": lambda: _extract_images(page, tree, url),
+            "tables": lambda: _extract_tables(page, tree),
+            "selectors": lambda: _extract_by_selector(page, tree, selectors),
+            # Zuletzt: entfernt script/style/nav/... aus dem Baum
+            "text": lambda: _extract_text(page, tree, selector),
         }
+        
+        result = {"url": page.url}
+        for name, extract in extractors.items():
+            if name in sections:
+                data = extract()
+                del data["url"]
+                result[name] = data
+        return result
     except Exception as e:
         return {"error": str(e)}
 
@@ -355,16 +580,21 @@ async def extract_by_selector(url: str, selectors: list[str]) -> dict:
 async def check_url(url: str) -> dict:
     """
     Prüft ob eine URL erreichbar ist und gibt Status-Infos zurück.
+    Weiterleitungen werden einzeln per HEAD verfolgt (ohne Bodies).
     
     Args:
         url: Die zu prüfende URL
     
     Returns:
-        Status-Informationen
+        Status-Informationen inkl. Weiterleitungskette
     """
     try:
         client = await get_client()
-        response = await client.head(url)
+        response = await client.head(url, follow_redirects=False)
+        redirects = []
+        while response.next_request is not None and len(redirects) < MAX_REDIRECTS:
+            redirects.append({"url": str(response.url), "status_code": response.status_code})
+            response = await client.send(response.next_request, follow_redirects=False)
         
         return {
             "url": str(response.url),
@@ -373,7 +603,8 @@ async def check_url(url: str) -> dict:
             "content_type": response.headers.get("content-type", ""),
             "content_length": response.headers.get("content-length"),
             "server": response.headers.get("server", ""),
-            "redirect": str(response.url) != url
+            "redirect": bool(redirects),
+            "redirect_chain": redirects
         }
     except Exception as e:
         return {
@@ -400,6 +631,7 @@ def scraping_help() -> str:
             "extract_metadata - Meta-Tags extrahieren",
             "extract_tables - Tabellen extrahieren",
             "extract_by_selector - CSS-Selektoren verwenden",
+            "scrape_page - Mehrere Bereiche mit einem Abruf extrahieren",
             "check_url - URL-Erreichbarkeit prüfen"
         ],
         "tips": [
@@ -7,18 +7,161 @@ Verwendet DuckDuckGo für anonyme Suchen.
 
 from fastmcp import FastMCP
 from duckduckgo_search import DDGS
-from typing import Optional
+from duckduckgo_search.exceptions import RatelimitException
+from collections import OrderedDict
+from typing import Callable, Optional
+import asyncio
+import functools
+import hashlib
+import inspect
+import itertools
 import json
+import os
+import random
+import threading
+import time
 
 mcp = FastMCP("web-search-server")
 
+# Ergebnis-Cache: max. Einträge und Lebensdauer (Sekunden) je nach Aktualitätsbedarf
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+NEWS_CACHE_TTL = 60
+ANSWER_CACHE_TTL = 3600
+
+# Rate-Limit: Versuche pro DDGS-Aufruf und Basis-Wartezeit (verdoppelt sich je Versuch)
+RATELIMIT_ATTEMPTS = 3
+RATELIMIT_BACKOFF = 0.5
+
+# Optionale Proxies, kommagetrennt; bei jedem neuen Versuch der nächste
+DDGS_PROXIES = [p.strip() for p in os.getenv("DDGS_PROXIES", "").split(",") if p.strip()]
+_proxy_cycle = itertools.cycle(DDGS_PROXIES) if DDGS_PROXIES else None
+
+# Max. gleichzeitige DDGS-Anfragen (über alle Tools und Clients); weitere warten
+DDG_MAX_INFLIGHT = int(os.getenv("DDG_MAX_INFLIGHT", "3"))
+_ddg_semaphore = asyncio.Semaphore(DDG_MAX_INFLIGHT)
+
+# Max. Suchen pro multi_search-Aufruf (DuckDuckGo limitiert parallele Anfragen)
+MAX_MULTI_SEARCH = 10
+
+# Gecachte Antworten: (Tool, Argumente) -> (Zeitpunkt, Antwort), älteste zuerst;
+# query steht als Digest der normalisierten Form im Key
+_search_cache: OrderedDict = OrderedDict()
+
+# Suchtyp -> Such-Funktion (für multi_search)
+SEARCH_TYPES = {}
+
+# Ein DDGS-Client pro Thread und Proxy (Keep-Alive statt TCP/TLS-Handshake pro
+# Anfrage; der HTTP-Client von DDGS ist nicht als thread-sicher dokumentiert)
+_ddgs_local = threading.local()
+
+
+def get_ddgs(proxy: Optional[str] = None) -> DDGS:
+    """Holt oder erstellt den DDGS-Client des aktuellen Threads für proxy."""
+    clients = getattr(_ddgs_local, "clients", None)
+    if clients is None:
+        clients = _ddgs_local.clients = {}
+    ddgs = clients.get(proxy)
+    if ddgs is None:
+        ddgs = clients[proxy] = DDGS(proxy=proxy)
+    return ddgs
+
+
+async def ddgs_call(method: str, *args, project: Optional[Callable] = None, **kwargs) -> list:
+    """
+    DDGS-Methode (blockierend) im Thread-Pool ausführen, Event-Loop bleibt frei.
+    Höchstens DDG_MAX_INFLIGHT Aufrufe laufen gleichzeitig, der Rest wartet.
+    Bei Rate-Limit mit exponentiellem Backoff (und nächstem Proxy) wiederholen.
+    
+    Args:
+        project: Optionale Zeilen-Projektion; läuft noch im Thread, Zeile für
+            Zeile beim Iterieren der DDGS-Ergebnisse
+    
+    Raises:
+        RatelimitException: Wenn auch der letzte Versuch limitiert wurde
+    """
+    def call(proxy: Optional[str]) -> list:
+        rows = getattr(get_ddgs(proxy), method)(*args, **kwargs)
+        if project is None:
+            return list(rows)
+        return [project(r) for r in rows]
+    
+    proxy = next(_proxy_cycle) if _proxy_cycle else None
+    for attempt in range(RATELIMIT_ATTEMPTS):
+        try:
+            async with _ddg_semaphore:
+                return await asyncio.to_thread(call, proxy)
+        except RatelimitException:
+            if attempt == RATELIMIT_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(RATELIMIT_BACKOFF * 2 ** attempt + random.random() * 0.2)
+            if _proxy_cycle:
+                proxy = next(_proxy_cycle)
+
+
+def search_type(name: str):
+    """Such-Funktion unter name für multi_search registrieren"""
+    def decorator(func):
+        SEARCH_TYPES[name] = func
+        return func
+    return decorator
+
+
+def query_key(query: str) -> bytes:
+    """Cache-Key einer Suchanfrage: Groß-/Kleinschreibung und Leerraum egal"""
+    normalized = " ".join(query.casefold().split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+def ttl_cache(seconds: float):
+    """
+    Erfolgreiche Tool-Antworten für seconds Sekunden wiederverwenden:
+    gleiche Anfragen sparen den Round-Trip zu DuckDuckGo und dessen
+    Rate-Limit. Fehler werden nicht gecacht. Varianten derselben Anfrage
+    ("Berlin  Cafes " / "berlin cafes") teilen sich einen Eintrag.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Defaults einsetzen, damit weggelassene und explizite Argumente denselben Key ergeben
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            query = arguments.get("query")
+            if isinstance(query, str):
+                arguments["query"] = query_key(query)
+            key = (func.__name__, tuple(arguments.items()))
+            now = time.monotonic()
+            cached = _search_cache.get(key)
+            if cached and now - cached[0] < seconds:
+                _search_cache.move_to_end(key)
+                result = cached[1]
+                # Anfrage so zurückgeben, wie sie diesmal gestellt wurde
+                if "query" in result and result["query"] != query:
+                    result = {**result, "query": query}
+                return result
+            
+            result = await func(*args, **kwargs)
+            if "error" not in result:
+                _search_cache[key] = (now, result)
+                _search_cache.move_to_end(key)
+                while len(_search_cache) > SEARCH_CACHE_SIZE:
+                    _search_cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
 
 # ============================================================================
 # SEARCH TOOLS
 # ============================================================================
 
 @mcp.tool
-def web_search(
+@search_type("web")
+@ttl_cache(SEARCH_CACHE_TTL)
+async def web_search(
     query: str,
     max_results: int = 10,
     region: str = "de-de"
@@ -35,31 +178,31 @@ def web_search(
         Liste der Suchergebnisse
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(
-                query,
-                region=region,
-                max_results=max_results
-            ))
+        results = await ddgs_call(
+            "text",
+            query,
+            region=region,
+            max_results=max_results,
+            project=lambda r: {
+                "title": r.get("title", ""),
+                "url": r.get("href", ""),
+                "description": r.get("body", "")
+            }
+        )
         
         return {
             "query": query,
             "total_results": len(results),
-            "results": [
-                {
-                    "title": r.get("title", ""),
-                    "url": r.get("href", ""),
-                    "description": r.get("body", "")
-                }
-                for r in results
-            ]
+            "results": results
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @mcp.tool
-def news_search(
+@search_type("news")
+@ttl_cache(NEWS_CACHE_TTL)
+async def news_search(
     query: str,
     max_results: int = 10,
     region: str = "de-de"
@@ -76,34 +219,34 @@ def news_search(
         Liste der News-Ergebnisse
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.news(
-                query,
-                region=region,
-                max_results=max_results
-            ))
+        results = await ddgs_call(
+            "news",
+            query,
+            region=region,
+            max_results=max_results,
+            project=lambda r: {
+                "title": r.get("title", ""),
+                "url": r.get("url", ""),
+                "source": r.get("source", ""),
+                "date": r.get("date", ""),
+                "description": r.get("body", "")
+            }
+        )
         
         return {
             "query": query,
             "type": "news",
             "total_results": len(results),
-            "results": [
-                {
-                    "title": r.get("title", ""),
-                    "url": r.get("url", ""),
-                    "source": r.get("source", ""),
-                    "date": r.get("date", ""),
-                    "description": r.get("body", "")
-                }
-                for r in results
-            ]
+            "results": results
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @mcp.tool
-def image_search(
+@search_type("images")
+@ttl_cache(SEARCH_CACHE_TTL)
+async def image_search(
     query: str,
     max_results: int = 10,
     size: str = None,
@@ -122,36 +265,36 @@ def image_search(
         Liste der Bilder
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.images(
-                query,
-                max_results=max_results,
-                size=size,
-                type_image=type_image
-            ))
+        results = await ddgs_call(
+            "images",
+            query,
+            max_results=max_results,
+            size=size,
+            type_image=type_image,
+            project=lambda r: {
+                "title": r.get("title", ""),
+                "image_url": r.get("image", ""),
+                "thumbnail": r.get("thumbnail", ""),
+                "source": r.get("source", ""),
+                "width": r.get("width"),
+                "height": r.get("height")
+            }
+        )
         
         return {
             "query": query,
             "type": "images",
             "total_results": len(results),
-            "results": [
-                {
-                    "title": r.get("title", ""),
-                    "image_url": r.get("image", ""),
-                    "thumbnail": r.get("thumbnail", ""),
-                    "source": r.get("source", ""),
-                    "width": r.get("width"),
-                    "height": r.get("height")
-                }
-                for r in results
-            ]
+            "results": results
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @mcp.tool
-def video_search(
+@search_type("videos")
+@ttl_cache(SEARCH_CACHE_TTL)
+async def video_search(
     query: str,
     max_results: int = 10,
     region: str = "de-de"
@@ -168,35 +311,35 @@ def video_search(
         Liste der Videos
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.videos(
-                query,
-                region=region,
-                max_results=max_results
-            ))
+        results = await ddgs_call(
+            "videos",
+            query,
+            region=region,
+            max_results=max_results,
+            project=lambda r: {
+                "title": r.get("title", ""),
+                "url": r.get("content", ""),
+                "description": r.get("description", ""),
+                "publisher": r.get("publisher", ""),
+                "duration": r.get("duration", ""),
+                "views": r.get("statistics", {}).get("viewCount")
+            }
+        )
         
         return {
             "query": query,
             "type": "videos",
             "total_results": len(results),
-            "results": [
-                {
-                    "title": r.get("title", ""),
-                    "url": r.get("content", ""),
-                    "description": r.get("description", ""),
-                    "publisher": r.get("publisher", ""),
-                    "duration": r.get("duration", ""),
-                    "views": r.get("statistics", {}).get("viewCount")
-                }
-                for r in results
-            ]
+            "results": results
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @mcp.tool
-def maps_search(
+@search_type("maps")
+@ttl_cache(SEARCH_CACHE_TTL)
+async def maps_search(
     query: str,
     place: str = None,
     max_results: int = 10
@@ -213,38 +356,38 @@ def maps_search(
         Liste der Orte
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.maps(
-                query,
-                place=place,
-                max_results=max_results
-            ))
+        results = await ddgs_call(
+            "maps",
+            query,
+            place=place,
+            max_results=max_results,
+            project=lambda r: {
+                "title": r.get("title", ""),
+                "address": r.get("address", ""),
+                "phone": r.get("phone", ""),
+                "url": r.get("url", ""),
+                "latitude": r.get("latitude"),
+                "longitude": r.get("longitude"),
+                "rating": r.get("rating"),
+                "reviews": r.get("reviews")
+            }
+        )
         
         return {
             "query": query,
             "place": place,
             "type": "maps",
             "total_results": len(results),
-            "results": [
-                {
-                    "title": r.get("title", ""),
-                    "address": r.get("address", ""),
-                    "phone": r.get("phone", ""),
-                    "url": r.get("url", ""),
-                    "latitude": r.get("latitude"),
-                    "longitude": r.get("longitude"),
-                    "rating": r.get("rating"),
-                    "reviews": r.get("reviews")
-                }
-                for r in results
-            ]
+            "results": results
         }
     except Exception as e:
         return {"error": str(e)}
 
 
 @mcp.tool
-def instant_answer(query: str) -> dict:
+@search_type("answers")
+@ttl_cache(ANSWER_CACHE_TTL)
+async def instant_answer(query: str) -> dict:
     """
     Holt eine Instant-Antwort (wie Definitionen, Fakten).
     
@@ -255,20 +398,20 @@ def instant_answer(query: str) -> dict:
         Instant-Antwort falls verfügbar
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.answers(query))
+        results = await ddgs_call(
+            "answers",
+            query,
+            project=lambda r: {
+                "text": r.get("text", ""),
+                "source": r.get("url", "")
+            }
+        )
         
         if results:
             return {
                 "query": query,
                 "has_answer": True,
-                "answers": [
-                    {
-                        "text": r.get("text", ""),
-                        "source": r.get("url", "")
-                    }
-                    for r in results
-                ]
+                "answers": results
             }
         else:
             return {
@@ -281,7 +424,9 @@ def instant_answer(query: str) -> dict:
 
 
 @mcp.tool
-def suggestions(query: str) -> dict:
+@search_type("suggestions")
+@ttl_cache(ANSWER_CACHE_TTL)
+async def suggestions(query: str) -> dict:
     """
     Holt Suchvorschläge für einen Begriff.
     
@@ -292,43 +437,121 @@ def suggestions(query: str) -> dict:
         Liste der Vorschläge
     """
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.suggestions(query))
+        results = await ddgs_call(
+            "suggestions",
+            query,
+            project=lambda r: r.get("phrase", "")
+        )
         
         return {
             "query": query,
-            "suggestions": [r.get("phrase", "") for r in results]
+            "suggestions": results
         }
     except Exception as e:
         return {"error": str(e)}
 
 
+def _hit_count(result: dict) -> int:
+    """Trefferzahl einer Such-Antwort (0 bei Fehlern)"""
+    if "total_results" in result:
+        return result["total_results"]
+    return len(result.get("answers") or result.get("suggestions") or [])
+
+
+@mcp.tool
+async def multi_search(
+    queries: list[dict],
+    strategy: str = "all",
+    enough_results: int = 10
+) -> dict:
+    """
+    Führt mehrere Suchen parallel aus (Dauer = langsamste statt Summe aller Suchen).
+    
+    Args:
+        queries: Liste von Suchen, z.B. [{"type": "web", "query": "python"},
+            {"type": "news", "query": "python", "max_results": 5}].
+            type: web, news, images, videos, maps, answers, suggestions;
+            weitere Felder sind die Parameter des jeweiligen Such-Tools
+        strategy: "all" (alle Suchen abwarten) oder "stop_if_enough_matches"
+            (offene Suchen abbrechen, sobald enough_results Treffer da sind)
+        enough_results: Treffer-Schwelle für stop_if_enough_matches
+    
+    Returns:
+        Ergebnis pro Suche in Eingabe-Reihenfolge (abgebrochene: skipped)
+    """
+    if len(queries) > MAX_MULTI_SEARCH:
+        return {"error": f"Maximal {MAX_MULTI_SEARCH} Suchen pro Aufruf"}
+    if strategy not in ("all", "stop_if_enough_matches"):
+        return {"error": f"Unbekannte Strategie: {strategy} (all oder stop_if_enough_matches)"}
+    
+    async def run(spec: dict) -> dict:
+        params = dict(spec)
+        search = SEARCH_TYPES.get(params.pop("type", "web"))
+        if search is None:
+            return {"error": f"Unbekannter Suchtyp. Verfügbar: {', '.join(SEARCH_TYPES)}"}
+        try:
+            return await search(**params)
+        except TypeError as e:
+            return {"error": f"Ungültige Parameter: {e}"}
+    
+    if strategy == "all":
+        results = await asyncio.gather(*(run(spec) for spec in queries))
+        return {
+            "total_searches": len(results),
+            "results": results
+        }
+    
+    # Fertige Suchen einsammeln, bis genug Treffer da sind; den Rest abbrechen
+    tasks = [asyncio.ensure_future(run(spec)) for spec in queries]
+    pending = set(tasks)
+    hits = 0
+    while pending and hits < enough_results:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        hits += sum(_hit_count(task.result()) for task in done)
+    for task in pending:
+        task.cancel()
+    
+    return {
+        "total_searches": len(tasks),
+        "total_hits": hits,
+        "results": [
+            {"skipped": True} if task in pending else task.result()
+            for task in tasks
+        ]
+    }
+
+
 # ============================================================================
 # RESOURCE
 # ============================================================================
 
+# Statischer Inhalt: einmal beim Laden serialisieren statt bei jedem Abruf
+SEARCH_HELP = json.dumps({
+    "description": "Web Search MCP Server (DuckDuckGo)",
+    "tools": [
+        "web_search - Allgemeine Web-Suche",
+        "news_search - Aktuelle Nachrichten",
+        "image_search - Bilder suchen",
+        "video_search - Videos suchen",
+        "maps_search - Orte suchen",
+        "instant_answer - Schnelle Antworten",
+        "suggestions - Suchvorschläge",
+        "multi_search - Mehrere Suchen parallel"
+    ],
+    "regions": [
+        "de-de (Deutschland)",
+        "at-de (Österreich)",
+        "ch-de (Schweiz)",
+        "en-us (USA)",
+        "en-gb (UK)"
+    ]
+}, indent=2)
+
+
 @mcp.resource("search://help")
 def search_help() -> str:
     """Hilfe zu Web-Search-Tools."""
-    return json.dumps({
-        "description": "Web Search MCP Server (DuckDuckGo)",
-        "tools": [
-            "web_search - Allgemeine Web-Suche",
-            "news_search - Aktuelle Nachrichten",
-            "image_search - Bilder suchen",
-            "video_search - Videos suchen",
-            "maps_search - Orte suchen",
-            "instant_answer - Schnelle Antworten",
-            "suggestions - Suchvorschläge"
-        ],
-        "regions": [
-            "de-de (Deutschland)",
-            "at-de (Österreich)",
-            "ch-de (Schweiz)",
-            "en-us (USA)",
-            "en-gb (UK)"
-        ]
-    }, indent=2)
+    return SEARCH_HELP
 
 
 if __name__ == "__main__":
@@ -3,6 +3,10 @@
 
 import json
 import os
+import shutil
+
+# Ziel-Datei, einmal beim Import aufgelöst
+MCP_JSON_PATH = os.path.expandvars(r"%APPDATA%\Code\User\mcp.json")
 
 mcp_config = {
     "servers": {
@@ -79,20 +83,21 @@ mcp_config = {
 }
 
 if __name__ == "__main__":
-    path = os.path.expandvars(r"%APPDATA%\Code\User\mcp.json")
+    path = MCP_JSON_PATH
     
-    # Backup erstellen
-    if os.path.exists(path):
-        backup = path + ".backup"
-        with open(path, 'r', encoding='utf-8') as f:
-            old = f.read()
-        with open(backup, 'w', encoding='utf-8') as f:
-            f.write(old)
+    # Backup erstellen (Kopie auf OS-Ebene, inkl. Zeitstempel) - ohne vorheriges exists()
+    backup = path + ".backup"
+    try:
+        shutil.copy2(path, backup)
         print(f"📦 Backup erstellt: {backup}")
+    except FileNotFoundError:
+        pass
     
-    # Neue Config schreiben
-    with open(path, 'w', encoding='utf-8') as f:
+    # Neue Config in Temp-Datei schreiben und atomar ersetzen (kein halb geschriebenes mcp.json)
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
         json.dump(mcp_config, f, indent=4)
+    os.replace(tmp, path)
     
     print(f"✅ mcp.json aktualisiert: {path}")
     print(f"📊 Server: {len(mcp_config['servers'])} (statt ~25)")